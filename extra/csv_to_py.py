@@ -5,6 +5,16 @@ from __future__ import print_function
 import csv
 import sys
 
+
+def fixup_arg(arg):
+    """Convert page_parse.py argument templates to %-style format strings."""
+    arg = arg.replace('{m}', '%(m)d')
+    arg = arg.replace('{n}', '%(n)d')
+    arg = arg.replace('{disp:x}', '%(disp)X')
+    arg = arg.replace('{imm:x}', '%(imm)X')
+    return arg
+
+
 c = csv.reader(sys.stdin)
 block = """    {{
         'opmask': (0x{opcode:04X}, 0x{opmask:04X}),
@@ -14,25 +24,18 @@ block = """    {{
         'disp': 0x{disp:04X},
         'bits': '{bits}',
         'cmd': '{cmd}',
-        'args': {args},
+        'args': ('{arg1}', '{arg2}'),
     }},"""
 
-opcodes = []
-print("""#!/usr/bin/env python
+print("""# pylint: disable=too-many-lines
+\"\"\"SH2 Opcodes.\"\"\"
 
-opcodes = (""")
+OPCODES = (""")
 for row in c:
-    if row[11] == '':
-        args = 'None'
-    elif row[12] == '':
-        args = "('{0}', ),".format(row[11])
-    else:
-        args = "('{0}', '{1}'),".format(row[11], row[12])
-
     print(block.format(opcode=int(row[0], 16), opmask=int(row[1], 16),
                        m=int(row[2], 16), mmask=int(row[3], 16),
                        n=int(row[4], 16), nmask=int(row[5], 16),
                        imm=int(row[6], 16), immmask=int(row[7], 16),
                        disp=int(row[8], 16), bits=row[9], cmd=row[10],
-                       args=args))
+                       arg1=fixup_arg(row[11]), arg2=fixup_arg(row[12])))
 print(')')
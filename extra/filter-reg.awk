@@ -1,15 +1,11 @@
 BEGIN {
-    print "registers = {";
+    print "REGISTERS = (";
 }
 
 ! /^v_/ {
-    print "    " $2 ": {";
-    print "        'name': '" $1 "',";
-    print "        'size': " $3 ",";
-    print "        'comment': '" substr($4, 0, length($4)-1) "',";
-    print "    },";
+    print "    (" $2 ", " $3 ", '" $1 "', '" substr($4, 0, length($4)-1) "'),";
 }
 
 END {
-    print "}";
+    print ")";
 }
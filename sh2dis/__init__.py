@@ -2,11 +2,12 @@
 
 from __future__ import print_function
 
+from . import analysis
 from . import mitsubishi
+from . import pipeline
 from . import segment
 from . import sh2
-from . import sh7052
-from . import sh7055
+from .analysis import Analysis, analyze
 
 
 __author__ = 'Ed Marshall'
@@ -1,149 +1,17 @@
 from __future__ import print_function
 
 import argparse
+import json
 import sys
 
-from . import mitsubishi
-from . import segment
-from . import sh2
-from . import sh7052
-from . import sh7055
-
-
-OUTPUT_SEPARATOR = '         ! ' + '-' * 60
-
-
-class ROMError(Exception):
-    """An error related to parsing the supplied ROM data."""
-
-
-def get_segments(phys):
-    """Determine if this is an Evo VIII (7052) or IX (7055) ROM."""
-    if len(phys) == 0x40000:
-        # SH/7052F
-        return sh7052, (
-            ('ROM', 0x0, len(phys), phys),
-            ('RAM', 0xFFFF8000, 0xFFFFB000, None),
-            ('REG', 0xFFFFE400, 0xFFFFF860, None),
-        )
-    if len(phys) == 0x80000:
-        # SH/7055F
-        return sh7055, (
-            ('ROM', 0x0, len(phys), phys),
-            ('RAM', 0xFFFF6000, 0xFFFFE000, None),
-            ('REG', 0xFFFFE400, 0xFFFFF860, None),
-        )
-    raise ROMError('invalid or unrecognized ROM')
-
-
-def setup_vectors(model):
-    """Pre-define the vector table."""
-    for i in range(0x0, 0x400, 0x4):
-        label = None
-        comment = None
-        kind = sh2.LongField
-        if i in model.processor.VECTORS:
-            vec = model.processor.VECTORS[i]
-            label = vec['name']
-            comment = vec['comment']
-            if vec['size'] == 1:
-                kind = sh2.ByteField
-            elif vec['size'] == 2:
-                kind = sh2.WordField
-        vector = kind(location=i, model=model, comment=comment)
-        model.set_location(vector)
-        model.set_label(i, label)
-        if label is not None and label.startswith('v_'):
-            targetlabel = model.get_label(vector.extra)
-            if targetlabel is None or targetlabel.startswith('unk_'):
-                model.set_label(vector.extra, label[2:])
-
-    for addr, vec in list(model.processor.REGISTERS.items()):
-        kind = sh2.LongField
-        if vec['size'] == 1:
-            kind = sh2.ByteField
-        elif vec['size'] == 2:
-            kind = sh2.WordField
-        meta = kind(location=addr, model=model, comment=vec['comment'])
-        model.set_location(meta)
-        model.set_label(addr, vec['name'])
-
-
-def disassemble_vectors(model, callback=None):
-    """Disassemble the locations referenced by the vector table."""
-    vectors = []
-    for i in range(0x0, 0x400, 0x4):
-        meta = model.get_location(i)
-        try:
-            # Make sure this is a real address (ie. not a stack pointer)
-            model.get_phys(meta.extra)
-        except segment.SegmentError:
-            continue
-        vectors.append((meta.extra, meta.location))
-    sh2.disassemble(vectors, model, callback)
-
-
-def scan_free_space(model):
-    """Scan for contiguous blocks of 0xFF, replace with NullField."""
-    for start, end in model.get_phys_ranges():
-        countdown = 0
-        ff_seen = 0
-        for i in range(start, end):
-            if countdown > 0:
-                countdown -= 1
-                continue
-            meta = model.get_location(i)
-            if meta is None and model.get_phys(i, 1) == chr(0xFF):
-                ff_seen += 1
-            else:
-                if ff_seen > 0x1FF:
-                    null = sh2.NullField(location=(i - ff_seen), width=ff_seen,
-                                         model=model)
-                    model.set_location(null)
-                ff_seen = 0
-                if meta is not None:
-                    countdown = meta.width - 1
-
-
-def final_output(model, outfile, ranges):
-    """Produce a moderately-useful disassembly output."""
-    countdown = 0
-    in_code = False
-    for start, end in ranges:
-        for i in range(start, end):
-            if countdown > 0:
-                countdown -= 1
-                continue
-
-            meta = model.get_location(i)
-
-            if in_code:
-                if isinstance(meta, sh2.CodeField):
-                    # Use RTS to denote code separation.
-                    rts = model.get_location(i - 4)
-                    if (isinstance(rts, sh2.CodeField) and
-                            rts.extra.opcode['cmd'] == 'rts'):
-                        print(OUTPUT_SEPARATOR, file=outfile)
-                else:
-                    # The code block just ended.
-                    in_code = False
-                    print(OUTPUT_SEPARATOR, file=outfile)
-            elif isinstance(meta, sh2.CodeField):
-                # We just started a new code block.
-                in_code = True
-                print(OUTPUT_SEPARATOR, file=outfile)
-
-            if meta is None:
-                # Create this as a throwaway byte, to save memory.
-                meta = sh2.ByteField(location=i, model=model,
-                                     unknown_prefix='unk')
-
-            countdown = meta.width - 1
-            out = str(meta)
-            if isinstance(meta, sh2.NullField):
-                out = "%s\n%s\n%s" % (OUTPUT_SEPARATOR, out, OUTPUT_SEPARATOR)
-            if out:
-                print(out, file=outfile)
+from . import batch
+from . import cache
+from . import project
+from . import stats
+from .pipeline import (  # pylint: disable=unused-import
+    OUTPUT_SEPARATOR, ROMError, build_model, disassemble_vectors,
+    final_output, get_segments, map_rom, output_ranges, render,
+    scan_free_space, setup_vectors)
 
 
 def main():
@@ -159,25 +27,95 @@ def main():
     parser.add_argument(
         '-r', '--ram', action='store_true',
         help='include RAM addresses in output')
-    parser.add_argument('rom', type=argparse.FileType('rb'), default=sys.stdout)
+    parser.add_argument(
+        '-p', '--predecode', action='store_true',
+        help='decode the whole ROM up front (requires numpy)')
+    parser.add_argument(
+        '-d', '--dataflow', action='store_true',
+        help='carry register values across branches to resolve more calls')
+    parser.add_argument(
+        '-c', '--cache', action='store_true',
+        help='reuse (or store) the analysis of an unchanged ROM')
+    parser.add_argument(
+        '--cache-dir', metavar='DIR',
+        help='where cached analyses live (implies --cache)')
+    parser.add_argument(
+        '-s', '--save', metavar='PROJECT',
+        help='save the finished analysis as a project file')
+    parser.add_argument(
+        '-l', '--load', metavar='PROJECT',
+        help='render a saved project instead of analysing a ROM')
+    parser.add_argument(
+        '-b', '--batch', metavar='DIR',
+        help='disassemble every ROM in DIR, one listing per ROM')
+    parser.add_argument(
+        '-j', '--jobs', type=int, default=None,
+        help='number of worker processes for --batch (default: all CPUs), '
+        'or to share the vector table between for a single ROM (plain '
+        'runs only; -m and --dataflow runs stay in one process)')
+    parser.add_argument(
+        '--stats', action='store_true',
+        help='report stage timings and analysis counters as JSON on '
+        'standard error')
+    parser.add_argument(
+        '--profile', action='store_true',
+        help='like --stats, but also time decoding, register tracking, '
+        'item placement and the Mitsubishi callback (slows the run down)')
+    parser.add_argument(
+        '--pattern', default='*.bin',
+        help='filename pattern for ROMs in --batch (default: *.bin)')
+    parser.add_argument(
+        '--output-dir', metavar='DIR',
+        help='where --batch writes listings (default: next to each ROM)')
+    parser.add_argument('rom', type=argparse.FileType('rb'), nargs='?')
     args = parser.parse_args()
 
-    processor, segments = get_segments(args.rom.read())
-    model = segment.MemoryModel(processor, segments)
-    setup_vectors(model)
-    disassemble_vectors(model, mitsubishi.callback if args.mitsu else None)
-    if args.mitsu:
-        mitsubishi.fixups(model)
-    scan_free_space(model)
-
-    ranges = []
-    if args.ram:
-        for seg in model.segments:
-            ranges.append((seg.start, seg.end))
+    cache_dir = args.cache_dir
+    if args.cache and cache_dir is None:
+        cache_dir = cache.default_cache_dir()
+
+    if args.batch is not None:
+        if args.stats or args.profile:
+            parser.error('--stats and --profile report on a single ROM, '
+                         'not --batch')
+        roms = batch.find_roms(args.batch, args.pattern)
+        failed = batch.run_batch(roms, output_dir=args.output_dir,
+                                 jobs=args.jobs, mitsu=args.mitsu,
+                                 ram=args.ram, predecode=args.predecode,
+                                 dataflow=args.dataflow, cache_dir=cache_dir)
+        sys.exit(1 if failed else 0)
+    if args.load is None and args.rom is None:
+        parser.error('a ROM file (or --batch DIR) is required')
+    if not (args.stats or args.profile):
+        process(args, cache_dir)
+        return
+    with stats.collect(profile=args.profile) as collected:
+        process(args, cache_dir)
+    json.dump(collected.report(), sys.stderr, indent=2, sort_keys=True)
+    sys.stderr.write('\n')
+
+
+def process(args, cache_dir):
+    """Analyse (or load) a single ROM and write its listing."""
+    if args.load is not None:
+        phys = map_rom(args.rom) if args.rom is not None else None
+        with stats.stage('load'):
+            model = project.load(args.load, phys)
+    elif cache_dir is not None:
+        phys = map_rom(args.rom)
+        model = cache.cached_model(phys, cache_dir, mitsu=args.mitsu,
+                                   predecode=args.predecode,
+                                   dataflow=args.dataflow, jobs=args.jobs)
     else:
-        ranges = model.get_phys_ranges()
-
-    final_output(model, args.output, ranges)
+        model = build_model(map_rom(args.rom), mitsu=args.mitsu,
+                            predecode=args.predecode, dataflow=args.dataflow,
+                            jobs=args.jobs)
+    stats.watch(model)
+    if args.save is not None:
+        with stats.stage('save'):
+            project.save(model, args.save)
+    with stats.stage('final_output'):
+        final_output(model, args.output, output_ranges(model, args.ram))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,174 @@
+"""A queryable view of a finished analysis, for use as a library.
+
+    import sh2dis
+    with open('rom.bin', 'rb') as romfile:
+        result = sh2dis.analyze(romfile.read())
+    for function in result.functions():
+        print('%08X %s' % (function.location, function.label))
+    print(result.item_at(0x1234).get_instruction())
+
+Items are the memory model's own objects (CodeFields, ByteFields and so
+on), so nothing needs to be re-parsed from a rendered listing.
+"""
+
+from __future__ import print_function
+
+from collections import namedtuple
+
+import bisect
+
+from . import cfg
+from . import mitsubishi
+from . import patterns
+from . import pipeline
+from . import sh2
+
+
+# A subroutine: where it starts, its label, and where it is called (or, for
+# vector table entries, referenced) from.
+Function = namedtuple('Function', 'location label callers')
+
+# A Mitsubishi axis: where it is, the address its result is written to, the
+# address of the value looked up, and its length points starting at data.
+Axis = namedtuple('Axis', 'location result source length data')
+
+
+class Analysis(object):
+    """The items, labels, references and tables found in a ROM."""
+
+    def __init__(self, model):
+        object.__init__(self)
+        self.model = model
+        self._functions = None
+        self._sources = None
+
+    @property
+    def processor(self):
+        """The name of the processor the ROM was identified as."""
+        return self.model.processor.__name__.rsplit('.', 1)[-1]
+
+    def items(self, start=None, end=None):
+        """Yield every defined item in ROM (or a given range) in order."""
+        for seg in self.model.segments:
+            if seg.phys is None and start is None:
+                continue
+            first = seg.start if start is None else max(start, seg.start)
+            last = seg.end if end is None else min(end, seg.end)
+            if first < last:
+                for meta in seg.iter_locations(first, last):
+                    yield meta
+
+    def code(self, start=None, end=None):
+        """Yield every instruction, as CodeFields."""
+        for meta in self.items(start, end):
+            if isinstance(meta, sh2.CodeField):
+                yield meta
+
+    def data(self, start=None, end=None):
+        """Yield every data item (table cells included)."""
+        for meta in self.items(start, end):
+            if not isinstance(meta, sh2.CodeField):
+                yield meta
+
+    def item_at(self, location):
+        """Return the item covering a location, or None."""
+        return self.model.get_location(location)
+
+    def label(self, location):
+        """Return the label for a location, or None."""
+        return self.model.get_label(location)
+
+    def labels(self):
+        """Yield (location, label) for every explicitly named location."""
+        for seg in self.model.segments:
+            for location, label in seg.iter_labels():
+                yield location, label
+
+    def xrefs(self):
+        """Yield (location, sources) for every referenced location."""
+        for seg in self.model.segments:
+            for location, sources in seg.iter_references():
+                yield location, sources
+
+    def references_to(self, location):
+        """Return the sorted locations referring to a location."""
+        return self.model.get_references(location)
+
+    def references_from(self, location):
+        """Return the sorted locations a location refers to."""
+        if self._sources is None:
+            self._sources = {}
+            for target, sources in self.xrefs():
+                for source in sources:
+                    self._sources.setdefault(source, []).append(target)
+        return sorted(self._sources.get(location, ()))
+
+    def _find_functions(self):
+        callers = {}
+        for target, vector in pipeline.vector_roots(self.model):
+            callers.setdefault(target, []).append(vector)
+        for code in self.code():
+            target = code.extra.args.get('target')
+            if target is not None and code.extra.opcode.cmd in cfg.CALLS:
+                callers.setdefault(target, []).append(code.location)
+        self._functions = [
+            Function(location, self.model.get_label(location),
+                     sorted(callers[location]))
+            for location in sorted(callers)]
+
+    def functions(self):
+        """Yield every subroutine entry point found, in address order.
+
+        These are the targets of calls and of the vector table.
+        """
+        if self._functions is None:
+            self._find_functions()
+        return iter(self._functions)
+
+    def function(self, location):
+        """Return the Function starting at a location, or None."""
+        if self._functions is None:
+            self._find_functions()
+        i = bisect.bisect_left(self._functions, (location, ))
+        if i < len(self._functions) and (
+                self._functions[i].location == location):
+            return self._functions[i]
+        return None
+
+    def tables(self):
+        """Yield each Mitsubishi table found, as Tables, in order."""
+        tables = mitsubishi.get_tables(self.model)
+        for location in sorted(tables):
+            yield tables[location]
+
+    def table(self, location):
+        """Return the Mitsubishi Table at a location, or None."""
+        return mitsubishi.get_tables(self.model).get(location)
+
+    def axes(self):
+        """Yield each Mitsubishi axis found, as Axes, in order."""
+        for location in sorted(mitsubishi.get_axes(self.model).values()):
+            yield Axis(location, self.model.get_location(location).extra,
+                       self.model.get_location(location + 4).extra,
+                       self.model.get_location(location + 8).extra,
+                       location + 10)
+
+    def find(self, pattern, start=None, end=None):
+        """Return where an instruction sequence matches; see patterns."""
+        return patterns.search(self.model, pattern, start, end)
+
+    def control_flow_graph(self):
+        """Return the control flow graph of all code found."""
+        return cfg.build(self.model)
+
+    def render(self, outfile=None, ram=False):
+        """Write the usual listing (to standard output by default)."""
+        pipeline.final_output(self.model, outfile,
+                              pipeline.output_ranges(self.model, ram))
+
+
+def analyze(rom, mitsu=True, predecode=False, dataflow=False, jobs=None):
+    """Analyse a ROM image (bytes, or anything buffer-like); see Analysis."""
+    return Analysis(pipeline.build_model(rom, mitsu=mitsu,
+                                         predecode=predecode,
+                                         dataflow=dataflow, jobs=jobs))
@@ -0,0 +1,101 @@
+"""Disassemble whole directories of ROMs across a pool of processes."""
+
+from __future__ import print_function
+
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+import fnmatch
+import multiprocessing
+import os
+import sys
+import time
+
+from . import cache
+from . import pipeline
+from . import sh2
+
+
+def find_roms(directory, pattern='*.bin'):
+    """Return the sorted paths of ROM images in a directory."""
+    paths = []
+    for name in sorted(os.listdir(directory)):
+        path = os.path.join(directory, name)
+        if os.path.isfile(path) and fnmatch.fnmatch(name, pattern):
+            paths.append(path)
+    return paths
+
+
+def output_path(rom, output_dir=None):
+    """Return where the listing for a given ROM should be written."""
+    name = os.path.splitext(os.path.basename(rom))[0] + '.asm'
+    return os.path.join(output_dir or os.path.dirname(rom), name)
+
+
+def init_worker():
+    """Build the per-process tables once, before any ROM is handled."""
+    sh2.decode_table()
+
+
+def process_rom(job):
+    """Disassemble a single ROM; returns (rom, error, seconds, warnings)."""
+    rom, destination, mitsu, ram, predecode, dataflow, cache_dir = job
+    started = time.time()
+    # Traversal warnings are printed; keep each ROM's together.
+    stdout = sys.stdout
+    sys.stdout = warnings = StringIO()
+    try:
+        with open(rom, 'rb') as romfile:
+            phys = pipeline.map_rom(romfile)
+        if cache_dir is not None:
+            model = cache.cached_model(phys, cache_dir, mitsu=mitsu,
+                                       predecode=predecode,
+                                       dataflow=dataflow)
+        else:
+            model = pipeline.build_model(phys, mitsu=mitsu,
+                                         predecode=predecode,
+                                         dataflow=dataflow)
+        with open(destination, 'w') as outfile:
+            pipeline.final_output(model, outfile,
+                                  pipeline.output_ranges(model, ram))
+        error = None
+    except Exception as exc:  # pylint: disable=broad-except
+        error = '%s: %s' % (exc.__class__.__name__, exc)
+    finally:
+        sys.stdout = stdout
+    return rom, error, time.time() - started, warnings.getvalue()
+
+
+def run_batch(roms, output_dir=None, jobs=None, mitsu=False, ram=False,
+              predecode=False, dataflow=False, cache_dir=None,
+              report=sys.stderr):
+    """Disassemble many ROMs in worker processes, then summarize.
+
+    Workers live for the whole batch, so opcode and processor tables are
+    built once per worker rather than once per ROM. Returns the number of
+    ROMs that failed.
+    """
+    work = [(rom, output_path(rom, output_dir), mitsu, ram, predecode,
+             dataflow, cache_dir) for rom in roms]
+    started = time.time()
+    failed = 0
+    pool = multiprocessing.Pool(jobs, initializer=init_worker)
+    try:
+        for rom, error, seconds, warnings in pool.imap_unordered(process_rom,
+                                                                 work):
+            for line in warnings.splitlines():
+                print('%s: %s' % (rom, line), file=report)
+            if error is None:
+                print('%s: ok (%.2fs)' % (rom, seconds), file=report)
+            else:
+                failed += 1
+                print('%s: FAILED (%s)' % (rom, error), file=report)
+    finally:
+        pool.close()
+        pool.join()
+    print('%d ROMs, %d ok, %d failed in %.2fs' % (
+        len(work), len(work) - failed, failed, time.time() - started),
+          file=report)
+    return failed
@@ -0,0 +1,224 @@
+"""Time each pipeline stage over synthetic ROMs.
+
+Run with `python -m sh2dis.benchmark`. Each ROM size is analysed a few
+times and the best time for every stage is kept; peak memory comes from a
+separate, traced run so the tracing doesn't skew the timings. Results can
+be saved as JSON and later compared against, to catch regressions.
+"""
+
+from __future__ import print_function
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+import argparse
+import json
+import os
+import sys
+
+from . import pipeline
+from . import sh2
+from . import stats
+from . import synthetic
+
+
+# The stages build_model() reports to stats, then rendering.
+STAGES = ('setup_vectors', 'disassemble_vectors', 'fixups', 'post_analysis',
+          'compact_references', 'final_output')
+
+SIZES = (0x40000, 0x80000)
+
+# Slowdowns of fewer seconds than this are timer noise, however large they
+# are relative to a short stage.
+MIN_SLOWDOWN = 0.005
+
+
+def run_pipeline(phys, timings=None):
+    """Analyse and render a ROM, adding each stage's time to timings.
+
+    The analysis is build_model() itself, timed stage by stage through
+    stats, so the stages measured are always the ones the pipeline runs.
+    Returns the model.
+    """
+    if timings is None:
+        timings = {}
+    with stats.collect() as run:
+        model = pipeline.build_model(phys, mitsu=True)
+        with stats.stage('final_output'):
+            with open(os.devnull, 'w') as outfile:
+                pipeline.final_output(model, outfile,
+                                      pipeline.output_ranges(model))
+    for name, seconds in run.stages.items():
+        timings[name] = timings.get(name, 0.0) + seconds
+    return model
+
+
+def count_code(model):
+    """Return how many instructions a model holds."""
+    return sum(1 for seg in model.segments
+               for meta in seg.iter_locations(seg.start, seg.end)
+               if isinstance(meta, sh2.CodeField))
+
+
+def peak_memory(phys):
+    """Return the peak bytes allocated by one traced run, or None."""
+    if tracemalloc is None:
+        return None
+    tracemalloc.start()
+    try:
+        run_pipeline(phys)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def max_rss():
+    """Return this process's peak resident set size in bytes, or None."""
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes; macOS reports bytes.
+    return rss if sys.platform == 'darwin' else rss * 1024
+
+
+def benchmark(size, seed=1, repeat=3, memory=True):
+    """Benchmark one synthetic ROM; returns a dict of results."""
+    phys = synthetic.build_rom(size, seed)
+    best = None
+    for _ in range(repeat):
+        timings = {}
+        model = run_pipeline(phys, timings)
+        if best is None:
+            best = timings
+        else:
+            best = dict((name, min(best[name], timings[name]))
+                        for name in STAGES)
+    total = sum(best.values())
+    instructions = count_code(model)
+    return {
+        'size': size,
+        'seed': seed,
+        'stages': best,
+        'total': total,
+        'instructions': instructions,
+        'bytes_per_second': size / total,
+        'instructions_per_second':
+            instructions / best['disassemble_vectors'],
+        'peak_memory': peak_memory(phys) if memory else None,
+    }
+
+
+def print_report(results, outfile=sys.stdout):
+    """Print a human-readable summary of benchmark results."""
+    for result in results:
+        print('ROM size %#x (seed %d), %d instructions' % (
+            result['size'], result['seed'], result['instructions']),
+              file=outfile)
+        for name in STAGES:
+            print('  %-20s %8.3fs' % (name, result['stages'][name]),
+                  file=outfile)
+        print('  %-20s %8.3fs  %.0f KB/s, %.0f instructions/s' % (
+            'total', result['total'], result['bytes_per_second'] / 1024,
+            result['instructions_per_second']), file=outfile)
+        if result['peak_memory'] is not None:
+            print('  %-20s %8.1f MB' % (
+                'peak traced memory', result['peak_memory'] / 1048576.0),
+                  file=outfile)
+
+
+def compare(results, baseline, tolerance, min_slowdown=MIN_SLOWDOWN):
+    """Return a description of each stage that regressed past tolerance.
+
+    A time only counts as a regression if it also grew by at least
+    min_slowdown seconds.
+    """
+    previous = dict((result['size'], result)
+                    for result in baseline['results'])
+    regressions = []
+    for result in results:
+        old = previous.get(result['size'])
+        if old is None:
+            continue
+        # Results saved before a stage existed have no time for it.
+        checks = [(name, result['stages'][name], old['stages'][name],
+                   min_slowdown)
+                  for name in STAGES if name in old['stages']]
+        checks.append(('total', result['total'], old['total'],
+                       min_slowdown))
+        if result['peak_memory'] and old['peak_memory']:
+            checks.append(('peak_memory', result['peak_memory'],
+                           old['peak_memory'], 0))
+        for name, new, before, floor in checks:
+            if (before and new > before * (1 + tolerance) and
+                    new - before >= floor):
+                regressions.append('%#x %s: %.3g -> %.3g (+%.0f%%)' % (
+                    result['size'], name, before, new,
+                    100.0 * (new - before) / before))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark the sh2dis pipeline on synthetic ROMs.')
+    parser.add_argument(
+        '--size', type=lambda value: int(value, 0), action='append',
+        choices=SIZES, help='ROM size to benchmark (repeatable; default: '
+        'both 0x40000 and 0x80000)')
+    parser.add_argument(
+        '--seed', type=int, default=1,
+        help='seed for the synthetic ROMs (default: 1)')
+    parser.add_argument(
+        '-n', '--repeat', type=int, default=3,
+        help='runs per ROM; the best time for each stage is kept '
+        '(default: 3)')
+    parser.add_argument(
+        '--no-memory', action='store_true',
+        help='skip the traced run that measures peak memory')
+    parser.add_argument(
+        '--json', metavar='FILE',
+        help='also write the results as JSON')
+    parser.add_argument(
+        '--compare', metavar='FILE',
+        help='compare against results saved with --json, exiting non-zero '
+        'on a regression')
+    parser.add_argument(
+        '--tolerance', type=float, default=0.2,
+        help='allowed slowdown for --compare, as a fraction (default: 0.2)')
+    parser.add_argument(
+        '--min-slowdown', type=float, default=MIN_SLOWDOWN,
+        help='slowdowns shorter than this many seconds are ignored by '
+        '--compare (default: %g)' % MIN_SLOWDOWN)
+    args = parser.parse_args()
+
+    sh2.decode_table()
+    results = [benchmark(size, args.seed, args.repeat, not args.no_memory)
+               for size in args.size or SIZES]
+    print_report(results)
+    rss = max_rss()
+    if rss is not None:
+        print('peak resident set size: %.1f MB' % (rss / 1048576.0))
+
+    if args.json is not None:
+        with open(args.json, 'w') as outfile:
+            json.dump({'results': results, 'max_rss': rss}, outfile,
+                      indent=2, sort_keys=True)
+    if args.compare is not None:
+        with open(args.compare) as infile:
+            baseline = json.load(infile)
+        regressions = compare(results, baseline, args.tolerance,
+                              args.min_slowdown)
+        for regression in regressions:
+            print('regression: %s' % regression, file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+"""Persistent cache of finished analyses, keyed by ROM content."""
+
+from __future__ import print_function
+
+import hashlib
+import os
+import sys
+import tempfile
+
+from . import __version__
+from . import pipeline
+from . import project
+
+
+# Bump whenever the shape of a cached analysis changes.
+CACHE_FORMAT = 3
+
+
+def default_cache_dir():
+    """Return the per-user cache directory."""
+    base = os.environ.get('XDG_CACHE_HOME')
+    if not base:
+        base = os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'sh2dis')
+
+
+def cache_key(phys, **options):
+    """Hash a ROM image together with everything that shapes its analysis."""
+    processor, _ = pipeline.get_segments(phys)
+    digest = hashlib.sha256()
+    digest.update(phys)
+    digest.update(repr((__version__, CACHE_FORMAT, processor.__name__,
+                        sorted(options.items()))).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def save(model, path):
+    """Write a model to a cache file, atomically."""
+    directory = os.path.dirname(path)
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+    handle, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    os.close(handle)
+    try:
+        # The ROM itself is the cache key, so it isn't stored again.
+        project.save(model, tmp_path, include_phys=False)
+        os.rename(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def load(path, phys):
+    """Read a model back from a cache file."""
+    return project.load(path, phys)
+
+
+def cached_model(phys, cache_dir=None, mitsu=False, predecode=False,
+                 dataflow=False, jobs=None):
+    """Return the analysed model for a ROM, from the cache when possible.
+
+    The cache key covers the ROM bytes, the sh2dis version, the processor
+    and any options that change the analysis, so output-only options (like
+    including RAM) and the number of worker processes, which only changes
+    how the analysis is run, reuse the same entry.
+    """
+    if cache_dir is None:
+        cache_dir = default_cache_dir()
+    key = cache_key(phys, mitsu=mitsu, dataflow=dataflow)
+    path = os.path.join(cache_dir, key + '.cache')
+    if os.path.exists(path):
+        try:
+            return load(path, phys)
+        except Exception as exc:  # pylint: disable=broad-except
+            print('ignoring unreadable cache entry %s: %s' % (path, exc),
+                  file=sys.stderr)
+
+    model = pipeline.build_model(phys, mitsu=mitsu, predecode=predecode,
+                                 dataflow=dataflow, jobs=jobs)
+    try:
+        save(model, path)
+    except EnvironmentError as exc:
+        print('unable to write cache entry %s: %s' % (path, exc),
+              file=sys.stderr)
+    return model
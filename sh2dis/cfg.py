@@ -0,0 +1,220 @@
+"""Basic blocks and the control flow graph between them.
+
+The graph is built from the CodeFields a disassembly left in a memory
+model. Blocks are kept as parallel arrays of start and end addresses, and
+their outgoing edges in compressed sparse row form, so even a large ROM's
+graph takes a few hundred kilobytes and any address can be mapped to its
+block by bisection.
+
+A delay slot always stays in its branch's block, even when something else
+branches to it or references it; such slots are recorded in the graph's
+slots array, and edges to them lead into the middle of that block.
+"""
+
+from __future__ import print_function
+
+import array
+import bisect
+
+from . import segment
+from . import sh2
+
+
+# Edge kinds.
+FALLTHROUGH = 0  # Execution runs on into the next block.
+CONDITIONAL = 1  # A bt/bf (or bt/s, bf/s) branch, when taken.
+DELAYED = 2      # An unconditional branch, taken after its delay slot.
+CALL = 3         # A subroutine call.
+RETURN = 4       # Where a subroutine call comes back to.
+
+EDGE_KINDS = ('fallthrough', 'conditional', 'delayed', 'call', 'return')
+
+# Conditional branches without a delay slot.
+UNDELAYED_CONDITIONALS = ('bt', 'bf')
+
+# Conditional branches with a delay slot.
+DELAYED_CONDITIONALS = ('bt/s', 'bf/s')
+
+# Subroutine calls; all have a delay slot.
+CALLS = ('bsr', 'bsrf', 'jsr')
+
+# Returns; these have no successors.
+RETURNS = ('rts', 'rte')
+
+
+def ends_block(opcode):
+    """Return how many instructions after this one its block ends.
+
+    None means the instruction doesn't end a block; 0 means it is the last
+    of its block, 1 means its delay slot is.
+    """
+    cmd = opcode.cmd
+    if cmd in UNDELAYED_CONDITIONALS:
+        return 0
+    if (opcode.is_delayed or opcode.is_label_branch or
+            opcode.is_register_branch):
+        return 1
+    return None
+
+
+def block_edges(branch, end, code_follows):
+    """Return the (kind, target) edges for a block ending in branch.
+
+    branch is the block's branching CodeField, if it has one; end is the
+    address just past the block.
+    """
+    edges = []
+    if branch is not None:
+        cmd = branch.extra.opcode.cmd
+        target = branch.extra.args.get('target')
+        if cmd in RETURNS:
+            return edges
+        if cmd in UNDELAYED_CONDITIONALS or cmd in DELAYED_CONDITIONALS:
+            if target is not None:
+                edges.append((CONDITIONAL, target))
+        elif cmd in CALLS:
+            if target is not None:
+                edges.append((CALL, target))
+            if code_follows:
+                edges.append((RETURN, end))
+            return edges
+        else:
+            if target is not None:
+                edges.append((DELAYED, target))
+            return edges
+    if code_follows:
+        edges.append((FALLTHROUGH, end))
+    return edges
+
+
+def mapped_edges(model, edges):
+    """Drop the edges whose targets lie outside every segment.
+
+    A branch near either end of the address space can compute a target
+    that isn't an address at all (a bra backwards from 0, say).
+    """
+    mapped = []
+    for kind, target in edges:
+        try:
+            model.get_segment(target)
+        except segment.SegmentError:
+            continue
+        mapped.append((kind, target))
+    return mapped
+
+
+class ControlFlowGraph(object):
+    """Basic blocks and the typed edges between them."""
+
+    def __init__(self):
+        object.__init__(self)
+        self.starts = array.array('I')
+        self.ends = array.array('I')
+        self.edge_offsets = array.array('I', [0])
+        self.edge_targets = array.array('I')
+        self.edge_kinds = array.array('B')
+        # Delay slots referenced from elsewhere, in address order.
+        self.slots = array.array('I')
+        self._predecessors = None
+
+    def __len__(self):
+        return len(self.starts)
+
+    def add_block(self, start, end, edges):
+        """Append a block; blocks must be added in address order."""
+        self.starts.append(start)
+        self.ends.append(end)
+        for kind, target in edges:
+            self.edge_kinds.append(kind)
+            self.edge_targets.append(target)
+        self.edge_offsets.append(len(self.edge_targets))
+        self._predecessors = None
+
+    def add_slot(self, location):
+        """Record a delay slot that is referenced from elsewhere."""
+        self.slots.append(location)
+
+    def entered_slot(self, location):
+        """Return whether a location is a delay slot referenced elsewhere."""
+        i = bisect.bisect_left(self.slots, location)
+        return i < len(self.slots) and self.slots[i] == location
+
+    def block_at(self, location):
+        """Return the index of the block containing a location, or None."""
+        i = bisect.bisect_right(self.starts, location) - 1
+        if i >= 0 and location < self.ends[i]:
+            return i
+        return None
+
+    def block(self, index):
+        """Return the (start, end) addresses of a block."""
+        return self.starts[index], self.ends[index]
+
+    def successors(self, index):
+        """Return the (kind, target address) edges leaving a block."""
+        first, last = self.edge_offsets[index], self.edge_offsets[index + 1]
+        return list(zip(self.edge_kinds[first:last],
+                        self.edge_targets[first:last]))
+
+    def predecessors(self, index):
+        """Return the (kind, block index) edges arriving at a block."""
+        if self._predecessors is None:
+            self._predecessors = {}
+            for source in range(len(self.starts)):
+                for kind, target in self.successors(source):
+                    dest = self.block_at(target)
+                    if dest is not None:
+                        self._predecessors.setdefault(dest, []).append(
+                            (kind, source))
+        return self._predecessors.get(index, [])
+
+    def instructions(self, model, index):
+        """Yield the CodeFields making up a block."""
+        location, end = self.block(index)
+        seg = model.get_segment(location)
+        while location < end:
+            code = seg.get_location(location)
+            yield code
+            location += code.width
+
+
+def build(model):
+    """Build the control flow graph for everything disassembled so far."""
+    graph = ControlFlowGraph()
+    for seg in model.segments:
+        referenced = set(location for location, _ in seg.iter_references())
+        block_start = None
+        branch = None
+        countdown = None
+        previous_end = None
+        for code in seg.iter_locations(seg.start, seg.end):
+            if not isinstance(code, sh2.CodeField):
+                continue
+            location = code.location
+            contiguous = location == previous_end
+            # A delay slot stays with its branch, however it is reached.
+            in_slot = contiguous and countdown == 0
+            if in_slot and location in referenced:
+                graph.add_slot(location)
+            if block_start is not None and (
+                    not contiguous or countdown == -1 or
+                    (location in referenced and not in_slot)):
+                graph.add_block(block_start, previous_end, mapped_edges(
+                    model, block_edges(branch, previous_end, contiguous)))
+                block_start = None
+            if block_start is None:
+                block_start = location
+                branch = None
+                countdown = None
+            if countdown is not None:
+                countdown -= 1
+            else:
+                countdown = ends_block(code.extra.opcode)
+                if countdown is not None:
+                    branch = code
+                    countdown -= 1
+            previous_end = location + code.width
+        if block_start is not None:
+            graph.add_block(block_start, previous_end, mapped_edges(
+                model, block_edges(branch, previous_end, False)))
+    return graph
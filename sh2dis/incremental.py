@@ -0,0 +1,149 @@
+"""Incremental re-analysis and re-rendering for interactive sessions.
+
+A Session watches a MemoryModel for changes. New entry points only walk the
+code they newly reach, and rendered lines are kept until something they
+were built from (an item, a label or a set of references at a given
+address) changes, so re-rendering after an edit only formats the lines that
+actually mention it.
+"""
+
+from __future__ import print_function
+
+from . import pipeline
+from . import segment
+from . import sh2
+
+
+class Session(object):
+    """A memory model being edited, with its rendered lines cached."""
+
+    def __init__(self, model, callback=None):
+        object.__init__(self)
+        self.model = model
+        self.callback = callback
+        # Item location -> the first entry point whose traversal defined it,
+        # until the item is changed some other way.
+        self.origins = {}
+        # Slot location -> rendered text.
+        self.lines = {}
+        # Address -> slot locations whose text was built from it.
+        self.depends = {}
+        self.rendered = 0
+        self._reads = None
+        self._created = None
+        model.observers.append(self._changed)
+
+    def close(self):
+        """Stop watching the model."""
+        self.model.observers.remove(self._changed)
+
+    def _changed(self, kind, location, width):
+        if kind == 'item':
+            if self._created is not None:
+                self._created.append(location)
+            else:
+                self.origins.pop(location, None)
+        self._invalidate(location, location + width)
+
+    def _invalidate(self, start, end):
+        depends = self.depends
+        if end - start <= len(depends):
+            addresses = range(start, end)
+        else:
+            addresses = [i for i in depends if start <= i < end]
+        for i in addresses:
+            for slot in depends.pop(i, ()):
+                self.lines.pop(slot, None)
+
+    def add_entry_point(self, location, reference=None, label=None):
+        """Disassemble from a new entry point.
+
+        Returns the sorted locations of the items the traversal defined.
+        Code that is already defined is never walked into by a branch, but
+        a traversal carries on to the end of its block, so the straight-line
+        code it runs into there is defined again and included, as is any
+        data the callback lays out again.
+        """
+        if label is not None:
+            self.model.set_label(location, label)
+        self._created = created = []
+        try:
+            sh2.disassemble([(location, reference)], self.model,
+                            self.callback)
+        finally:
+            self._created = None
+        # Items absorbed by wider ones later in the traversal are gone.
+        defined = []
+        for item in sorted(set(created)):
+            meta = self.model.get_segment(item).get_location(item)
+            if meta is not None and meta.location == item:
+                defined.append(item)
+                self.origins.setdefault(item, location)
+        return defined
+
+    def items_from(self, location):
+        """Return the item locations an entry point was first to define.
+
+        Items changed since in any other way are no longer included.
+        """
+        return sorted(item for item, origin in self.origins.items()
+                      if origin == location)
+
+    def set_label(self, location, label):
+        """Set (or with None, clear) the label for a location."""
+        self.model.set_label(location, label)
+
+    def set_location(self, value):
+        """Define an item, replacing any it covers."""
+        self.model.set_location(value)
+
+    def unset_location(self, location):
+        """Undefine the item at a location."""
+        self.model.unset_location(location)
+
+    def _read(self, kind, location):
+        reads = self._reads
+        reads.add(location)
+        if kind == 'label':
+            # A label can also come from the item covering the byte before.
+            reads.add(location - 1)
+            for i in (location, location - 1):
+                try:
+                    meta = self.model.get_segment(i).get_location(i)
+                except segment.SegmentError:
+                    continue
+                if meta is not None:
+                    reads.add(meta.location)
+                    break
+
+    def _text(self, seg, location, meta):
+        if location in self.lines:
+            return self.lines[location]
+        model = self.model
+        self._reads = reads = set((location, location - 1))
+        if meta is not None and meta.member_of is not None:
+            reads.update(member.location
+                         for member in meta.member_of.members)
+        model.readers.append(self._read)
+        try:
+            text = pipeline.render_slot(seg, location, meta)
+        finally:
+            model.readers.remove(self._read)
+            self._reads = None
+        self.rendered += 1
+        self.lines[location] = text
+        for i in reads:
+            self.depends.setdefault(i, set()).add(location)
+        return text
+
+    def render(self, ranges=None):
+        """Generate the output lines, reformatting only changed slots."""
+        if ranges is None:
+            ranges = pipeline.output_ranges(self.model)
+        return pipeline.render(self.model, ranges, self._text)
+
+    def final_output(self, outfile, ranges=None):
+        """Write the output, reformatting only changed slots."""
+        if ranges is None:
+            ranges = pipeline.output_ranges(self.model)
+        pipeline.final_output(self.model, outfile, ranges, text=self._text)
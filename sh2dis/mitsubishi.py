@@ -1,9 +1,38 @@
 """Mitsubishi-specific annotations."""
 
+from collections import namedtuple
+
+import weakref
+
+from . import passes
 from . import segment
 from . import sh2
 
 
+# A table found through one of the lookup functions. dimensions is 2 or 3,
+# width the size of each cell; yaxis and xaxis are the locations of its
+# axes (None if unknown or, for xaxis, absent), and the cells run from data
+# for length items.
+Table = namedtuple('Table', 'location dimensions width yaxis xaxis data '
+                   'length')
+
+# Axes found so far, per memory model: result address -> axis location.
+_AXES = weakref.WeakKeyDictionary()
+
+# Tables found so far, per memory model: location -> Table.
+_TABLES = weakref.WeakKeyDictionary()
+
+
+def get_axes(model):
+    """Return the axes found so far for a model."""
+    return _AXES.setdefault(model, {})
+
+
+def get_tables(model):
+    """Return the tables found so far for a model."""
+    return _TABLES.setdefault(model, {})
+
+
 def fixup_mova(meta, model):
     """Mitsubishi-specific MOVA-related fixups."""
     # Mitsu seems to love MOVA for jump tables.
@@ -90,6 +119,7 @@ def fixup_tables(meta, registers, model, axes):
         yaxis = sh2.LongField(location=(tbl_loc + (2 * tbl_width)),
                               model=model, comment='Y-Axis')
         yaxis_len = 0
+        yloc = None
         if yaxis.extra in axes:
             yloc = model.get_location(axes[yaxis.extra]).location
             yaxis.comment = 'Y-Axis: 0x%X' % yloc
@@ -100,13 +130,14 @@ def fixup_tables(meta, registers, model, axes):
         # X-axis?
         tbl_pos = 4 + (tbl_width * 2)
         xaxis_len = 1  # Always at least one row. :)
+        xaxis_loc = None
         if tbl.extra == 3:
             xaxis = sh2.LongField(location=(tbl_loc + tbl_pos),
                                   model=model, comment='X-Axis')
             xaxis_len = 0
             if xaxis.extra in axes:
                 xloc = model.get_location(axes[xaxis.extra])
-                xloc = xloc.location
+                xloc = xaxis_loc = xloc.location
                 xaxis.comment = 'X-Axis: 0x%X' % xloc
                 xaxis_len = model.get_location(axes[xaxis.extra] +
                                                8).extra
@@ -117,10 +148,11 @@ def fixup_tables(meta, registers, model, axes):
             model.set_location(rlen)
             tbl_pos += tbl_width
 
+        tbl_start = tbl_loc + tbl_pos
+        length = 0
         if yaxis_len > 0:
             cdata = segment.CompositeData(items_per_line=yaxis_len,
                                           model=model)
-            tbl_start = tbl_loc + tbl_pos
             tbl_end = tbl_start + (
                 yaxis_len * xaxis_len * tbl_width)
             for i in range(tbl_start, tbl_end, tbl_width):
@@ -136,6 +168,10 @@ def fixup_tables(meta, registers, model, axes):
                                  member_of=cdata)
                 model.set_location(tdata)
                 cdata.members.append(tdata)
+            length = len(cdata.members)
+        get_tables(model)[tbl_loc] = Table(tbl_loc, tbl.extra, tbl_width,
+                                           yloc, xaxis_loc, tbl_start,
+                                           length)
 
 
 def fixup_mut(meta, model):
@@ -153,9 +189,9 @@ def fixup_mut(meta, model):
     model.set_label(mut_loc, 'MUT_TABLE')
 
 
-def callback(meta, registers, model, axes={}):  # pylint: disable=dangerous-default-value
+def callback(meta, registers, model, axes=None):
     """Automatically generate tables and their axes, if possible."""
-    if meta.extra.opcode['cmd'] not in sh2.REGISTER_BRANCHERS:
+    if not meta.extra.opcode.is_register_branch:
         return
 
     # All axis/table lookups store the table location in R4.
@@ -163,6 +199,9 @@ def callback(meta, registers, model, axes={}):  # pylint: disable=dangerous-defa
     if reg is None or registers[4] is None:
         return
 
+    if axes is None:
+        axes = get_axes(model)
+
     # Axes
     if reg == 0xCC6:
         fixup_table_axes(meta, registers, model, axes)
@@ -172,44 +211,76 @@ def callback(meta, registers, model, axes={}):  # pylint: disable=dangerous-defa
         fixup_tables(meta, registers, model, axes)
 
 
+class MovaPass(passes.Pass):
+    """Annotate the jump tables MOVA instructions point at."""
+
+    opcodes = ('mova', )
+
+    def __init__(self):
+        object.__init__(self)
+        self.model = None
+
+    def begin(self, model, seg, start, end):
+        self.model = model
+
+    def visit(self, meta):
+        fixup_mova(meta, self.model)
+
+
+class MutPass(passes.Pass):
+    """Find and annotate the MUT table.
+
+    It is loaded right after a mov.w of 0xBF and a single shll2.
+    """
+
+    kinds = (sh2.CodeField, )
+
+    def __init__(self):
+        object.__init__(self)
+        self.model = None
+        self.movw_found = self.shll2_found = self.mut_found = False
+
+    def begin(self, model, seg, start, end):
+        self.model = model
+        self.movw_found = self.shll2_found = self.mut_found = False
+
+    def visit(self, meta):
+        cmd = meta.extra.opcode.cmd
+        if self.mut_found or cmd == 'mova':
+            return
+        if not self.movw_found and cmd == 'mov.w':
+            if meta.extra.args['target'] is not None:
+                target = self.model.get_location(meta.extra.args['target'])
+                if target is not None and target.extra == 0xBF:
+                    self.movw_found = True
+        elif self.movw_found and cmd == 'shll2':
+            if self.shll2_found:
+                self.movw_found = self.shll2_found = False
+            else:
+                self.shll2_found = True
+        elif self.movw_found and self.shll2_found:
+            if cmd == 'mov.l' and meta.extra.args['target'] is not None:
+                fixup_mut(meta, self.model)
+                self.mut_found = True
+            self.movw_found = self.shll2_found = False
+
+
+def scan_passes():
+    """Return the passes multiscan runs, for a combined sweep."""
+    return [MovaPass(), MutPass()]
+
+
 def multiscan(model):
     """Scan all physical ranges for multiple items (MOVA, MUT table)."""
-    for start, end in model.get_phys_ranges():
-        countdown = 0
-        movw_found = shll2_found = mut_found = False
-        for i in range(start, end):
-            if countdown > 0:
-                countdown -= 1
-                continue
-            meta = model.get_location(i)
-            if isinstance(meta, sh2.CodeField):
-                if meta.extra.opcode['cmd'] == 'mova':
-                    fixup_mova(meta, model)
-
-                elif not mut_found:
-                    if not movw_found and meta.extra.opcode['cmd'] == 'mov.w':
-                        if meta.extra.args['target'] is not None:
-                            target = model.get_location(
-                                meta.extra.args['target'])
-                            if target is not None and target.extra == 0xBF:
-                                movw_found = True
-                    elif movw_found and meta.extra.opcode['cmd'] == 'shll2':
-                        if shll2_found:
-                            movw_found = shll2_found = False
-                        else:
-                            shll2_found = True
-                    elif movw_found and shll2_found:
-                        if meta.extra.opcode['cmd'] == 'mov.l':
-                            if meta.extra.args['target'] is not None:
-                                fixup_mut(meta, model)
-                                mut_found = True
-                        movw_found = shll2_found = False
-            if meta is not None:
-                countdown = meta.width - 1
-
-
-def fixups(model):
-    """Mitsubishi-specific fixups."""
+    passes.sweep(model, scan_passes())
+
+
+def fixups(model, scan=True):
+    """Mitsubishi-specific fixups.
+
+    Without scan, multiscan is left for the caller to run, usually as part
+    of a combined sweep with scan_passes().
+    """
     # Name the init, sp, and reset vectors.
     meta = model.get_location(0)
     model.set_label(meta.extra, 'init')
@@ -264,4 +335,5 @@ def fixups(model):
     model.set_label(0xCC6, 'axis_lookup')
     model.set_label(0xE02, 'tbl_lookup_word')
 
-    multiscan(model)
+    if scan:
+        multiscan(model)
@@ -0,0 +1,213 @@
+"""Disassemble independent roots across a pool of worker processes.
+
+Each worker walks its share of the roots over a private memory model built
+from a read-only copy of the ROM, and hands back what it defined (items and
+references) along with any warnings it printed. Only plain traversals are
+shared out: a callback (the Mitsubishi one looks up axes other roots
+record) or dataflow carries state from one root to the next, so those run
+in this process without starting any workers.
+
+The results are only merged when doing so is guaranteed to give the same
+model as a single traversal of every root would: items defined by more
+than one worker must be identical in each, no two different items may
+overlap each other or anything already in the model, and no worker may
+have raised an error. Warnings are diagnostics, so they are printed again
+once the results are merged, share by share. Otherwise the roots are
+simply disassembled in this process instead, so the model always matches
+the single-process traversal.
+"""
+
+from __future__ import print_function
+
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+import multiprocessing
+import sys
+
+from . import processors
+from . import project
+from . import segment
+from . import sh2
+
+
+# Per-worker state: the processor, segment layout and model setup function.
+_WORKER = {}
+
+
+def init_worker(processor, segments, setup):
+    """Keep what a worker needs to rebuild the initial model."""
+    _WORKER['processor'] = processors.load(processor)
+    _WORKER['segments'] = segments
+    _WORKER['setup'] = setup
+
+
+def item_record(meta):
+    """Return a comparable, picklable description of an item."""
+    if isinstance(meta, sh2.CodeField):
+        extra = meta.extra.instruction
+        target = meta.extra.args['target']
+    else:
+        extra = meta.extra
+        target = None
+    group = None
+    if meta.member_of is not None:
+        group = (meta.member_of.items_per_line, meta.member_of.comment,
+                 meta.member_of.extra, meta.member_of.members[0].location)
+    return (project.KINDS.index(type(meta)), meta.location, meta.width,
+            extra, target, meta.comment, meta.unknown_prefix, group)
+
+
+def walk_roots(job):
+    """Disassemble some roots in a fresh model; return what was defined."""
+    roots, ordered = job
+    model = segment.MemoryModel(_WORKER['processor'], _WORKER['segments'])
+    if _WORKER['setup'] is not None:
+        _WORKER['setup'](model)
+    initial = [meta for seg in model.segments
+               for meta in seg.iter_locations(seg.start, seg.end)]
+
+    items = set()
+    xrefs = set()
+
+    def changed(kind, location, width):  # pylint: disable=unused-argument
+        if kind == 'item':
+            items.add(location)
+        elif kind == 'xref':
+            xrefs.add(location)
+    model.observers.append(changed)
+
+    stdout = sys.stdout
+    sys.stdout = warnings = StringIO()
+    try:
+        sh2.disassemble(roots, model, ordered=ordered)
+    except Exception as exc:  # pylint: disable=broad-except
+        return '%s: %s' % (exc.__class__.__name__, exc)
+    finally:
+        sys.stdout = stdout
+    for meta in initial:
+        if model.get_location(meta.location) is not meta:
+            return 'a predefined item at %#x was replaced' % meta.location
+
+    records = []
+    for location in sorted(items):
+        meta = model.get_location(location)
+        if meta is not None and meta.location == location:
+            records.append(item_record(meta))
+    references = [(location, model.get_references(location))
+                  for location in sorted(xrefs)]
+    return records, references, warnings.getvalue()
+
+
+def partition(roots, jobs):
+    """Split (location, reference) roots into up to jobs groups.
+
+    Every root for a given location lands in the same group, and each group
+    keeps the original order of its roots.
+    """
+    groups = {}
+    order = []
+    for location, _ in roots:
+        if location not in groups:
+            groups[location] = len(order) % jobs
+            order.append(location)
+    shares = [[] for _ in range(min(jobs, len(order)))]
+    for root in roots:
+        shares[groups[root[0]]].append(root)
+    return shares
+
+
+def check_results(model, results):
+    """Return why worker results can't be merged, or None if they can."""
+    for result in results:
+        if not isinstance(result, tuple):
+            return result
+
+    records = {}
+    for result in results:
+        for record in result[0]:
+            existing = records.setdefault(record[1], record)
+            if existing != record:
+                return 'workers disagree about %#x' % record[1]
+    end = None
+    for location in sorted(records):
+        if end is not None and location < end:
+            return 'items overlap at %#x' % location
+        end = location + records[location][2]
+        if (model.get_location(location) is not None or
+                model.get_location(end - 1) is not None):
+            return 'an item at %#x overlaps the model' % location
+    return None
+
+
+def merge(model, results):
+    """Add worker results to the model and print their warnings."""
+    records = {}
+    for result in results:
+        for record in result[0]:
+            records[record[1]] = record
+    groups = {}
+    for location in sorted(records):
+        kind, location, width, extra, target, comment, prefix, group = (
+            records[location])
+        member_of = None
+        if group is not None:
+            member_of = groups.get(group)
+            if member_of is None:
+                member_of = groups[group] = segment.CompositeData(
+                    items_per_line=group[0], model=model, comment=group[1],
+                    extra=group[2])
+        meta = project.restore_item(project.KINDS[kind], location, width,
+                                    model, extra, target, comment, prefix,
+                                    member_of)
+        model.set_location(meta)
+        if member_of is not None:
+            member_of.members.append(meta)
+
+    for result in results:
+        for location, references in result[1]:
+            for reference in references:
+                model.add_reference(location, reference)
+        sys.stdout.write(result[2])
+
+
+def disassemble(roots, model, jobs, callback=None, ordered=False,
+                dataflow=False, setup=None):
+    """Disassemble roots across jobs worker processes.
+
+    setup must prepare a fresh model the way this one was prepared before
+    the traversal (it has to be a module-level function, so workers can
+    receive it). Returns True if the worker results were used, or False if
+    the roots were disassembled serially instead.
+    """
+    reason = None
+    shares = partition(roots, jobs)
+    if dataflow:
+        reason = 'dataflow carries registers between roots'
+    elif callback is not None:
+        reason = 'the callback may share state between roots'
+    elif len(shares) < 2:
+        reason = 'nothing to share between workers'
+    if reason is None:
+        segments = [(seg.name, seg.start, seg.end,
+                     None if seg.phys is None else bytes(seg.phys))
+                    for seg in model.segments]
+        pool = multiprocessing.Pool(
+            len(shares), initializer=init_worker,
+            initargs=(model.processor.__name__, segments, setup))
+        try:
+            results = pool.map(walk_roots,
+                               [(share, ordered) for share in shares])
+        finally:
+            pool.close()
+            pool.join()
+        reason = check_results(model, results)
+        if reason is None:
+            merge(model, results)
+            return True
+    print('disassembling serially: %s' % reason, file=sys.stderr)
+    sh2.disassemble(roots, model, callback, ordered=ordered,
+                    dataflow=dataflow)
+    return False
@@ -0,0 +1,133 @@
+"""Post-analysis passes, run together in a single sweep over the items.
+
+Each pass says which items it wants to see: instances of some item types,
+CodeFields for some instructions, and/or the undefined gaps between items.
+sweep() walks every physical range once, in address order, and hands each
+item to the passes interested in it, in the order the passes were given.
+
+Passes may define new items as they go. Items are looked up afresh at each
+step, so new items ahead of the sweep are visited too; anything a pass
+builds from the whole range (free space, say) should be committed from
+finish(), once every other pass is done.
+"""
+
+from __future__ import print_function
+
+import re
+
+from . import sh2
+
+
+class Pass(object):
+    """A post-analysis pass; subclasses override what they need."""
+
+    # Item types whose instances are passed to visit().
+    kinds = ()
+    # Instruction mnemonics whose CodeFields are passed to visit().
+    opcodes = ()
+    # Whether undefined gaps between items are passed to gap().
+    gaps = False
+
+    def begin(self, model, seg, start, end):
+        """Called before each range is swept."""
+
+    def visit(self, meta):
+        """Called for each item the pass is interested in."""
+
+    def gap(self, seg, start, end):
+        """Called for each undefined gap, if gaps is set."""
+
+    def finish(self, model):
+        """Called once the whole sweep is over."""
+
+
+def sweep(model, passes, ranges=None):
+    """Run passes over the model's physical ranges (or given ranges)."""
+    if ranges is None:
+        ranges = model.get_phys_ranges()
+    gap_passes = [each for each in passes if each.gaps]
+    # (item type, mnemonic) -> the passes to visit with, in order.
+    dispatch = {}
+
+    def interested(kind, cmd):
+        handlers = [each for each in passes
+                    if issubclass(kind, tuple(each.kinds)) or
+                    cmd in each.opcodes]
+        dispatch[(kind, cmd)] = handlers
+        return handlers
+
+    for start, end in ranges:
+        seg = model.get_segment(start)
+        for each in passes:
+            each.begin(model, seg, start, end)
+        position = start
+        while True:
+            meta = seg.next_location(position)
+            if meta is None or meta.location >= end:
+                break
+            if meta.location > position:
+                for each in gap_passes:
+                    each.gap(seg, position, meta.location)
+            position = meta.location + meta.width
+            kind = type(meta)
+            cmd = None
+            if kind is sh2.CodeField:
+                cmd = meta.extra.opcode.cmd
+            handlers = dispatch.get((kind, cmd))
+            if handlers is None:
+                handlers = interested(kind, cmd)
+            for each in handlers:
+                each.visit(meta)
+        if position < end:
+            for each in gap_passes:
+                each.gap(seg, position, end)
+
+    for each in passes:
+        each.finish(model)
+
+
+class FreeSpace(Pass):
+    """Replace long runs of unused fill bytes with NullFields.
+
+    Only runs of at least min_length bytes count. Runs are collected during
+    the sweep and committed at the end, carving out anything other passes
+    defined inside them in the meantime.
+    """
+
+    gaps = True
+
+    def __init__(self, min_length=0x200, fills=(0xFF,)):
+        object.__init__(self)
+        self.min_length = min_length
+        self.patterns = [
+            re.compile(('\\x%02X{%d,}' % (fill, min_length)).encode())
+            for fill in fills]
+        self.runs = []  # (seg, start, end)
+
+    def gap(self, seg, start, end):
+        if end - start < self.min_length:
+            return
+        for pattern in self.patterns:
+            for match in pattern.finditer(seg.phys, start - seg.start,
+                                          end - seg.start):
+                self.runs.append((seg, seg.start + match.start(),
+                                  seg.start + match.end()))
+
+    def finish(self, model):
+        for seg, run_start, run_end in self.runs:
+            meta = seg.get_location(run_start)
+            if meta is not None:
+                run_start = meta.location + meta.width
+            for meta in seg.iter_locations(run_start, run_end):
+                if meta.location - run_start >= self.min_length:
+                    self.commit(model, run_start, meta.location)
+                run_start = max(run_start, meta.location + meta.width)
+            if run_end - run_start >= self.min_length:
+                self.commit(model, run_start, run_end)
+        self.runs = []
+
+    @staticmethod
+    def commit(model, start, end):
+        """Define a run of free space."""
+        model.set_location(sh2.NullField(location=start, width=end - start,
+                                         model=model))
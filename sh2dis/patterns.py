@@ -0,0 +1,125 @@
+"""Find sequences of instructions through the opcode index.
+
+A pattern is a list of consecutive instructions separated by semicolons:
+
+    mov.w = 0xBF ; shll2 ; mov.l @(*,pc), r*
+
+Each step is a mnemonic (or * for any instruction), optionally followed by
+a glob its operands must match, and optionally by "= value", the value of
+the item at the instruction's target (a literal pool entry, for PC-relative
+loads). Instead of walking the whole ROM, a search starts from the
+addresses of the step whose mnemonic occurs least often, and checks the
+rest of the pattern around each of them.
+"""
+
+from __future__ import print_function
+
+from collections import namedtuple
+
+import bisect
+import fnmatch
+
+from . import segment
+from . import sh2
+
+
+# One instruction of a pattern; operands and value are None to match any.
+Step = namedtuple('Step', 'cmd operands value')
+
+
+class PatternError(Exception):
+    """A pattern could not be parsed."""
+
+
+def parse_step(text):
+    """Parse a single pattern step."""
+    instruction, equals, value = text.partition('=')
+    if equals:
+        try:
+            value = int(value.strip(), 0)
+        except ValueError:
+            raise PatternError('invalid value in %r' % text.strip())
+    else:
+        value = None
+    cmd, _, operands = instruction.strip().partition(' ')
+    if not cmd:
+        raise PatternError('empty step in pattern')
+    return Step(cmd, operands.strip() or None, value)
+
+
+class Pattern(object):
+    """A compiled instruction sequence."""
+
+    def __init__(self, text):
+        object.__init__(self)
+        self.text = text
+        self.steps = [parse_step(step) for step in text.split(';')]
+        anchors = [i for i, step in enumerate(self.steps) if step.cmd != '*']
+        if not anchors:
+            raise PatternError('%r has no instruction to search for' % text)
+        self.anchors = anchors
+
+    def __repr__(self):
+        return 'Pattern(%r)' % self.text
+
+    @staticmethod
+    def step_matches(step, code, model):
+        """Return whether a single item matches a step."""
+        if not isinstance(code, sh2.CodeField):
+            return False
+        if step.cmd != '*' and code.extra.opcode.cmd != step.cmd:
+            return False
+        if step.operands is not None:
+            operands = code.get_instruction().partition(' ')[2]
+            if not fnmatch.fnmatchcase(operands, step.operands):
+                return False
+        if step.value is not None:
+            target = code.extra.args.get('target')
+            if target is None:
+                return False
+            try:
+                meta = model.get_location(target)
+            except segment.SegmentError:
+                return False
+            if meta is None or meta.location != target or (
+                    meta.extra != step.value):
+                return False
+        return True
+
+    def match_at(self, model, location):
+        """Return whether the pattern matches starting at a location."""
+        for step in self.steps:
+            try:
+                code = model.get_location(location)
+            except segment.SegmentError:
+                return False
+            if code is None or code.location != location or (
+                    not self.step_matches(step, code, model)):
+                return False
+            location += code.width
+        return True
+
+    def search(self, model, start=None, end=None):
+        """Return the sorted addresses the pattern matches at.
+
+        Only matches starting within [start, end) are returned, if given.
+        """
+        index = sh2.opcode_index(model)
+        anchor = min(self.anchors,
+                     key=lambda i: len(index.locations(self.steps[i].cmd)))
+        candidates = index.locations(self.steps[anchor].cmd)
+        offset = 2 * anchor
+        first, last = 0, len(candidates)
+        if start is not None:
+            first = bisect.bisect_left(candidates, start + offset)
+        if end is not None:
+            last = bisect.bisect_left(candidates, end + offset)
+        return [candidates[i] - offset for i in range(first, last)
+                if self.match_at(model, candidates[i] - offset)]
+
+
+def search(model, pattern, start=None, end=None):
+    """Return where a pattern (text or Pattern) matches in a model."""
+    if not isinstance(pattern, Pattern):
+        pattern = Pattern(pattern)
+    return pattern.search(model, start, end)
@@ -0,0 +1,240 @@
+"""The sh2dis analysis pipeline, from raw ROM bytes to rendered output."""
+
+from __future__ import print_function
+
+import mmap
+import sys
+
+from . import mitsubishi
+from . import parallel
+from . import passes
+from . import processors
+from . import segment
+from . import sh2
+from . import stats
+
+
+OUTPUT_SEPARATOR = '         ! ' + '-' * 60
+
+
+class ROMError(Exception):
+    """An error related to parsing the supplied ROM data."""
+
+
+def map_rom(romfile):
+    """Return a ROM's contents, mapped into memory rather than read.
+
+    Falls back to reading the file when it can't be mapped (a pipe, or an
+    empty file).
+    """
+    try:
+        return mmap.mmap(romfile.fileno(), 0, access=mmap.ACCESS_READ)
+    except (AttributeError, EnvironmentError, ValueError):
+        return romfile.read()
+
+
+def get_segments(phys):
+    """Determine if this is an Evo VIII (7052) or IX (7055) ROM."""
+    if len(phys) == 0x40000:
+        # SH/7052F
+        return processors.load('sh7052'), (
+            ('ROM', 0x0, len(phys), phys),
+            ('RAM', 0xFFFF8000, 0xFFFFB000, None),
+            ('REG', 0xFFFFE400, 0xFFFFF860, None),
+        )
+    if len(phys) == 0x80000:
+        # SH/7055F
+        return processors.load('sh7055'), (
+            ('ROM', 0x0, len(phys), phys),
+            ('RAM', 0xFFFF6000, 0xFFFFE000, None),
+            ('REG', 0xFFFFE400, 0xFFFFF860, None),
+        )
+    raise ROMError('invalid or unrecognized ROM')
+
+
+def setup_vectors(model):
+    """Pre-define the vector table."""
+    vectors = dict((entry[0], entry) for entry in model.processor.VECTORS)
+    for i in range(0x0, 0x400, 0x4):
+        label = None
+        comment = None
+        kind = sh2.LongField
+        if i in vectors:
+            _, size, label, comment = vectors[i]
+            if size == 1:
+                kind = sh2.ByteField
+            elif size == 2:
+                kind = sh2.WordField
+        vector = kind(location=i, model=model, comment=comment)
+        model.set_location(vector)
+        model.set_label(i, label)
+        if label is not None and label.startswith('v_'):
+            targetlabel = model.get_label(vector.extra)
+            if targetlabel is None or targetlabel.startswith('unk_'):
+                model.set_label(vector.extra, label[2:])
+
+    for addr, size, name, comment in model.processor.REGISTERS:
+        kind = sh2.LongField
+        if size == 1:
+            kind = sh2.ByteField
+        elif size == 2:
+            kind = sh2.WordField
+        meta = kind(location=addr, model=model, comment=comment)
+        model.set_location(meta)
+        model.set_label(addr, name)
+
+
+def vector_roots(model):
+    """Return (target, vector) for each code address in the vector table."""
+    vectors = []
+    for i in range(0x0, 0x400, 0x4):
+        meta = model.get_location(i)
+        try:
+            # Make sure this is a real address (ie. not a stack pointer)
+            model.get_phys(meta.extra)
+        except segment.SegmentError:
+            continue
+        vectors.append((meta.extra, meta.location))
+    return vectors
+
+
+def disassemble_vectors(model, callback=None, dataflow=False, jobs=None):
+    """Disassemble the locations referenced by the vector table.
+
+    With jobs, the vectors are shared out between that many processes
+    (traversals with a callback or dataflow always run in this one).
+    """
+    vectors = vector_roots(model)
+    if jobs is not None and jobs > 1:
+        parallel.disassemble(vectors, model, jobs, callback,
+                             dataflow=dataflow, setup=setup_vectors)
+    else:
+        sh2.disassemble(vectors, model, callback, dataflow=dataflow)
+
+
+def scan_free_space(model, min_length=0x200, fills=(0xFF,)):
+    """Scan for contiguous blocks of 0xFF, replace with NullField.
+
+    Only runs of at least min_length unused bytes are replaced. Other fill
+    values (0x00, for instance) can be treated as free space via fills.
+    """
+    passes.sweep(model, [passes.FreeSpace(min_length, fills)])
+
+
+def iter_slots(seg, start, end):
+    """Yield (location, value) for defined values and undefined bytes."""
+    position = start
+    for meta in seg.iter_locations(start, end):
+        for i in range(position, meta.location):
+            yield i, None
+        yield meta.location, meta
+        position = meta.location + meta.width
+    for i in range(position, end):
+        yield i, None
+
+
+def render_unknown(seg, location):
+    """Render an undefined byte the way a throwaway ByteField would."""
+    value = seg.read_u8(location)
+    comments = []
+    if chr(value).isalnum():
+        comments.append('\'%c\'' % value)
+    comments.extend(seg.generate_comments(location))
+    return segment.format_line(location, seg.get_label(location),
+                               '.byte 0x%02X' % value, comments)
+
+
+def render_slot(seg, location, meta):
+    """Render a single defined value, or an undefined byte."""
+    if meta is None:
+        return render_unknown(seg, location)
+    return str(meta)
+
+
+def render(model, ranges, text=render_slot):
+    """Generate the lines of a moderately-useful disassembly output.
+
+    text renders each slot; callers that keep rendered lines around can
+    supply their own to skip slots that haven't changed.
+    """
+    in_code = False
+    for start, end in ranges:
+        seg = model.get_segment(start)
+        for i, meta in iter_slots(seg, start, end):
+            if in_code:
+                if isinstance(meta, sh2.CodeField):
+                    # Use RTS to denote code separation.
+                    rts = model.get_location(i - 4)
+                    if (isinstance(rts, sh2.CodeField) and
+                            rts.extra.opcode.cmd == 'rts'):
+                        yield OUTPUT_SEPARATOR
+                else:
+                    # The code block just ended.
+                    in_code = False
+                    yield OUTPUT_SEPARATOR
+            elif isinstance(meta, sh2.CodeField):
+                # We just started a new code block.
+                in_code = True
+                yield OUTPUT_SEPARATOR
+
+            out = text(seg, i, meta)
+            if meta is None:
+                yield out
+            elif isinstance(meta, sh2.NullField):
+                yield OUTPUT_SEPARATOR
+                yield out
+                yield OUTPUT_SEPARATOR
+            elif out:
+                yield out
+
+
+def final_output(model, outfile, ranges, buffer_lines=8192, text=render_slot):
+    """Produce a moderately-useful disassembly output."""
+    if outfile is None:
+        outfile = sys.stdout
+    lines = []
+    for line in render(model, ranges, text):
+        lines.append(line)
+        if len(lines) >= buffer_lines:
+            lines.append('')
+            outfile.write('\n'.join(lines))
+            lines = []
+    if lines:
+        lines.append('')
+        outfile.write('\n'.join(lines))
+
+
+def build_model(phys, mitsu=False, predecode=False, dataflow=False,
+                jobs=None):
+    """Run the full analysis over a ROM image and return its memory model."""
+    processor, segments = get_segments(phys)
+    model = segment.MemoryModel(processor, segments)
+    stats.watch(model)
+    if predecode:
+        with stats.stage('predecode'):
+            if not sh2.predecode(model):
+                print('numpy is not available, decoding lazily',
+                      file=sys.stderr)
+    with stats.stage('setup_vectors'):
+        setup_vectors(model)
+    with stats.stage('disassemble_vectors'):
+        disassemble_vectors(model, mitsubishi.callback if mitsu else None,
+                            dataflow, jobs)
+    # Mitsubishi scans and the free space scan share one sweep of the ROM.
+    post = [passes.FreeSpace()]
+    if mitsu:
+        with stats.stage('fixups'):
+            mitsubishi.fixups(model, scan=False)
+        post[:0] = mitsubishi.scan_passes()
+    with stats.stage('post_analysis'):
+        passes.sweep(model, post)
+    with stats.stage('compact_references'):
+        model.compact_references()
+    return model
+
+
+def output_ranges(model, ram=False):
+    """Return the address ranges to render, optionally including RAM."""
+    if ram:
+        return [(seg.start, seg.end) for seg in model.segments]
+    return model.get_phys_ranges()
@@ -0,0 +1,21 @@
+"""The processors sh2dis knows, loaded only once a ROM needs one.
+
+Each processor is a module in this package holding VECTORS and REGISTERS:
+tuples of (address, size, name, comment) entries. They are large, so they
+are only imported when a ROM (or a saved project) calls for them.
+"""
+
+from __future__ import print_function
+
+import importlib
+
+
+PROCESSORS = ('sh7052', 'sh7055')
+
+
+def load(name):
+    """Return a processor's module, by short ('sh7055') or module name."""
+    short = name.rsplit('.', 1)[-1]
+    if short not in PROCESSORS:
+        raise ValueError('unknown processor %r' % name)
+    return importlib.import_module('.' + short, __package__)
@@ -0,0 +1,401 @@
+"""Compact binary project files for saving and sharing a MemoryModel.
+
+A project file is a short JSON header followed by little-endian columnar
+arrays: one row per defined item (start, width, kind, extra value and
+friends), a shared string table for labels and comments, the xrefs in
+compressed sparse row form, and the Mitsubishi tables and axes found.
+Files are opened with mmap and the arrays are used in place, so opening a
+project costs little more than rebuilding the item objects themselves.
+"""
+
+from __future__ import print_function
+
+import array
+import json
+import mmap
+import struct
+import sys
+
+from . import mitsubishi
+from . import processors
+from . import segment
+from . import sh2
+
+
+MAGIC = b'SH2DPRJ\0'
+VERSION = 2
+
+# Item types that can be stored, identified by their position here.
+KINDS = (sh2.ByteField, sh2.WordField, sh2.LongField, sh2.CodeField,
+         sh2.NullField)
+
+# Stand-in for None in the signed columns.
+NONE = -(1 << 63)
+
+# Column name -> array typecode. Order is the order they are written in.
+COLUMNS = (
+    ('item_start', 'I'),
+    ('item_width', 'I'),
+    ('item_kind', 'B'),
+    ('item_extra', 'q'),
+    ('item_target', 'q'),
+    ('item_comment', 'i'),
+    ('item_prefix', 'i'),
+    ('item_group', 'i'),
+    ('group_per_line', 'I'),
+    ('group_comment', 'i'),
+    ('group_extra', 'q'),
+    ('label_location', 'I'),
+    ('label_string', 'i'),
+    ('xref_location', 'I'),
+    ('xref_offset', 'I'),
+    ('xref_source', 'I'),
+    ('string_offset', 'I'),
+    ('axis_result', 'I'),
+    ('axis_location', 'I'),
+    ('table_location', 'I'),
+    ('table_dimensions', 'I'),
+    ('table_width', 'B'),
+    ('table_yaxis', 'q'),
+    ('table_xaxis', 'q'),
+    ('table_data', 'I'),
+    ('table_length', 'I'),
+)
+
+_HEADER = struct.Struct('<8sII')
+
+
+class ProjectError(Exception):
+    """A project file could not be read."""
+
+
+class StringTable(object):
+    """Deduplicated strings, referred to by index."""
+
+    def __init__(self):
+        object.__init__(self)
+        self.index = {}
+        self.strings = []
+
+    def add(self, value):
+        """Return the index for a string, or -1 for None."""
+        if value is None:
+            return -1
+        i = self.index.get(value)
+        if i is None:
+            i = self.index[value] = len(self.strings)
+            self.strings.append(value)
+        return i
+
+    def encode(self):
+        """Return the offsets column and the UTF-8 blob it indexes."""
+        offsets = array.array('I', [0])
+        blob = []
+        size = 0
+        for value in self.strings:
+            data = value.encode('utf-8')
+            blob.append(data)
+            size += len(data)
+            offsets.append(size)
+        return offsets, b''.join(blob)
+
+
+def _none(value):
+    return NONE if value is None else value
+
+
+def _value(value):
+    return None if value == NONE else value
+
+
+def save(model, path, include_phys=True):
+    """Write a model to a project file.
+
+    With include_phys the ROM image travels with the project, so it can be
+    opened without the original file.
+    """
+    strings = StringTable()
+    columns = dict((name, array.array(typecode))
+                   for name, typecode in COLUMNS)
+    groups = {}
+    segments = []
+    xref_offset = columns['xref_offset']
+    xref_offset.append(0)
+
+    for seg in model.segments:
+        segments.append({'name': seg.name, 'start': seg.start,
+                         'end': seg.end, 'phys': seg.phys is not None})
+        for meta in seg.iter_locations(seg.start, seg.end):
+            group = -1
+            if meta.member_of is not None:
+                group = groups.get(id(meta.member_of))
+                if group is None:
+                    group = groups[id(meta.member_of)] = len(groups)
+                    columns['group_per_line'].append(
+                        meta.member_of.items_per_line)
+                    columns['group_comment'].append(
+                        strings.add(meta.member_of.comment))
+                    columns['group_extra'].append(
+                        _none(meta.member_of.extra))
+            if isinstance(meta, sh2.CodeField):
+                extra = meta.extra.instruction
+                target = meta.extra.args['target']
+            else:
+                extra = meta.extra
+                target = None
+            columns['item_start'].append(meta.location)
+            columns['item_width'].append(meta.width)
+            columns['item_kind'].append(KINDS.index(type(meta)))
+            columns['item_extra'].append(_none(extra))
+            columns['item_target'].append(_none(target))
+            columns['item_comment'].append(strings.add(meta.comment))
+            columns['item_prefix'].append(strings.add(meta.unknown_prefix))
+            columns['item_group'].append(group)
+        for location, label in seg.iter_labels():
+            columns['label_location'].append(location)
+            columns['label_string'].append(strings.add(label))
+        for location, references in seg.iter_references():
+            columns['xref_location'].append(location)
+            columns['xref_source'].extend(
+                ref for ref in references if ref is not None)
+            xref_offset.append(len(columns['xref_source']))
+
+    for result, location in sorted(mitsubishi.get_axes(model).items()):
+        columns['axis_result'].append(result)
+        columns['axis_location'].append(location)
+    tables = mitsubishi.get_tables(model)
+    for location in sorted(tables):
+        table = tables[location]
+        columns['table_location'].append(table.location)
+        columns['table_dimensions'].append(table.dimensions)
+        columns['table_width'].append(table.width)
+        columns['table_yaxis'].append(_none(table.yaxis))
+        columns['table_xaxis'].append(_none(table.xaxis))
+        columns['table_data'].append(table.data)
+        columns['table_length'].append(table.length)
+
+    offsets, blob = strings.encode()
+    columns['string_offset'] = offsets
+    blobs = [blob]
+    if include_phys:
+        blobs.extend(seg.phys for seg in model.segments
+                     if seg.phys is not None)
+
+    # Lay out every column and blob at an 8-byte aligned offset.
+    layout = {}
+    chunks = []
+    position = 0
+    for name, _ in COLUMNS:
+        data = columns[name]
+        if sys.byteorder != 'little':
+            data = array.array(data.typecode, data)
+            data.byteswap()
+        data = data.tobytes()
+        layout[name] = [position, len(columns[name])]
+        chunks.append(data)
+        position += len(data) + (-len(data) % 8)
+    blob_layout = []
+    for data in blobs:
+        blob_layout.append([position, len(data)])
+        chunks.append(data)
+        position += len(data) + (-len(data) % 8)
+
+    header = json.dumps({
+        'processor': model.processor.__name__,
+        'segments': segments,
+        'columns': layout,
+        'strings': blob_layout[0],
+        'phys': blob_layout[1:],
+    }, sort_keys=True).encode('utf-8')
+    base = _HEADER.size + len(header)
+    base += -base % 8
+
+    with open(path, 'wb') as projfile:
+        projfile.write(_HEADER.pack(MAGIC, VERSION, len(header)))
+        projfile.write(header)
+        projfile.write(b'\0' * (base - _HEADER.size - len(header)))
+        for data in chunks:
+            projfile.write(data)
+            projfile.write(b'\0' * (-len(data) % 8))
+
+
+class ProjectFile(object):
+    """A read-only, memory-mapped view of a project file's columns.
+
+    Close it (or use it in a with statement) once done. The ROM images
+    phys() returns are views of the mapping too, and keep it alive for as
+    long as they are in use.
+    """
+
+    def __init__(self, path):
+        object.__init__(self)
+        self.columns = {}
+        with open(path, 'rb') as projfile:
+            self.mmap = mmap.mmap(projfile.fileno(), 0,
+                                  access=mmap.ACCESS_READ)
+        try:
+            self.__read_header(path)
+        except BaseException:
+            self.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        return False
+
+    def __read_header(self, path):
+        magic, version, header_len = _HEADER.unpack_from(self.mmap, 0)
+        if magic != MAGIC:
+            raise ProjectError('%s is not an sh2dis project' % path)
+        if not 1 <= version <= VERSION:
+            raise ProjectError('%s is project version %d, expected %d or '
+                               'older' % (path, version, VERSION))
+        start = _HEADER.size
+        self.header = json.loads(
+            self.mmap[start:start + header_len].decode('utf-8'))
+        self.base = start + header_len + (-(start + header_len) % 8)
+        for name, typecode in COLUMNS:
+            # Older versions lack some columns; they read as empty.
+            offset, count = self.header['columns'].get(name, (0, 0))
+            self.columns[name] = self._column(typecode, offset, count)
+        offset, size = self.header['strings']
+        self.blob = self.mmap[self.base + offset:self.base + offset + size]
+
+    def _column(self, typecode, offset, count):
+        start = self.base + offset
+        size = count * array.array(typecode).itemsize
+        view = memoryview(self.mmap)[start:start + size]
+        if sys.byteorder == 'little':
+            return view.cast(typecode)
+        column = array.array(typecode, view.tobytes())
+        column.byteswap()
+        return column
+
+    def strings(self):
+        """Return the whole string table, decoded."""
+        offsets = self.columns['string_offset']
+        return [self.blob[offsets[i]:offsets[i + 1]].decode('utf-8')
+                for i in range(len(offsets) - 1)]
+
+    def phys(self):
+        """Return views of the embedded ROM images, if there are any."""
+        images = []
+        for offset, size in self.header['phys']:
+            start = self.base + offset
+            images.append(memoryview(self.mmap)[start:start + size])
+        return images
+
+    def close(self):
+        """Release the columns and, unless a ROM image is in use, the map."""
+        for column in self.columns.values():
+            if isinstance(column, memoryview):
+                column.release()
+        self.columns = {}
+        try:
+            self.mmap.close()
+        except BufferError:
+            # A phys() image still refers to it; the mapping goes away
+            # along with the last such image.
+            pass
+
+
+def restore_item(cls, location, width, model, extra, target=None,
+                 comment=None, unknown_prefix=None, member_of=None):
+    """Recreate a stored item without re-reading the ROM.
+
+    For CodeFields extra is the instruction word and target its resolved
+    target. The type constructors are skipped: they would re-read the ROM
+    and re-add references that are restored separately.
+    """
+    if cls is sh2.CodeField:
+        opcode, args = sh2.decode(extra, location)
+        args['target'] = target
+        extra = sh2.CodeExtra(extra, opcode, args)
+    meta = cls.__new__(cls)
+    segment.SegmentData.__init__(
+        meta, location=location, width=width, model=model, comment=comment,
+        unknown_prefix=unknown_prefix, extra=extra, member_of=member_of)
+    return meta
+
+
+def load(path, phys=None):
+    """Rebuild a MemoryModel from a project file without re-analysis.
+
+    phys supplies the ROM image when the project was saved without one.
+    """
+    with ProjectFile(path) as project:
+        return _restore(path, project, phys)
+
+
+def _restore(path, project, phys):
+    """Build the model held in an open ProjectFile."""
+    header = project.header
+    try:
+        processor = processors.load(header['processor'])
+    except ValueError as err:
+        raise ProjectError('%s: %s' % (path, err))
+
+    images = [phys] if phys is not None else project.phys()
+    if not images:
+        raise ProjectError('%s does not include a ROM image' % path)
+    images = iter(images)
+    model = segment.MemoryModel(processor, [
+        (seg['name'], seg['start'], seg['end'],
+         next(images) if seg['phys'] else None)
+        for seg in header['segments']])
+
+    cols = project.columns
+    strings = project.strings()
+
+    def string(index):
+        return strings[index] if index >= 0 else None
+    groups = [segment.CompositeData(items_per_line=per_line, model=model,
+                                    comment=string(comment),
+                                    extra=_value(extra))
+              for per_line, comment, extra in zip(cols['group_per_line'],
+                                                  cols['group_comment'],
+                                                  cols['group_extra'])]
+
+    seg = None
+    for i in range(len(cols['item_start'])):
+        location = cols['item_start'][i]
+        if seg is None or not seg.start <= location < seg.end:
+            seg = model.get_segment(location)
+        group = cols['item_group'][i]
+        member_of = groups[group] if group >= 0 else None
+        meta = restore_item(
+            KINDS[cols['item_kind'][i]], location, cols['item_width'][i],
+            model, _value(cols['item_extra'][i]),
+            _value(cols['item_target'][i]),
+            string(cols['item_comment'][i]), string(cols['item_prefix'][i]),
+            member_of)
+        seg.set_location(meta)
+        if member_of is not None:
+            member_of.members.append(meta)
+
+    for location, label in zip(cols['label_location'],
+                               cols['label_string']):
+        model.set_label(location, string(label))
+
+    offsets = cols['xref_offset']
+    sources = cols['xref_source']
+    for i, location in enumerate(cols['xref_location']):
+        for j in range(offsets[i], offsets[i + 1]):
+            model.add_reference(location, sources[j])
+
+    mitsubishi.get_axes(model).update(zip(cols['axis_result'],
+                                          cols['axis_location']))
+    tables = mitsubishi.get_tables(model)
+    for row in zip(cols['table_location'], cols['table_dimensions'],
+                   cols['table_width'], cols['table_yaxis'],
+                   cols['table_xaxis'], cols['table_data'],
+                   cols['table_length']):
+        location, dimensions, width, yaxis, xaxis, data, length = row
+        tables[location] = mitsubishi.Table(
+            location, dimensions, width, _value(yaxis), _value(xaxis), data,
+            length)
+
+    return model
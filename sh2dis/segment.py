@@ -3,7 +3,9 @@
 from __future__ import print_function
 
 
+import array
 import bisect
+import struct
 import textwrap
 
 
@@ -12,6 +14,29 @@ class SegmentError(Exception):
     pass
 
 
+def format_line(location, label, instruction, comments):
+    """Format a location's output line, with any comments alongside."""
+    if label is None or '+' in label:
+        label = ''
+    else:
+        label += ':'
+
+    val = []
+    if comments:
+        if len(instruction) > 21:
+            val.append('%08X %-16s %s' % (location, label, instruction))
+        else:
+            comment = comments.pop(0)
+            val.append('%08X %-16s %-21s ! %s' % (location, label,
+                                                  instruction, comment))
+        for comment in comments:
+            val.append('%47s ! %s' % ('', comment))
+    else:
+        val.append('%08X %-16s %s' % (location, label, instruction))
+
+    return '\n'.join(val)
+
+
 class SegmentData(object):
     """Metaclass for segment data types."""
 
@@ -40,10 +65,6 @@ class SegmentData(object):
         instruction = self.get_instruction()
 
         label = self.model.get_label(self.location)
-        if label is None or '+' in label:
-            label = ''
-        else:
-            label += ':'
 
         # Ask children if they have any custom comments.
         comments = self.generate_comments()
@@ -51,21 +72,7 @@ class SegmentData(object):
         # Ask the model if it has any comments for us.
         comments.extend(self.model.generate_comments(self.location))
 
-        val = []
-        if comments:
-            if len(instruction) > 21:
-                val.append('%08X %-16s %s' % (self.location, label,
-                                              instruction))
-            else:
-                comment = comments.pop(0)
-                val.append('%08X %-16s %-21s ! %s' % (self.location, label,
-                                                      instruction, comment))
-            for comment in comments:
-                val.append('%47s ! %s' % ('', comment))
-        else:
-            val.append('%08X %-16s %s' % (self.location, label, instruction))
-
-        return '\n'.join(val)
+        return format_line(self.location, label, instruction, comments)
 
     def generate_comments(self):
         """Return aggregated comments for this location."""
@@ -117,13 +124,22 @@ class CompositeData(SegmentData):
         return ''.join(val)
 
 
+# Big-endian readers that decode straight from the backing buffer.
+_U8 = struct.Struct('>B')
+_U16 = struct.Struct('>H')
+_U32 = struct.Struct('>L')
+
+# Items wider than this are also kept in a sorted list of their own, so a
+# point lookup only ever needs to probe this many starts before it.
+NARROW_WIDTH = 4
+_BACK = tuple(range(1, NARROW_WIDTH))
+# An item ending right before a location can start this many bytes back.
+_NEAR_BACK = tuple(range(1, NARROW_WIDTH + 1))
+
+
 class Segment(object):
     """A memory segment for this architecture."""
 
-    VALUE = 0
-    XREFS = 1
-    LABEL = 2
-
     def __init__(self, start, end, phys=None, name=None, model=None):
         object.__init__(self)
         self.start = start
@@ -131,8 +147,32 @@ class Segment(object):
         self.phys = phys
         self.name = name
         self.model = model
-        # Initialize to a list of [value, references, label].
-        self.space = [[None, [], None] for _ in range(end - start)]
+        # Sparse storage, keyed by location relative to the segment start.
+        self.values = {}
+        self.labels = {}
+        # References are indexed as sorted, deduplicated sources grouped by
+        # target, in compressed sparse row form. New ones are just appended
+        # to added_references (target -> sources) until the index is next
+        # compacted.
+        self.added_references = {}
+        self.xref_targets = array.array('I')
+        self.xref_offsets = array.array('I', [0])
+        self.xref_sources = array.array('I')
+        # Whether anything refers to each location, kept up to date as
+        # references are added so labels never need the index.
+        self.referenced = bytearray(end - start)
+        # Sorted starts of every value, plus those added since the last
+        # ordered query (merged in when the next one needs them).
+        self.starts = []
+        self.added = set()
+        # Sorted starts of values wider than NARROW_WIDTH.
+        self.wide = []
+        # How often set_location absorbed an existing value, or refused to
+        # because it would overlap one partially.
+        self.replaced = 0
+        self.conflicts = 0
+        # Locations get_label() has made up an unk_... style label for.
+        self.synthesized = set()
 
     def get_phys(self, location, width=1):
         """Return the actual data backing a given location+width."""
@@ -141,71 +181,170 @@ class Segment(object):
         relative_location = location - self.start
         return self.phys[relative_location:(relative_location + width)]
 
+    def read_u8(self, location):
+        """Return the byte at a given location."""
+        if self.phys is None:
+            return 0
+        return _U8.unpack_from(self.phys, location - self.start)[0]
+
+    def read_u16be(self, location):
+        """Return the big-endian word at a given location."""
+        if self.phys is None:
+            return 0
+        return _U16.unpack_from(self.phys, location - self.start)[0]
+
+    def read_u32be(self, location):
+        """Return the big-endian long-word at a given location."""
+        if self.phys is None:
+            return 0
+        return _U32.unpack_from(self.phys, location - self.start)[0]
+
+    def __find(self, rel_loc):
+        values = self.values
+        meta = values.get(rel_loc)
+        if meta is not None:
+            return meta
+        for back in _BACK:
+            meta = values.get(rel_loc - back)
+            if meta is not None:
+                # Values never overlap, so nothing else can cover rel_loc.
+                return meta if meta.width > back else None
+        if self.wide:
+            i = bisect.bisect_right(self.wide, rel_loc) - 1
+            if i >= 0:
+                meta = values[self.wide[i]]
+                if rel_loc < self.wide[i] + meta.width:
+                    return meta
+        return None
+
+    def __find_near(self, rel_loc):
+        # The value covering rel_loc, or failing that the one before it.
+        values = self.values
+        meta = values.get(rel_loc)
+        if meta is not None:
+            return meta
+        for back in _NEAR_BACK:
+            meta = values.get(rel_loc - back)
+            if meta is not None:
+                # It covers rel_loc - 1 (and maybe rel_loc) or nothing does.
+                return meta if meta.width >= back else None
+        if self.wide:
+            i = bisect.bisect_right(self.wide, rel_loc) - 1
+            if i >= 0:
+                meta = values[self.wide[i]]
+                if rel_loc <= self.wide[i] + meta.width:
+                    return meta
+        return None
+
+    def __ordered_starts(self):
+        if self.added:
+            self.starts.extend(self.added)
+            self.starts.sort()
+            self.added.clear()
+        return self.starts
+
+    def __starts_between(self, rel_start, rel_end):
+        if rel_end - rel_start <= NARROW_WIDTH:
+            values = self.values
+            return [i for i in range(rel_start, rel_end) if i in values]
+        starts = self.__ordered_starts()
+        return starts[bisect.bisect_left(starts, rel_start):
+                      bisect.bisect_left(starts, rel_end)]
+
     def get_location(self, location):
         """Return the location object for a given location."""
-        relative_location = location - self.start
-        meta = self.space[relative_location][self.VALUE]
-        if isinstance(meta, int):
-            meta = self.space[relative_location + meta][self.VALUE]
-        return meta
+        return self.__find(location - self.start)
 
     def set_location(self, value):
         """Set a given location to a specified value."""
         comments = []
         rel_loc = value.location - self.start
         rel_end = rel_loc + value.width
-        for i in range(rel_loc, rel_loc + value.width):
-            meta = self.space[i][self.VALUE]
-            if meta is not None:
-                if i + meta.width <= rel_end:
-                    if meta.comment is not None:
-                        comments.append(meta.comment)
-                    for j in self.space[meta.location - self.start][self.XREFS]:
+        meta = self.__find(rel_loc)
+        if meta is not None and meta.location - self.start < rel_loc:
+            self.conflicts += 1
+            raise SegmentError('conflict with data at %#x' % value.location)
+        for i in self.__starts_between(rel_loc, rel_end):
+            meta = self.values[i]
+            if i + meta.width <= rel_end:
+                self.replaced += 1
+                if meta.comment is not None:
+                    comments.append(meta.comment)
+                if self.referenced[i]:
+                    for j in self.get_references(self.start + i):
                         self.model.add_reference(value.location, j)
-                    self.unset_location(meta.location)
-                else:
-                    raise SegmentError('conflict with data at %#x' % i)
+                self.unset_location(meta.location)
+            else:
+                self.conflicts += 1
+                raise SegmentError('conflict with data at %#x' %
+                                   (self.start + i))
         if comments:
             if value.comment is not None:
                 comments.insert(0, value.comment)
             value.comment = '\n'.join(comments)
-        self.space[rel_loc][self.VALUE] = value
-        for i in range(1, value.width):
-            self.space[rel_loc + i][self.VALUE] = -i
+        self.values[rel_loc] = value
+        self.added.add(rel_loc)
+        if value.width > NARROW_WIDTH:
+            bisect.insort(self.wide, rel_loc)
+
+    def iter_locations(self, start, end):
+        """Yield each value defined in a given range, in address order."""
+        for rel_loc in self.__starts_between(start - self.start,
+                                             end - self.start):
+            meta = self.values.get(rel_loc)
+            if meta is not None:
+                yield meta
+
+    def next_location(self, location):
+        """Return the first value starting at or after a location, if any."""
+        starts = self.__ordered_starts()
+        i = bisect.bisect_left(starts, location - self.start)
+        if i < len(starts):
+            return self.values[starts[i]]
+        return None
 
     def unset_location(self, location):
         """Unset any established value at a given location."""
         meta = self.get_location(location)
         if meta is not None:
-            rel_loc = location - self.start
-            for i in range(rel_loc, rel_loc + meta.width):
-                self.space[i][self.VALUE] = None
+            rel_loc = meta.location - self.start
+            del self.values[rel_loc]
+            if rel_loc in self.added:
+                self.added.discard(rel_loc)
+            else:
+                del self.starts[bisect.bisect_left(self.starts, rel_loc)]
+            if meta.width > NARROW_WIDTH:
+                del self.wide[bisect.bisect_left(self.wide, rel_loc)]
 
     def get_label(self, location):
         """Return the label for a given location."""
-        meta = self.get_location(location)
-        if meta is None and (location - self.start) > 0:
-            meta = self.get_location(location - 1)
+        meta = self.__find_near(location - self.start)
         if meta is None:
             new_location = location
             unknown_prefix = 'unk'
         else:
             new_location = meta.location
             unknown_prefix = meta.unknown_prefix
-        label = self.space[new_location - self.start][self.LABEL]
-        if self.space[new_location - self.start][self.XREFS] and (label is None):
+        label = self.labels.get(new_location - self.start)
+        if label is None and self.referenced[new_location - self.start]:
             label = '%s_%X' % (unknown_prefix, new_location)
+            self.synthesized.add(new_location)
         if new_location < location and label is not None:
             label = '%s+%d' % (label, location - new_location)
         return label
 
     def set_label(self, location, label):
         """Set a label for a given location."""
-        self.space[location - self.start][self.LABEL] = label
+        if label is None:
+            self.labels.pop(location - self.start, None)
+        else:
+            self.labels[location - self.start] = label
 
     def generate_comments(self, location):
         """Generate cross-reference comments."""
-        references = self.space[location - self.start][self.XREFS]
+        if not self.referenced[location - self.start]:
+            return []
+        references = self.get_references(location)
         if references:
             count = 0
             max_xrefs = 6
@@ -224,24 +363,83 @@ class Segment(object):
         return []
 
     def add_reference(self, location, reference):
-        """Track references in numerically sorted order."""
-        if reference == location:
+        """Track a reference to a given location."""
+        if reference == location or reference is None:
             return
-        references = self.space[location - self.start][self.XREFS]
-        bleft = bisect.bisect_left(references, reference)
-        if bleft == len(references) or references[bleft] != reference:
-            references.insert(bleft, reference)
+        rel_loc = location - self.start
+        sources = self.added_references.get(rel_loc)
+        if sources is None:
+            self.added_references[rel_loc] = [reference]
+            self.referenced[rel_loc] = 1
+        else:
+            sources.append(reference)
+
+    def __indexed(self, rel_loc):
+        i = bisect.bisect_left(self.xref_targets, rel_loc)
+        if i < len(self.xref_targets) and self.xref_targets[i] == rel_loc:
+            return self.xref_offsets[i], self.xref_offsets[i + 1]
+        return 0, 0
 
     def get_references(self, location):
         """Return a list of all references to a given location."""
-        return list(self.space[location - self.start][self.XREFS])
+        rel_loc = location - self.start
+        if not self.referenced[rel_loc]:
+            return []
+        first, last = self.__indexed(rel_loc)
+        references = self.xref_sources[first:last].tolist()
+        added = self.added_references.get(rel_loc)
+        if added:
+            references = sorted(set(references).union(added))
+            self.added_references[rel_loc] = list(references)
+        return references
+
+    def compact(self):
+        """Fold every added reference into the index."""
+        if not self.added_references:
+            return
+        targets = array.array('I')
+        offsets = array.array('I', [0])
+        sources = array.array('I')
+        referenced = set(self.xref_targets).union(self.added_references)
+        for rel_loc in sorted(referenced):
+            targets.append(rel_loc)
+            sources.extend(self.get_references(self.start + rel_loc))
+            offsets.append(len(sources))
+        self.xref_targets = targets
+        self.xref_offsets = offsets
+        self.xref_sources = sources
+        self.added_references = {}
+
+    def iter_labels(self):
+        """Yield (location, label) for every explicit label, in order."""
+        for rel_loc in sorted(self.labels):
+            yield self.start + rel_loc, self.labels[rel_loc]
+
+    def iter_references(self):
+        """Yield (location, references) for every referenced location."""
+        self.compact()
+        offsets = self.xref_offsets
+        for i, rel_loc in enumerate(self.xref_targets):
+            yield (self.start + rel_loc,
+                   self.xref_sources[offsets[i]:offsets[i + 1]].tolist())
 
     def remove_reference(self, location, reference):
         """Remove a reference from a given location."""
-        references = self.space[location - self.start][self.XREFS]
-        bleft = bisect.bisect_left(references, reference)
-        if bleft != len(references) and references[bleft] == reference:
-            references.pop(bleft)
+        rel_loc = location - self.start
+        if reference not in self.get_references(location):
+            return
+        self.compact()
+        i = bisect.bisect_left(self.xref_targets, rel_loc)
+        offsets = self.xref_offsets
+        first, last = offsets[i], offsets[i + 1]
+        del self.xref_sources[first + self.xref_sources[first:last].index(
+            reference)]
+        for j in range(i + 1, len(offsets)):
+            offsets[j] -= 1
+        if offsets[i] == offsets[i + 1]:
+            del self.xref_targets[i]
+            del offsets[i + 1]
+            self.referenced[rel_loc] = 0
 
 
 class MemoryModel(object):
@@ -254,13 +452,45 @@ class MemoryModel(object):
         for name, start, end, phys in segments:
             self.segments.append(Segment(name=name, start=start, end=end,
                                          phys=phys, model=self))
+        # Segments ordered by start address, for bisection.
+        self.__ordered = sorted(self.segments, key=lambda seg: seg.start)
+        self.__starts = [seg.start for seg in self.__ordered]
+        self.__last = self.__ordered[0] if self.__ordered else None
+        # Callables told about every change, as (kind, location, width).
+        self.observers = []
+        # Callables told about every lookup of an item, label or comments,
+        # as (kind, location), before it is made.
+        self.readers = []
 
     def __lookup_segment(self, location):
-        for segment in self.segments:
-            if segment.start <= location < segment.end:
+        # Consecutive accesses nearly always land in the same segment.
+        segment = self.__last
+        if segment is not None and segment.start <= location < segment.end:
+            return segment
+        i = bisect.bisect_right(self.__starts, location) - 1
+        if i >= 0:
+            segment = self.__ordered[i]
+            if location < segment.end:
+                self.__last = segment
                 return segment
         raise SegmentError('invalid segment address: %#x' % location)
 
+    def __notify(self, kind, location, width=1):
+        for observer in self.observers:
+            observer(kind, location, width)
+
+    def __read(self, kind, location):
+        for reader in self.readers:
+            reader(kind, location)
+
+    def get_segment(self, location):
+        """Return the Segment a given location is within.
+
+        Callers walking a range of addresses can resolve the segment once and
+        then use its methods directly, skipping per-address resolution.
+        """
+        return self.__lookup_segment(location)
+
     def get_phys(self, location, width=1):
         """Return the actual data backing a given location+width."""
         seg = self.__lookup_segment(location)
@@ -268,6 +498,24 @@ class MemoryModel(object):
             raise SegmentError('%#x is not a physical location' % location)
         return seg.get_phys(location, width)
 
+    def __lookup_phys(self, location):
+        seg = self.__lookup_segment(location)
+        if seg.phys is None:
+            raise SegmentError('%#x is not a physical location' % location)
+        return seg
+
+    def read_u8(self, location):
+        """Return the byte at a given location."""
+        return self.__lookup_phys(location).read_u8(location)
+
+    def read_u16be(self, location):
+        """Return the big-endian word at a given location."""
+        return self.__lookup_phys(location).read_u16be(location)
+
+    def read_u32be(self, location):
+        """Return the big-endian long-word at a given location."""
+        return self.__lookup_phys(location).read_u32be(location)
+
     def get_phys_ranges(self):
         """Return all backing storage ranges for this model."""
         ranges = []
@@ -282,26 +530,40 @@ class MemoryModel(object):
 
     def get_location(self, location):
         """Return the location object for a given location."""
+        if self.readers:
+            self.__read('item', location)
         return self.__lookup_segment(location).get_location(location)
 
     def set_location(self, value):
         """Set a given location to a specified value."""
         self.__lookup_segment(value.location).set_location(value)
+        if self.observers:
+            self.__notify('item', value.location, value.width)
 
     def unset_location(self, location):
         """Unset any established value at a given location."""
-        self.__lookup_segment(location).unset_location(location)
+        seg = self.__lookup_segment(location)
+        meta = seg.get_location(location) if self.observers else None
+        seg.unset_location(location)
+        if meta is not None:
+            self.__notify('item', meta.location, meta.width)
 
     def get_label(self, location):
         """Return the label for a given location."""
+        if self.readers:
+            self.__read('label', location)
         return self.__lookup_segment(location).get_label(location)
 
     def set_label(self, location, label):
         """Set a label for a given location."""
         self.__lookup_segment(location).set_label(location, label)
+        if self.observers:
+            self.__notify('label', location)
 
     def generate_comments(self, location):
         """Return aggregated comments for this location."""
+        if self.readers:
+            self.__read('comments', location)
         return self.__lookup_segment(location).generate_comments(location)
 
     def get_references(self, location):
@@ -311,10 +573,20 @@ class MemoryModel(object):
     def add_reference(self, location, reference):
         """Add a refernce to a given location."""
         self.__lookup_segment(location).add_reference(location, reference)
+        if self.observers:
+            self.__notify('xref', location)
 
     def remove_reference(self, location, reference):
         """Remove a reference from a given location."""
-        self.__lookup_segment(location).remove_reference(location, reference)
+        self.__lookup_segment(location).remove_reference(location,
+                                                         reference)
+        if self.observers:
+            self.__notify('xref', location)
+
+    def compact_references(self):
+        """Fold references added during analysis into each segment's index."""
+        for seg in self.segments:
+            seg.compact()
 
     def location_isset(self, location):
         """Return whether a given location exists."""
@@ -1,20 +1,21 @@
 """SH2 disassembler"""
 
 from __future__ import print_function
-from collections import namedtuple
+from collections import deque, namedtuple
 
-try:
-    from Queue import Queue
-except ImportError:
-    from queue import Queue
-
-import struct
+import array
+import bisect
+import heapq
+import weakref
 
 from . import segment
-from .sh2opcodes import OPCODES
+from . import sh2opcodes
 
 
-CodeExtra = namedtuple('CodeExtra', 'text, opcode, args')
+Opcode = namedtuple('Opcode', (
+    'index, opmask, m, n, imm, disp, bits, cmd, args, fmt, disp_sign, '
+    'disp_mult, pc_align, is_mov, is_delayed, is_register_branch, '
+    'is_label_branch, src_r0, dst_r0, load_width'))
 
 
 # Opcodes that use delayed branching; an legal instruction should follow.
@@ -26,6 +27,98 @@ REGISTER_BRANCHERS = ('braf', 'bsrf', 'jsr', 'jmp')
 # Opcodes that branch based on a directly-referenced label.
 LABEL_BRANCHERS = ('bf', 'bf/s', 'bra', 'bsr', 'bt', 'bt/s')
 
+# Dense map of every 16-bit instruction word to its opcode (or None).
+_DECODE_TABLE = None
+
+# Whole-segment decodes produced by predecode(), keyed by memory model.
+_PREDECODED = weakref.WeakKeyDictionary()
+
+# Where each instruction occurs, keyed by memory model; see opcode_index().
+_OPCODE_INDEXES = weakref.WeakKeyDictionary()
+
+
+def compile_opcode(index, entry):
+    """Compile an sh2opcodes registry entry into an Opcode record.
+
+    Everything the decoder would otherwise work out from the mnemonic and
+    argument strings on each instruction is calculated here, once.
+    """
+    cmd = entry['cmd']
+    args = entry['args']
+
+    # 12-bit disp values are signed.
+    if entry['disp'] & 0xF00 != 0:
+        disp_sign = 0x800
+    elif entry['disp'] & 0xF0 != 0:
+        disp_sign = 0x80
+    elif entry['disp'] & 0xF != 0:
+        disp_sign = 0x8
+    else:
+        disp_sign = 0
+
+    # 1-, 2-, or 4-byte multiplier determination.
+    if cmd.endswith('.b'):
+        disp_mult = 1
+    elif cmd.endswith('.l') or cmd == 'mova':
+        disp_mult = 4
+    else:
+        disp_mult = 2
+
+    # Width of the data item a PC-relative load refers to.
+    if cmd.endswith('.l') or args[1].startswith('@('):
+        load_width = 4
+    elif cmd[-2:] == '.w':
+        load_width = 2
+    else:
+        load_width = 1
+
+    fmt = args[0]
+    if fmt != '' and args[1] != '':
+        fmt = fmt + ', ' + args[1]
+
+    return Opcode(
+        index=index, opmask=entry['opmask'], m=entry['m'], n=entry['n'],
+        imm=entry['imm'], disp=entry['disp'], bits=entry['bits'], cmd=cmd,
+        args=args, fmt=fmt, disp_sign=disp_sign, disp_mult=disp_mult,
+        pc_align=(disp_mult == 4), is_mov=cmd.startswith('mov'),
+        is_delayed=(cmd in DELAYED_BRANCHERS),
+        is_register_branch=(cmd in REGISTER_BRANCHERS),
+        is_label_branch=(cmd in LABEL_BRANCHERS),
+        src_r0=(args[0] == 'r0'), dst_r0=(args[1] == 'r0'),
+        load_width=load_width)
+
+
+OPCODES = tuple(compile_opcode(index, entry)
+                for index, entry in enumerate(sh2opcodes.OPCODES))
+
+
+class CodeExtra(object):
+    """A decoded instruction: its raw word, opcode and operand fields.
+
+    The assembly text is only produced when something asks for it (usually
+    final output), and is cached from then on.
+    """
+
+    __slots__ = ('instruction', 'opcode', 'args', '_text')
+
+    def __init__(self, instruction, opcode, args):
+        object.__init__(self)
+        self.instruction = instruction
+        self.opcode = opcode
+        self.args = args
+        self._text = None
+
+    @property
+    def text(self):
+        """The assembly text for this instruction."""
+        if self._text is None:
+            opcode = self.opcode
+            if opcode.fmt != '':
+                self._text = '%s %s' % (opcode.cmd, opcode.fmt % self.args)
+            else:
+                self._text = opcode.cmd
+        return self._text
+
 
 class DataField(segment.SegmentData):
     """Metaclass for SH2 data types."""
@@ -51,7 +144,7 @@ class ByteField(DataField):
             kwargs['unknown_prefix'] = 'byte'
         DataField.__init__(self, *args, **kwargs)
         try:
-            self.extra = ord(self.model.get_phys(self.location, 1))
+            self.extra = self.model.read_u8(self.location)
         except segment.SegmentError:
             self.extra = None
 
@@ -70,8 +163,7 @@ class WordField(DataField):
         kwargs['unknown_prefix'] = 'word'
         DataField.__init__(self, *args, **kwargs)
         try:
-            phys = self.model.get_phys(self.location, 2)
-            self.extra = struct.unpack('>H', phys)[0]
+            self.extra = self.model.read_u16be(self.location)
         except segment.SegmentError:
             self.extra = None
 
@@ -84,8 +176,7 @@ class LongField(DataField):
         kwargs['unknown_prefix'] = 'long'
         DataField.__init__(self, *args, **kwargs)
         try:
-            phys = self.model.get_phys(self.location, 4)
-            self.extra = struct.unpack('>L', phys)[0]
+            self.extra = self.model.read_u32be(self.location)
         except segment.SegmentError:
             self.extra = None
 
@@ -120,7 +211,7 @@ class CodeField(DataField):
         DataField.__init__(self, *args, **kwargs)
 
     def get_instruction(self, no_cmd=False):
-        if 'label' in self.extra.text and not no_cmd:
+        if 'label' in self.extra.opcode.fmt and not no_cmd:
             tgt = self.extra.args['target']
             label = self.model.get_label(tgt)
             if label is None:
@@ -144,7 +235,7 @@ class CodeField(DataField):
                         if t2label is None:
                             t2label = '0x%X' % meta.extra
                         comments.append('[%s] = %s' % (label, t2label))
-                    elif 'label' not in self.extra.text:
+                    elif 'label' not in self.extra.opcode.fmt:
                         if isinstance(meta, (WordField, ByteField)):
                             comments.append('[%s] = 0x%X' % (label,
                                                              meta.extra))
@@ -176,22 +267,14 @@ class AssemblyError(Exception):
 def parse_args(instruction, opcode):
     """Given an instruction and an opcode, return a dict representing them."""
     realop = {}
-    if opcode['m'][0] != 0:
-        realop['m'] = (instruction & opcode['m'][0]) >> opcode['m'][1]
-    else:
-        realop['m'] = None
-    if opcode['n'][0] != 0:
-        realop['n'] = (instruction & opcode['n'][0]) >> opcode['n'][1]
-    else:
-        realop['n'] = None
-    if opcode['imm'][0] != 0:
-        realop['imm'] = (instruction & opcode['imm'][0]) >> opcode['imm'][1]
-    else:
-        realop['imm'] = None
-    if opcode['disp'] != 0:
-        realop['disp'] = instruction & opcode['disp']
-    else:
-        realop['disp'] = None
+    mask, shift = opcode.m
+    realop['m'] = (instruction & mask) >> shift if mask != 0 else None
+    mask, shift = opcode.n
+    realop['n'] = (instruction & mask) >> shift if mask != 0 else None
+    mask, shift = opcode.imm
+    realop['imm'] = (instruction & mask) >> shift if mask != 0 else None
+    mask = opcode.disp
+    realop['disp'] = instruction & mask if mask != 0 else None
     return realop
 
 
@@ -199,39 +282,22 @@ def calculate_disp_target(opcode, args, progc):
     """Calculate the target of an opcode, given it's args and PC."""
     disp = args['disp']
     if disp is not None:
-        # 12-bit disp values are signed.
-        # sign = 0x800 if opcode['disp'] & 0xF00 != 0 else 0
-        sign = 0
-        if opcode['disp'] & 0xF00 != 0:
-            sign = 0x800
-        elif opcode['disp'] & 0xF0 != 0:
-            sign = 0x80
-        elif opcode['disp'] & 0xF != 0:
-            sign = 0x8
-        else:
-            sign = 0
-
-        # 1-, 2-, or 4-byte multiplier determination.
-        if opcode['cmd'].endswith('.b'):
-            disp_mult = 1
-        elif opcode['cmd'].endswith('.l') or opcode['cmd'] == 'mova':
-            disp_mult = 4
-        else:
-            disp_mult = 2
+        sign = opcode.disp_sign
+        disp_mult = opcode.disp_mult
 
-        if disp & sign != 0 and not opcode['cmd'].startswith('mov'):
+        if disp & sign != 0 and not opcode.is_mov:
             target = -((sign << 1) - ((disp - sign) * disp_mult))
         else:
             target = disp * disp_mult
 
         # Long disp values require a PC alignment mask.
-        if disp_mult == 4:
+        if opcode.pc_align:
             target += (progc & 0xFFFFFFFC) + 4
         else:
             target += progc + 4
 
         args['target'] = target
-        args['disp'] *= disp_mult
+        args['disp'] = disp * disp_mult
     else:
         args['target'] = disp
 
@@ -239,15 +305,13 @@ def calculate_disp_target(opcode, args, progc):
 def track_registers(opcode, args, location, registers, model):
     """Track register assignments."""
     nval = args['n']
-    if nval is None:
-        if opcode['args'][1] == 'r0':
-            nval = 0
+    if nval is None and opcode.dst_r0:
+        nval = 0
     if nval is not None:
-        if opcode['cmd'].startswith('mov'):
+        if opcode.is_mov:
             mval = args['m']
-            if mval is None:
-                if opcode['args'][0] == 'r0':
-                    mval = 0
+            if mval is None and opcode.src_r0:
+                mval = 0
             if mval is None:
                 if args['imm'] is not None:
                     registers[nval] = args['imm']
@@ -256,11 +320,10 @@ def track_registers(opcode, args, location, registers, model):
                     target = args['target']
                     meta = model.get_location(target)
                     if meta is None:
-                        if (opcode['cmd'].endswith('.l') or
-                                opcode['args'][1].startswith('@(')):
+                        if opcode.load_width == 4:
                             meta = LongField(location=target, model=model)
                             model.set_location(meta)
-                        elif opcode['cmd'][-2:] == '.w':
+                        elif opcode.load_width == 2:
                             meta = WordField(location=target, model=model)
                             model.set_location(meta)
                         else:
@@ -277,41 +340,346 @@ def track_registers(opcode, args, location, registers, model):
         registers[nval] = None
 
 
+def decode_table():
+    """Return a table mapping every instruction word to its opcode.
+
+    SH2 instructions are a fixed 16 bits wide, so rather than matching each
+    word against the registry we expand every opcode's don't-care bits once
+    per process. Words that match nothing map to None.
+    """
+    global _DECODE_TABLE  # pylint: disable=global-statement
+    if _DECODE_TABLE is None:
+        table = [None, ] * 0x10000
+        # Walk backwards so earlier registry entries take precedence.
+        for opcode in reversed(OPCODES):
+            instbits, instmask = opcode.opmask
+            free = ~instmask & 0xFFFF
+            bits = free
+            while True:
+                table[instbits | bits] = opcode
+                if bits == 0:
+                    break
+                bits = (bits - 1) & free
+        _DECODE_TABLE = table
+    return _DECODE_TABLE
+
+
 def lookup_instruction(instruction):
     """Perform a basic lookup of the instruction in our registry."""
-    # TODO: brute force sucks, we can do much better here.
-    for opcode in OPCODES:
-        instbits, instmask = opcode['opmask']
-        if instruction & instmask == instbits:
-            args = parse_args(instruction, opcode)
-            return opcode, args
-    raise AssemblyError('no matching instruction for %#x' % instruction)
+    opcode = (_DECODE_TABLE or decode_table())[instruction]
+    if opcode is None:
+        raise AssemblyError('no matching instruction for %#x' % instruction)
+    return opcode, parse_args(instruction, opcode)
+
+
+class Predecoded(object):
+    """Every aligned word of a physical segment, decoded into columns."""
+
+    def __init__(self, start, words, opcode, m, n, imm, disp, target):
+        object.__init__(self)
+        self.start = start
+        self.end = start + (len(words) * 2)
+        self.words = words
+        self.opcode = opcode
+        self.m = m
+        self.n = n
+        self.imm = imm
+        self.disp = disp
+        self.target = target
+
+    def covers(self, location):
+        """Return whether a given location was predecoded."""
+        return (self.start <= location < self.end and
+                (location - self.start) & 1 == 0)
+
+    def lookup(self, location):
+        """Return the instruction word, opcode and args at a location."""
+        i = (location - self.start) >> 1
+        instruction = self.words[i]
+        index = self.opcode[i]
+        if index < 0:
+            raise AssemblyError(
+                'no matching instruction for %#x' % instruction)
+        opcode = OPCODES[index]
+        args = {
+            'm': self.m[i] if opcode.m[0] != 0 else None,
+            'n': self.n[i] if opcode.n[0] != 0 else None,
+            'imm': self.imm[i] if opcode.imm[0] != 0 else None,
+        }
+        if opcode.disp != 0:
+            args['disp'] = self.disp[i]
+            args['target'] = self.target[i]
+        else:
+            args['disp'] = args['target'] = None
+        return instruction, opcode, args
+
+
+def _column(typecode, values):
+    """Convert a numpy column into a compact array for scalar access."""
+    column = array.array(typecode)
+    column.frombytes(values.astype(typecode).tobytes())
+    return column
+
+
+def predecode(model):
+    """Decode every aligned word of the model's physical segments at once.
+
+    This is an optional pre-pass: once it has run, disassemble() reads each
+    instruction's opcode, operands and branch target from the precomputed
+    columns rather than decoding words one at a time. It requires numpy;
+    without it this returns False and disassembly decodes lazily as usual.
+    """
+    # numpy takes longer to import than the rest of sh2dis put together, so
+    # it is only imported here, when it is actually wanted.
+    try:
+        import numpy
+    except ImportError:
+        return False
+
+    index = numpy.full(0x10000, len(OPCODES), dtype=numpy.int16)
+    for opcode, entry in enumerate(decode_table()):
+        if entry is not None:
+            index[opcode] = entry.index
+
+    # One extra all-zero row describes words that match no opcode.
+    def field(getter):
+        return numpy.array([getter(op) for op in OPCODES] + [0],
+                           dtype=numpy.int64)
+    m_mask, m_shift = field(lambda op: op.m[0]), field(lambda op: op.m[1])
+    n_mask, n_shift = field(lambda op: op.n[0]), field(lambda op: op.n[1])
+    i_mask, i_shift = field(lambda op: op.imm[0]), field(lambda op: op.imm[1])
+    d_mask = field(lambda op: op.disp)
+    d_sign = field(lambda op: op.disp_sign)
+    d_mult = field(lambda op: op.disp_mult)
+    signed = field(lambda op: not op.is_mov).astype(bool)
+    aligned = field(lambda op: op.pc_align).astype(bool)
+
+    decoded = []
+    for seg in model.segments:
+        if seg.phys is None:
+            continue
+        count = (seg.end - seg.start) // 2
+        words = numpy.frombuffer(seg.phys, dtype='>u2', count=count)
+        words = words.astype(numpy.int64)
+        ops = index[words]
+
+        disp = words & d_mask[ops]
+        sign = d_sign[ops]
+        mult = d_mult[ops]
+        negative = ((disp & sign) != 0) & signed[ops]
+        target = numpy.where(negative, -((sign << 1) - ((disp - sign) * mult)),
+                             disp * mult)
+        progc = seg.start + (numpy.arange(count, dtype=numpy.int64) * 2)
+        target += numpy.where(aligned[ops], (progc & 0xFFFFFFFC) + 4,
+                              progc + 4)
+
+        decoded.append(Predecoded(
+            start=seg.start,
+            words=_column('H', words),
+            opcode=_column('h', numpy.where(ops == len(OPCODES), -1, ops)),
+            m=_column('B', (words & m_mask[ops]) >> m_shift[ops]),
+            n=_column('B', (words & n_mask[ops]) >> n_shift[ops]),
+            imm=_column('B', (words & i_mask[ops]) >> i_shift[ops]),
+            disp=_column('H', disp * mult),
+            target=_column('q', target)))
+    _PREDECODED[model] = decoded
+    return True
+
+
+def decode(instruction, progc):
+    """Decode an instruction word at a given PC into its opcode and args."""
+    opcode, args = lookup_instruction(instruction)
+    calculate_disp_target(opcode, args, progc)
+    return opcode, args
 
 
 def disasm_single(instruction, progc, registers, model):
     """Disassemble a single instruction."""
-    opcode, args = lookup_instruction(instruction)
-    calculate_disp_target(opcode, args, progc)
+    opcode, args = decode(instruction, progc)
+    return disasm_decoded(instruction, opcode, args, progc, registers, model)
+
+
+def disasm_decoded(instruction, opcode, args, progc, registers, model):
+    """Produce a CodeField for an already-decoded instruction."""
     track_registers(opcode, args, progc, registers, model)
-    instr = [opcode['cmd'], ]
-    if opcode['args'][0] != '':
-        aval = opcode['args'][0]
-        if opcode['args'][1] != '':
-            aval = aval + ', ' + opcode['args'][1]
-        aval = aval % args
-        instr += [aval, ]
-    extra = CodeExtra(' '.join(instr), opcode, args)
+    extra = CodeExtra(instruction, opcode, args)
     return CodeField(location=progc, width=2, extra=extra, model=model)
 
 
-def disassemble(locations, model, callback=None):
-    """Given a memory model and a set of locations within it, disassemble."""
-    work_queue = Queue()
+class OpcodeIndex(object):
+    """The addresses of every instruction in a model, grouped by mnemonic.
+
+    The index observes its model: each change to an item is queued as the
+    address range it covered, and the ranges queued are only looked up
+    again when the index is next queried. Only addresses are kept, never
+    the items, and the model is only referred to weakly, since the index
+    is keyed by it.
+    """
+
+    def __init__(self, model):
+        object.__init__(self)
+        self.model = weakref.ref(model)
+        self.changes = []  # (start, end) of each item changed since
+        self.addresses = {}  # cmd -> sorted array of locations
+        added = {}
+        for seg in model.segments:
+            for meta in seg.iter_locations(seg.start, seg.end):
+                if isinstance(meta, CodeField):
+                    added.setdefault(meta.extra.opcode.cmd, []).append(
+                        meta.location)
+        for cmd, locations in added.items():
+            self.addresses[cmd] = array.array('I', locations)
+        model.observers.append(self.changed)
+
+    def changed(self, kind, location, width):
+        """Observe a change to the model."""
+        if kind == 'item':
+            self.changes.append((location, location + width))
+
+    def __update(self):
+        model = self.model()
+        changes = sorted(self.changes)
+        self.changes = []
+        if model is None:
+            return
+        spans = []
+        for start, end in changes:
+            if spans and start <= spans[-1][1]:
+                spans[-1][1] = max(spans[-1][1], end)
+            else:
+                spans.append([start, end])
+        added = {}
+        for start, end in spans:
+            for meta in model.get_segment(start).iter_locations(start, end):
+                if isinstance(meta, CodeField):
+                    added.setdefault(meta.extra.opcode.cmd, []).append(
+                        meta.location)
+        for cmd in set(self.addresses).union(added):
+            old = self.addresses.get(cmd, ())
+            locations = added.get(cmd, [])
+            bounds = [(bisect.bisect_left(old, start),
+                       bisect.bisect_left(old, end)) for start, end in spans]
+            if not locations and all(first == last
+                                     for first, last in bounds):
+                continue
+            kept = 0
+            for first, last in bounds:
+                locations.extend(old[kept:first])
+                kept = last
+            locations.extend(old[kept:])
+            if locations:
+                self.addresses[cmd] = array.array('I', sorted(locations))
+            else:
+                del self.addresses[cmd]
+
+    def locations(self, cmd):
+        """Return the sorted addresses of a given instruction."""
+        if self.changes:
+            self.__update()
+        return self.addresses.get(cmd, array.array('I'))
+
+    def commands(self):
+        """Return every mnemonic indexed, sorted."""
+        if self.changes:
+            self.__update()
+        return sorted(self.addresses)
+
+
+def opcode_index(model):
+    """Return the OpcodeIndex for a model.
+
+    It is built from the model's CodeFields on first use, and kept up to
+    date with the model from then on.
+    """
+    index = _OPCODE_INDEXES.get(model)
+    if index is None:
+        index = _OPCODE_INDEXES[model] = OpcodeIndex(model)
+    return index
+
+
+# Register state with nothing known.
+UNKNOWN_REGISTERS = (None, ) * 16
+
+
+def meet(left, right):
+    """Merge two register states; values they disagree on become unknown."""
+    return tuple(lval if lval == rval else None
+                 for lval, rval in zip(left, right))
+
+
+class WorkList(object):
+    """Pending disassembly targets for a single-threaded traversal.
+
+    A location is only ever queued once while it is pending: scheduling it
+    again just records the extra reference, and every reference collected
+    for it is handed back together when it is popped. Targets come back in
+    the order they were first scheduled, or lowest address first when
+    ordered is set.
+
+    Register states pushed along with a location are merged the same way,
+    and left in states for the caller to collect when it pops it.
+    """
+
+    def __init__(self, ordered=False):
+        object.__init__(self)
+        self.ordered = ordered
+        self.pending = {}  # location -> [reference, ...]
+        self.states = {}  # location -> register state
+        self.queue = [] if ordered else deque()
+        self.pushes = 0
+        self.merged = 0
+
+    def __len__(self):
+        return len(self.pending)
+
+    def push(self, location, reference, state=None):
+        """Schedule a location, noting where it was referenced from."""
+        self.pushes += 1
+        if state is not None:
+            merged = self.states.get(location)
+            self.states[location] = (state if merged is None
+                                     else meet(merged, state))
+        references = self.pending.get(location)
+        if references is not None:
+            references.append(reference)
+            self.merged += 1
+            return
+        self.pending[location] = [reference, ]
+        if self.ordered:
+            heapq.heappush(self.queue, location)
+        else:
+            self.queue.append(location)
+
+    def pop(self):
+        """Return the next location and all references collected for it."""
+        if self.ordered:
+            location = heapq.heappop(self.queue)
+        else:
+            location = self.queue.popleft()
+        return location, self.pending.pop(location)
+
+
+def disassemble(locations, model, callback=None, ordered=False,
+                dataflow=False):
+    """Given a memory model and a set of locations within it, disassemble.
+
+    With dataflow set, register values are carried across branches: each
+    target starts from the registers at the branch that reached it (after
+    any delay slot), states arriving at the same place are merged, and code
+    is only walked again when the merged state reaching it changes. This
+    resolves register branches whose targets were loaded before a branch.
+    """
+    decoded = _PREDECODED.get(model, ())
+    work_list = WorkList(ordered)
+    # Location -> register state it has been walked with.
+    walked = {} if dataflow else None
     for location, reference in locations:
-        work_queue.put((location, reference), False)
+        work_list.push(location, reference,
+                       UNKNOWN_REGISTERS if dataflow else None)
 
-    while not work_queue.empty():
-        location, reference = work_queue.get()
+    while work_list:
+        location, references = work_list.pop()
+        state = work_list.states.pop(location, None)
 
         # Quick check to make sure we haven't already processed this location.
         try:
@@ -321,54 +689,120 @@ def disassemble(locations, model, callback=None):
             print('Error was: %s' % segerr)
             continue
         if isinstance(meta, CodeField):
-            model.add_reference(meta.location, reference)
-            continue
+            for reference in references:
+                model.add_reference(meta.location, reference)
+            if walked is None:
+                continue
+            references = None
 
-        registers = [None, ] * 16
+        registers = [None, ] * 16 if state is None else list(state)
         branching = False
         branch_countdown = 0
+        deferred = []
 
         while not branching or branch_countdown >= 0:
+            if walked is not None:
+                seen = walked.get(location)
+                if seen is not None:
+                    merged = meet(seen, registers)
+                    if merged == seen:
+                        if deferred:
+                            # A delay slot walked before, maybe from another
+                            # path; it still runs before the branch.
+                            try:
+                                slot = model.get_location(location)
+                            except segment.SegmentError:
+                                slot = None
+                            if isinstance(slot, CodeField):
+                                track_registers(slot.extra.opcode,
+                                                slot.extra.args, location,
+                                                registers, model)
+                            else:
+                                deferred = []
+                        break
+                    registers[:] = merged
+                walked[location] = tuple(registers)
+
             try:
-                model.get_location(location)
-                phys = model.get_phys(location, 2)
+                existing = model.get_location(location)
+                for columns in decoded:
+                    if columns.covers(location):
+                        break
+                else:
+                    columns = None
+                    instruction = model.read_u16be(location)
             except segment.SegmentError:
+                # A branch whose delay slot can't run is never taken.
+                deferred = []
                 break
 
-            instruction = struct.unpack('>H', phys)[0]
-            try:
-                code = disasm_single(instruction, location, registers, model)
-            except AssemblyError as assemerr:
-                print('Unable to disassemble location 0x%x, giving up on that path' % location)
-                print('Error was: %s' % assemerr)
-                break
-            model.set_location(code)
+            resolved = False
+            if walked is not None and isinstance(existing, CodeField):
+                # Walking known code again with new register values.
+                code = existing
+                track_registers(code.extra.opcode, code.extra.args, location,
+                                registers, model)
+            else:
+                try:
+                    if columns is not None:
+                        instruction, opcode, args = columns.lookup(location)
+                    else:
+                        opcode, args = decode(instruction, location)
+                    code = disasm_decoded(instruction, opcode, args, location,
+                                          registers, model)
+                except AssemblyError as assemerr:
+                    print('Unable to disassemble location 0x%x, giving up on that path' % location)
+                    print('Error was: %s' % assemerr)
+                    deferred = []
+                    break
+                model.set_location(code)
+                existing = None
 
             # Handle register-based branches.
-            if code.extra.opcode['cmd'] in REGISTER_BRANCHERS:
-                reg = registers[code.extra.args['m']]
-                if reg is not None:
-                    code.extra.args['target'] = reg
-                    work_queue.put((reg, location), False)
-
-            elif code.extra.opcode['cmd'] in LABEL_BRANCHERS:
-                work_queue.put((code.extra.args['target'], location), False)
+            target = None
+            if code.extra.opcode.is_register_branch:
+                target = registers[code.extra.args['m']]
+                if target is not None:
+                    resolved = code.extra.args.get('target') is None
+                    code.extra.args['target'] = target
 
-            if reference is not None:
-                model.add_reference(code.location, reference)
-                reference = None
+            elif code.extra.opcode.is_label_branch:
+                target = code.extra.args['target']
 
-            if callback is not None:
+            if target is not None:
+                if walked is None:
+                    work_list.push(target, location)
+                elif code.extra.opcode.cmd in ('bt', 'bf'):
+                    work_list.push(target, location, tuple(registers))
+                else:
+                    # The delay slot runs before the branch is taken.
+                    deferred.append((target, location))
+
+            if references:
+                for reference in references:
+                    if reference is not None:
+                        model.add_reference(code.location, reference)
+                references = None
+
+            if callback is not None and (existing is None or resolved):
                 callback(code, registers, model)
 
-            if code.extra.opcode['cmd'] in DELAYED_BRANCHERS:
+            if code.extra.opcode.is_delayed:
                 branch_countdown = 1
                 branching = True
             if branching:
                 branch_countdown -= 1
 
+            if deferred and deferred[-1][1] != location:
+                for target, source in deferred:
+                    work_list.push(target, source, tuple(registers))
+                deferred = []
+
             location += 2
 
+        for target, source in deferred:
+            work_list.push(target, source, tuple(registers))
+
 
 if __name__ == '__main__':
     print('no tests yet')
@@ -0,0 +1,206 @@
+"""Stage timings and counters for a disassembly run.
+
+Nothing is recorded unless a collection is active:
+
+    with stats.collect() as run:
+        model = pipeline.build_model(phys, mitsu=True)
+    print(json.dumps(run.report(), indent=2))
+
+Pipeline stages are timed as they run. Counters are mostly read off state
+the analysis keeps anyway (work lists, segment conflict counts, the xref
+index) when the report is made; labels_synthesized counts the labels made
+up for unlabelled locations as they are rendered, so it is zero until the
+listing is. With profile set, decoding, register
+tracking, item placement and the Mitsubishi callback are also timed, by
+rebinding them to timing wrappers for the duration; that adds some
+overhead to the stage times, but none at all once the collection ends.
+"""
+
+from __future__ import print_function
+
+try:
+    from time import perf_counter as clock
+except ImportError:
+    from time import time as clock
+
+import contextlib
+
+from . import mitsubishi
+from . import segment
+from . import sh2
+
+
+# The collection in progress, if any.
+ACTIVE = None
+
+# (owner, attribute, name) for the functions timed when profiling.
+PROFILED = (
+    (sh2, 'decode', 'decode'),
+    (sh2, 'track_registers', 'track_registers'),
+    (segment.Segment, 'set_location', 'set_location'),
+    (mitsubishi, 'callback', 'mitsubishi_callback'),
+    (sh2.Predecoded, 'lookup', 'predecoded_lookup'),
+)
+
+
+class _Nothing(object):
+    """A stage timer that does nothing, for when no collection is active."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NOTHING = _Nothing()
+
+
+class _Stage(object):
+    """Adds the time spent inside a with block to a named stage."""
+
+    def __init__(self, stages, name):
+        object.__init__(self)
+        self.stages = stages
+        self.name = name
+        self.started = None
+
+    def __enter__(self):
+        self.started = clock()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stages[self.name] = (self.stages.get(self.name, 0.0) +
+                                  clock() - self.started)
+        return False
+
+
+class Stats(object):
+    """What was recorded during one collection."""
+
+    def __init__(self):
+        object.__init__(self)
+        self.stages = {}  # stage -> seconds
+        self.functions = {}  # profiled function -> [calls, seconds]
+        self.models = []
+        self.work_lists = []
+        self.items = 0
+        self.xrefs = 0
+
+    def stage(self, name):
+        """Return a context manager timing a named stage."""
+        return _Stage(self.stages, name)
+
+    def watch(self, model):
+        """Count the changes made to a memory model from now on."""
+        if model not in self.models:
+            self.models.append(model)
+            model.observers.append(self.changed)
+
+    def changed(self, kind, _location, _width):
+        """Observe a change to a watched model."""
+        if kind == 'item':
+            self.items += 1
+        elif kind == 'xref':
+            self.xrefs += 1
+
+    def timed(self, name, func):
+        """Return func wrapped to add its calls and time to a name."""
+        totals = self.functions.setdefault(name, [0, 0.0])
+
+        def timed(*args, **kwargs):
+            started = clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                totals[0] += 1
+                totals[1] += clock() - started
+        return timed
+
+    def report(self):
+        """Return everything recorded, as a JSON-serializable dict."""
+        counters = {
+            'worklist_pushes': sum(wl.pushes for wl in self.work_lists),
+            'worklist_duplicates': sum(wl.merged for wl in self.work_lists),
+            'items_set': self.items,
+            'xrefs_added': self.xrefs,
+            'instructions': 0,
+            'items_replaced': 0,
+            'set_location_conflicts': 0,
+            'xref_targets': 0,
+            'labels': 0,
+            'labels_synthesized': 0,
+            'mitsubishi_axes': 0,
+        }
+        for model in self.models:
+            counters['mitsubishi_axes'] += len(mitsubishi.get_axes(model))
+            for seg in model.segments:
+                counters['items_replaced'] += seg.replaced
+                counters['set_location_conflicts'] += seg.conflicts
+                counters['labels'] += len(seg.labels)
+                counters['labels_synthesized'] += len(seg.synthesized)
+                counters['instructions'] += sum(
+                    1 for meta in seg.iter_locations(seg.start, seg.end)
+                    if isinstance(meta, sh2.CodeField))
+                counters['xref_targets'] += sum(
+                    1 for _ in seg.iter_references())
+        # Instructions come from the predecoded columns where there are
+        # any, and from decode() everywhere else.
+        decoded = [self.functions[name][0]
+                   for name in ('decode', 'predecoded_lookup')
+                   if name in self.functions]
+        if decoded:
+            counters['instructions_decoded'] = sum(decoded)
+        report = {'stages': dict(self.stages), 'counters': counters}
+        if self.functions:
+            report['functions'] = dict(
+                (name, {'calls': calls, 'seconds': seconds})
+                for name, (calls, seconds) in self.functions.items())
+        return report
+
+
+def stage(name):
+    """Return a context manager timing a named stage, if collecting."""
+    if ACTIVE is None:
+        return _NOTHING
+    return ACTIVE.stage(name)
+
+
+def watch(model):
+    """Count the changes made to a memory model, if collecting."""
+    if ACTIVE is not None:
+        ACTIVE.watch(model)
+
+
+@contextlib.contextmanager
+def collect(profile=False):
+    """Record timings and counters for everything run in the with block."""
+    global ACTIVE  # pylint: disable=global-statement
+    if ACTIVE is not None:
+        raise RuntimeError('a stats collection is already active')
+    stats = ACTIVE = Stats()
+
+    work_list = sh2.WorkList
+
+    class CountedWorkList(work_list):
+        """A WorkList whose counters are kept for the report."""
+
+        def __init__(self, ordered=False):
+            work_list.__init__(self, ordered)
+            stats.work_lists.append(self)
+
+    originals = [(sh2, 'WorkList', work_list)]
+    sh2.WorkList = CountedWorkList
+    if profile:
+        for owner, attribute, name in PROFILED:
+            func = owner.__dict__[attribute]
+            originals.append((owner, attribute, func))
+            setattr(owner, attribute, stats.timed(name, func))
+    try:
+        yield stats
+    finally:
+        for owner, attribute, func in reversed(originals):
+            setattr(owner, attribute, func)
+        for model in stats.models:
+            model.observers.remove(stats.changed)
+        ACTIVE = None
@@ -0,0 +1,273 @@
+"""Deterministic synthetic ECU ROMs, for benchmarking and experiments.
+
+Real calibrations can't be shared, so this builds stand-ins with the same
+shape: a vector table, a call graph of small functions with literal pools,
+MOVA jump tables, Mitsubishi-style axis and table lookups through 0xC28,
+0xCC6 and 0xE02, a MUT table, and large runs of 0xFF free space. The same
+size and seed always produce the same image.
+"""
+
+from __future__ import print_function
+
+import random
+import struct
+import sys
+
+
+# Mitsubishi lookup helpers: byte tables, axes and word tables.
+BYTE_TABLE_LOOKUP = 0xC28
+AXIS_LOOKUP = 0xCC6
+WORD_TABLE_LOOKUP = 0xE02
+
+# Initial stack pointer for each supported ROM size.
+STACK_POINTERS = {
+    0x40000: 0xFFFFAFFC,  # SH7052
+    0x80000: 0xFFFFDFFC,  # SH7055
+}
+
+# RAM addresses that variables, axes and tables refer to.
+RAM_START = 0xFFFF8000
+RAM_END = 0xFFFFA000
+
+# Instruction words.
+NOP = 0x0009
+RTS = 0x000B
+SHLL2 = 0x4008
+JSR_R1 = 0x410B
+
+
+class RomBuilder(object):
+    """Lays out code and data in a ROM image, one function at a time."""
+
+    def __init__(self, size, seed=1):
+        object.__init__(self)
+        if size not in STACK_POINTERS:
+            raise ValueError('unsupported ROM size %#x' % size)
+        self.size = size
+        self.random = random.Random(seed)
+        self.rom = bytearray(b'\xFF' * size)
+        self.functions = []
+        self.axes = []
+        self.data_next = None
+        self.mut_placed = False
+
+    def write_word(self, location, value):
+        """Store a big-endian word."""
+        struct.pack_into('>H', self.rom, location, value & 0xFFFF)
+
+    def write_long(self, location, value):
+        """Store a big-endian long-word."""
+        struct.pack_into('>L', self.rom, location, value & 0xFFFFFFFF)
+
+    def alloc(self, length):
+        """Reserve a long-aligned block in the data area."""
+        location = self.data_next
+        self.data_next = (location + length + 3) & ~3
+        return location
+
+    def ram_address(self, align=2):
+        """Return a random RAM address."""
+        return self.random.randrange(RAM_START, RAM_END) & ~(align - 1)
+
+    def add_axis(self):
+        """Lay out an axis; returns its location and result address."""
+        points = self.random.randrange(4, 12)
+        location = self.alloc(10 + 2 * points)
+        result = self.ram_address()
+        self.write_long(location, result)
+        self.write_long(location + 4, self.ram_address())
+        self.write_word(location + 8, points)
+        for i in range(points):
+            self.write_word(location + 10 + 2 * i, i * 100)
+        self.axes.append((location, result))
+        return location, result
+
+    def add_table(self, word, yaxis, xaxis=None):
+        """Lay out a 2D (or with xaxis, 3D) byte or word table."""
+        width = 2 if word else 1
+        dims = 2 if xaxis is None else 3
+        header = 4 + 2 * width + (4 + width if xaxis is not None else 0)
+        location = self.alloc(header + 16 * 16 * width)
+        pack = self.write_word if word else self.rom.__setitem__
+        pack(location, dims)
+        pack(location + width, 0)
+        self.write_long(location + 2 * width, yaxis)
+        position = 4 + 2 * width
+        if xaxis is not None:
+            self.write_long(location + position, xaxis)
+            position += 4
+            pack(location + position, 8)
+            position += width
+        for i in range(12 * 12 * width):
+            self.rom[location + position + i] = self.random.randrange(256)
+        return location
+
+    def add_mut_table(self, entries=32):
+        """Lay out a MUT table of RAM addresses, ending in 0xFFFFFFFF."""
+        location = self.alloc(4 * (entries + 8))
+        for i in range(entries):
+            self.write_long(location + 4 * i, RAM_START + 0x100 + 2 * i)
+        self.write_long(location + 4 * entries, 0xFFFFFFFF)
+        return location
+
+    def plan_functions(self):
+        """Choose where each function starts, and where data begins."""
+        count = self.size // 0x800
+        location = 0x1000
+        for _ in range(count):
+            self.functions.append(location)
+            location += self.random.randrange(20, 60) * 2 + 0x100
+            location = (location + 3) & ~3
+        self.data_next = location + 0x400
+
+    def build_function(self, index):
+        """Generate one function, its jump table and its literal pool."""
+        rnd = self.random
+        start = self.functions[index]
+        code = []
+        literals = []  # (code index, value, width)
+        movas = []
+
+        def load(register, value, width=4):
+            literals.append((len(code), value, width))
+            code.append((0xD000 if width == 4 else 0x9000) | (register << 8))
+
+        def call(target):
+            load(1, target)
+            code.extend((JSR_R1, NOP))
+
+        for _ in range(rnd.randrange(10, 40)):
+            choice = rnd.random()
+            if choice < 0.25:    # mov #imm, rn
+                code.append(0xE000 | (rnd.randrange(16) << 8) |
+                            rnd.randrange(256))
+            elif choice < 0.35:  # add #imm, rn
+                code.append(0x7000 | (rnd.randrange(16) << 8) |
+                            rnd.randrange(256))
+            elif choice < 0.45:  # mov rm, rn
+                code.append(0x6003 | (rnd.randrange(16) << 8) |
+                            (rnd.randrange(16) << 4))
+            elif choice < 0.55:  # shll rn
+                code.append(0x4000 | (rnd.randrange(16) << 8))
+            elif choice < 0.62:
+                call(rnd.choice(self.functions))
+            elif choice < 0.68:  # bsr
+                target = rnd.choice(self.functions)
+                disp = (target - (start + 2 * len(code)) - 4) // 2
+                if -2048 <= disp < 2048:
+                    code.extend((0xB000 | (disp & 0xFFF), NOP))
+            elif choice < 0.74:  # bt/bf over nothing
+                code.append(rnd.choice((0x8900, 0x8B00)))
+            elif choice < 0.78:
+                load(rnd.randrange(2, 8), self.ram_address(4))
+            elif choice < 0.82:
+                load(rnd.randrange(2, 8), rnd.randrange(0x8000), 2)
+            elif choice < 0.86:
+                axis, result = self.add_axis()
+                load(4, axis)
+                call(AXIS_LOOKUP)
+                if rnd.random() < 0.5 and len(self.axes) > 1:
+                    xaxis = None
+                    if rnd.random() < 0.5:
+                        xaxis = self.axes[-2][1]
+                    word = rnd.random() < 0.5
+                    load(4, self.add_table(word, result, xaxis))
+                    call(WORD_TABLE_LOOKUP if word else BYTE_TABLE_LOOKUP)
+            elif choice < 0.88 and not self.mut_placed and index > 3:
+                # mov.w #0xBF ; shll2 ; mov.l MUT_TABLE
+                load(3, 0xBF, 2)
+                code.append(SHLL2)
+                load(2, self.add_mut_table())
+                self.mut_placed = True
+            elif choice < 0.90:
+                movas.append(len(code))
+                code.append(0xC700)
+        code.extend((RTS, NOP))
+
+        end = start + 2 * len(code)
+        if movas:
+            end = self.add_jump_table(start, code, movas)
+        self.place_literals(start, code, literals, (end + 3) & ~3)
+        for i, word in enumerate(code):
+            self.write_word(start + 2 * i, word)
+
+    def add_jump_table(self, start, code, movas, cases=3):
+        """Point the first MOVA at a jump table after the code; NOP the rest.
+
+        Returns the first free location after the table and its cases.
+        """
+        table = (start + 2 * len(code) + 3) & ~3
+        case = table + 2 * cases
+        for i in range(cases):
+            self.write_word(table + 2 * i, case - table)
+            self.write_word(case, 0xE000 | (i << 8) | i)
+            self.write_word(case + 2, 0x7001)
+            self.write_word(case + 4, RTS)
+            self.write_word(case + 6, NOP)
+            case += 8
+        mova = start + 2 * movas[0]
+        code[movas[0]] = 0xC700 | ((table - ((mova & ~3) + 4)) // 4)
+        for i in movas[1:]:
+            code[i] = NOP
+        return case
+
+    def place_literals(self, start, code, literals, pool):
+        """Lay out the literal pool and fix up the loads that use it."""
+        for i, (index, value, width) in enumerate(literals):
+            location = pool + 4 * i
+            pc = start + 2 * index
+            if width == 4:
+                self.write_long(location, value)
+                disp = (location - ((pc & ~3) + 4)) // 4
+            else:
+                self.write_word(location, value)
+                disp = (location - (pc + 4)) // 2
+            if not 0 <= disp < 256:
+                raise ValueError('literal pool out of reach at %#x' % pc)
+            code[index] |= disp
+
+    def build(self):
+        """Generate the whole image; returns it as bytes."""
+        for helper in (BYTE_TABLE_LOOKUP, AXIS_LOOKUP, WORD_TABLE_LOOKUP):
+            self.write_word(helper, RTS)
+            self.write_word(helper + 2, NOP)
+        # Identification area.
+        for location in range(0xF34, 0x1000, 2):
+            self.write_word(location, self.random.randrange(0x10000))
+
+        self.plan_functions()
+        for i in range(len(self.functions)):
+            self.build_function(i)
+
+        stack = STACK_POINTERS[self.size]
+        entry = self.functions[0]
+        self.write_long(0x0, entry)
+        self.write_long(0x4, stack)
+        self.write_long(0x8, entry)
+        self.write_long(0xC, stack)
+        for vector in range(0x10, 0x400, 4):
+            if self.random.random() < 0.6:
+                handler = self.functions[(vector // 4) % len(self.functions)]
+            else:
+                handler = self.functions[1]
+            self.write_long(vector, handler)
+        if self.data_next > self.size - 0x1000:
+            raise ValueError('data area overflowed the ROM')
+        return bytes(self.rom)
+
+
+def build_rom(size=0x80000, seed=1):
+    """Return a synthetic ROM image of a given size (0x40000 or 0x80000)."""
+    return RomBuilder(size, seed).build()
+
+
+def main():
+    """Write a synthetic ROM to standard output."""
+    size = int(sys.argv[1], 0) if len(sys.argv) > 1 else 0x80000
+    seed = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+    out = getattr(sys.stdout, 'buffer', sys.stdout)
+    out.write(build_rom(size, seed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,151 @@
+"""Tests for the library interface over a finished analysis."""
+
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+import struct
+import unittest
+
+import sh2dis
+from sh2dis import mitsubishi
+from sh2dis import sh2
+from sh2dis import synthetic
+
+from test_batch import tiny_rom
+
+
+# Reset code at 0x400 calls a subroutine at 0x420; the other vectors point
+# at the rte at 0x410.
+CALLING_CODE = (
+    0xB00E,  # 400: bsr 420
+    0x0009,  # 402: nop
+    0x000B,  # 404: rts
+    0x0009,  # 406: nop
+) + (0xFFFF, ) * 4 + (
+    0x002B,  # 410: rte
+    0x0009,  # 412: nop
+) + (0xFFFF, ) * 6 + (
+    0x000B,  # 420: rts
+    0x0009,  # 422: nop
+)
+
+
+class AnalysisTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.result = sh2dis.analyze(tiny_rom(CALLING_CODE), mitsu=False)
+
+    def test_processor(self):
+        self.assertEqual(self.result.processor, 'sh7052')
+
+    def test_items(self):
+        code = list(self.result.code(0x400, 0x430))
+        self.assertEqual([meta.location for meta in code],
+                         [0x400, 0x402, 0x404, 0x406, 0x410, 0x412, 0x420,
+                          0x422])
+        self.assertTrue(all(isinstance(meta, sh2.CodeField)
+                            for meta in code))
+        self.assertEqual([meta.location for meta in self.result.items(
+            0x400, 0x408)], [0x400, 0x402, 0x404, 0x406])
+        vectors = list(self.result.data(0, 0x400))
+        self.assertEqual(len(vectors), 0x100)
+        self.assertEqual(self.result.item_at(0x401).location, 0x400)
+        self.assertIsNone(self.result.item_at(0x408))
+        self.assertEqual(list(self.result.items(0x500, 0x500)), [])
+
+    def test_labels(self):
+        labels = dict(self.result.labels())
+        self.assertEqual(labels[0x400], 'power_on_pc')
+        self.assertEqual(self.result.label(0x400), 'power_on_pc')
+        self.assertIsNone(self.result.label(0x402))
+
+    def test_references(self):
+        self.assertEqual(self.result.references_to(0x420), [0x400])
+        self.assertEqual(self.result.references_from(0x400), [0x420])
+        self.assertEqual(self.result.references_from(0x0), [0x400])
+        self.assertEqual(self.result.references_from(0x402), [])
+        xrefs = dict(self.result.xrefs())
+        self.assertEqual(xrefs[0x400], [0x0])
+        self.assertEqual(len(xrefs[0x410]), 0xFE)
+
+    def test_functions(self):
+        functions = list(self.result.functions())
+        self.assertEqual([function.location for function in functions],
+                         [0x400, 0x410, 0x420])
+        self.assertEqual(functions[0].callers, [0x0])
+        self.assertEqual(functions[0].label, 'power_on_pc')
+        self.assertEqual(len(functions[1].callers), 0xFE)
+        self.assertEqual(functions[2].callers, [0x400])
+        self.assertIs(self.result.function(0x420), functions[2])
+        self.assertIsNone(self.result.function(0x402))
+        self.assertIsNone(self.result.function(0x10000))
+
+    def test_without_tables(self):
+        self.assertEqual(list(self.result.tables()), [])
+        self.assertIsNone(self.result.table(0x400))
+        self.assertEqual(list(self.result.axes()), [])
+
+    def test_control_flow_graph(self):
+        graph = self.result.control_flow_graph()
+        self.assertTrue(graph.block_at(0x420) is not None)
+
+    def test_render(self):
+        outfile = StringIO()
+        self.result.render(outfile)
+        self.assertIn('power_on_pc', outfile.getvalue())
+
+
+class EmptyAnalysisTest(unittest.TestCase):
+
+    def test_nothing_found(self):
+        # Every vector points into RAM, so there is no code to find.
+        result = sh2dis.analyze(struct.pack('>L', 0xFFFF8000) * 0x100 +
+                                b'\xff' * (0x40000 - 0x400))
+        self.assertEqual(list(result.code()), [])
+        self.assertEqual(len(list(result.data(0, 0x400))), 0x100)
+        self.assertEqual(list(result.functions()), [])
+        self.assertIsNone(result.function(0))
+        self.assertEqual(result.references_from(0), [0xFFFF8000])
+        self.assertEqual(result.references_from(0x400), [])
+        self.assertEqual(list(result.tables()), [])
+
+
+class MitsubishiAnalysisTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.result = sh2dis.analyze(synthetic.build_rom(0x40000, 11))
+
+    def test_tables(self):
+        tables = list(self.result.tables())
+        self.assertTrue(tables)
+        self.assertEqual(tables, sorted(tables))
+        axes = set(axis.location for axis in self.result.axes())
+        for table in tables:
+            self.assertIs(self.result.table(table.location), table)
+            self.assertTrue(table.dimensions in (2, 3))
+            self.assertTrue(table.width in (1, 2))
+            self.assertEqual(table.xaxis is not None,
+                             table.dimensions == 3 and table.xaxis in axes)
+            if table.length:
+                cell = self.result.item_at(table.data)
+                self.assertEqual(cell.width, table.width)
+                self.assertEqual(len(cell.member_of.members), table.length)
+
+    def test_axes(self):
+        axes = list(self.result.axes())
+        self.assertTrue(axes)
+        found = mitsubishi.get_axes(self.result.model)
+        self.assertEqual(sorted(axis.location for axis in axes),
+                         sorted(found.values()))
+        for axis in axes:
+            self.assertEqual(found[axis.result], axis.location)
+            self.assertEqual(axis.data, axis.location + 10)
+            self.assertTrue(axis.length >= 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,177 @@
+"""Tests for batch disassembly of ROM directories."""
+
+import io
+import os
+import shutil
+import struct
+import sys
+import tempfile
+import unittest
+
+from sh2dis import batch
+from sh2dis import pipeline
+
+
+def tiny_rom(code=(0x000B, 0x0009)):
+    """A 256 KB ROM that resets into code and sends everything else to rte.
+
+    The reset vector points at 0x400 and the stack at the top of RAM.
+    """
+    rom = bytearray(b'\xff' * 0x40000)
+    rom[0:0x400] = struct.pack('>LL', 0x400, 0xFFFFAFFC) + struct.pack(
+        '>L', 0x410) * 0xFE
+    rom[0x410:0x414] = struct.pack('>HH', 0x002B, 0x0009)
+    rom[0x400:0x400 + 2 * len(code)] = struct.pack('>%dH' % len(code),
+                                                     *code)
+    return bytes(rom)
+
+
+class BatchTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def write(self, name, data):
+        path = os.path.join(self.directory, name)
+        with open(path, 'wb') as romfile:
+            romfile.write(data)
+        return path
+
+
+class FindRomsTest(BatchTestCase):
+
+    def test_sorted_and_filtered(self):
+        for name in ('b.bin', 'a.bin', 'notes.txt', 'c.BIN'):
+            self.write(name, b'')
+        os.mkdir(os.path.join(self.directory, 'dir.bin'))
+        names = [os.path.basename(path)
+                 for path in batch.find_roms(self.directory)]
+        self.assertEqual(names[:2], ['a.bin', 'b.bin'])
+        self.assertNotIn('notes.txt', names)
+        self.assertNotIn('dir.bin', names)
+        names = [os.path.basename(path)
+                 for path in batch.find_roms(self.directory, '*.txt')]
+        self.assertEqual(names, ['notes.txt'])
+
+    def test_empty(self):
+        self.assertEqual(batch.find_roms(self.directory), [])
+
+    def test_missing_directory(self):
+        self.assertRaises(OSError, batch.find_roms,
+                          os.path.join(self.directory, 'missing'))
+
+
+class OutputPathTest(unittest.TestCase):
+
+    def test_next_to_rom(self):
+        self.assertEqual(batch.output_path(os.path.join('roms', 'evo.9.bin')),
+                         os.path.join('roms', 'evo.9.asm'))
+
+    def test_output_dir(self):
+        self.assertEqual(batch.output_path(os.path.join('roms', 'evo.bin'),
+                                           'out'),
+                         os.path.join('out', 'evo.asm'))
+
+
+class ProcessRomTest(BatchTestCase):
+
+    def test_listing_written(self):
+        rom = self.write('good.bin', tiny_rom())
+        destination = os.path.join(self.directory, 'good.asm')
+        path, error, _, warnings = batch.process_rom(
+            (rom, destination, False, False, False, False, None))
+        self.assertEqual((path, error, warnings), (rom, None, ''))
+        with open(destination) as listing:
+            text = listing.read()
+        self.assertIn('00000400 power_on_pc:', text)
+        self.assertIn('rts', text)
+
+    def test_warnings_captured(self):
+        stdout = sys.stdout
+        rom = self.write('bad.bin', tiny_rom(code=(0xFFFF, )))
+        _, error, _, warnings = batch.process_rom(
+            (rom, os.path.join(self.directory, 'bad.asm'), False, False,
+             False, False, None))
+        self.assertIsNone(error)
+        self.assertIn('Unable to disassemble location 0x400', warnings)
+        self.assertIs(sys.stdout, stdout)
+
+    def test_unrecognized_rom(self):
+        rom = self.write('short.bin', b'\xff' * 0x100)
+        destination = os.path.join(self.directory, 'short.asm')
+        _, error, _, _ = batch.process_rom(
+            (rom, destination, False, False, False, False, None))
+        self.assertTrue(error.startswith('ROMError:'))
+        self.assertFalse(os.path.exists(destination))
+
+
+class RunBatchTest(BatchTestCase):
+
+    def test_summary(self):
+        roms = [self.write('one.bin', tiny_rom()),
+                self.write('two.bin', b'\x00')]
+        output_dir = os.path.join(self.directory, 'out')
+        os.mkdir(output_dir)
+        report = Report()
+        failed = batch.run_batch(roms, output_dir, jobs=2, report=report)
+        self.assertEqual(failed, 1)
+        self.assertEqual(os.listdir(output_dir), ['one.asm'])
+        self.assertIn('%s: FAILED (ROMError' % roms[1], report.text)
+        self.assertIn('2 ROMs, 1 ok, 1 failed', report.text)
+
+    def test_no_roms(self):
+        report = Report()
+        self.assertEqual(batch.run_batch([], jobs=1, report=report), 0)
+        self.assertIn('0 ROMs, 0 ok, 0 failed', report.text)
+
+
+class Report(object):
+    """Collects a batch report."""
+
+    def __init__(self):
+        object.__init__(self)
+        self.text = ''
+
+    def write(self, text):
+        self.text += text
+
+
+class PipelineTest(unittest.TestCase):
+
+    def test_segments(self):
+        processor, segments = pipeline.get_segments(tiny_rom())
+        self.assertEqual(processor.__name__, 'sh2dis.sh7052')
+        self.assertEqual([seg[0] for seg in segments], ['ROM', 'RAM', 'REG'])
+        self.assertRaises(pipeline.ROMError, pipeline.get_segments, b'')
+
+    def test_map_rom(self):
+        with tempfile.TemporaryFile() as romfile:
+            romfile.write(b'\x00\x09' * 8)
+            romfile.flush()
+            phys = pipeline.map_rom(romfile)
+            self.assertEqual(phys[:], b'\x00\x09' * 8)
+            self.assertRaises(TypeError, phys.__setitem__, 0, 1)
+            phys.close()
+
+    def test_map_rom_fallback(self):
+        with tempfile.TemporaryFile() as romfile:
+            self.assertEqual(pipeline.map_rom(romfile), b'')
+        self.assertEqual(pipeline.map_rom(io.BytesIO(b'\x00\x09')),
+                         b'\x00\x09')
+        read_fd, write_fd = os.pipe()
+        os.write(write_fd, b'\x00\x0b')
+        os.close(write_fd)
+        with os.fdopen(read_fd, 'rb') as pipe:
+            self.assertEqual(pipeline.map_rom(pipe), b'\x00\x0b')
+
+    def test_output_ranges(self):
+        model = pipeline.build_model(tiny_rom())
+        self.assertEqual(pipeline.output_ranges(model), [(0, 0x40000)])
+        self.assertEqual(len(pipeline.output_ranges(model, ram=True)), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+"""Tests for the synthetic ROMs and the stage benchmark."""
+
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+import struct
+import unittest
+
+from sh2dis import benchmark
+from sh2dis import pipeline
+from sh2dis import stats
+from sh2dis import synthetic
+
+
+def result(size=0x40000, total=1.0, memory=None, **stages):
+    """Return a benchmark result with every stage taking 0.2s by default."""
+    timings = dict((name, 0.2) for name in benchmark.STAGES)
+    timings.update(stages)
+    return {'size': size, 'seed': 1, 'stages': timings, 'total': total,
+            'instructions': 100, 'bytes_per_second': size / total,
+            'instructions_per_second': 500.0, 'peak_memory': memory}
+
+
+class SyntheticTest(unittest.TestCase):
+
+    def test_deterministic(self):
+        self.assertEqual(synthetic.build_rom(0x40000, 3),
+                         synthetic.build_rom(0x40000, 3))
+        self.assertNotEqual(synthetic.build_rom(0x40000, 3),
+                            synthetic.build_rom(0x40000, 4))
+
+    def test_vectors(self):
+        for size, stack in sorted(synthetic.STACK_POINTERS.items()):
+            rom = synthetic.build_rom(size)
+            self.assertEqual(len(rom), size)
+            entry, sp = struct.unpack_from('>LL', rom, 0)
+            self.assertEqual(sp, stack)
+            self.assertTrue(0x1000 <= entry < size)
+            self.assertEqual(rom[-0x100:], b'\xFF' * 0x100)
+
+    def test_unsupported_size(self):
+        self.assertRaises(ValueError, synthetic.build_rom, 0x20000)
+
+
+class RunPipelineTest(unittest.TestCase):
+
+    def test_stages(self):
+        timings = {}
+        model = benchmark.run_pipeline(synthetic.build_rom(0x40000),
+                                       timings)
+        self.assertEqual(sorted(timings), sorted(benchmark.STAGES))
+        # The same stages build_model reports, plus rendering.
+        with stats.collect() as run:
+            pipeline.build_model(synthetic.build_rom(0x40000), mitsu=True)
+        self.assertEqual(sorted(list(run.stages) + ['final_output']),
+                         sorted(benchmark.STAGES))
+        self.assertTrue(all(value >= 0 for value in timings.values()))
+        self.assertTrue(benchmark.count_code(model) > 1000)
+
+    def test_report(self):
+        outfile = StringIO()
+        benchmark.print_report([result(memory=2 * 1048576)], outfile)
+        text = outfile.getvalue()
+        self.assertIn('ROM size 0x40000 (seed 1), 100 instructions', text)
+        for name in benchmark.STAGES:
+            self.assertIn(name, text)
+        self.assertIn('2.0 MB', text)
+
+
+class CompareTest(unittest.TestCase):
+
+    def test_no_regression(self):
+        baseline = {'results': [result()]}
+        self.assertEqual(benchmark.compare([result()], baseline, 0.2), [])
+        self.assertEqual(
+            benchmark.compare([result(total=1.1)], baseline, 0.2), [])
+
+    def test_regressions(self):
+        baseline = {'results': [result(memory=1000)]}
+        regressions = benchmark.compare(
+            [result(total=1.5, memory=2000, fixups=0.4)], baseline, 0.2)
+        self.assertEqual(len(regressions), 3)
+        self.assertTrue(regressions[0].startswith('0x40000 fixups:'))
+        self.assertIn('+100%', regressions[0])
+        self.assertTrue(regressions[1].startswith('0x40000 total:'))
+        self.assertTrue(regressions[2].startswith('0x40000 peak_memory:'))
+
+    def test_missing_baseline(self):
+        self.assertEqual(benchmark.compare([result(total=9.0)],
+                                           {'results': []}, 0.2), [])
+        baseline = {'results': [result(size=0x80000)]}
+        self.assertEqual(benchmark.compare([result(total=9.0)], baseline,
+                                           0.2), [])
+
+    def test_zero_baseline(self):
+        baseline = {'results': [result(fixups=0.0)]}
+        self.assertEqual(benchmark.compare([result(fixups=0.1)], baseline,
+                                           0.2), [])
+
+    def test_short_stages(self):
+        # Doubling a stage of a few milliseconds is noise, not a regression.
+        baseline = {'results': [result(compact_references=0.003)]}
+        self.assertEqual(benchmark.compare(
+            [result(compact_references=0.006)], baseline, 0.2), [])
+        regressions = benchmark.compare(
+            [result(compact_references=0.009)], baseline, 0.2)
+        self.assertEqual(len(regressions), 1)
+        self.assertTrue(regressions[0].startswith(
+            '0x40000 compact_references:'))
+        # The floor is configurable, and doesn't apply to memory.
+        self.assertEqual(len(benchmark.compare(
+            [result(compact_references=0.006)], baseline, 0.2, 0)), 1)
+        self.assertEqual(len(benchmark.compare(
+            [result(total=1.5)], {'results': [result()]}, 0.2, 1.0)), 0)
+        self.assertEqual(len(benchmark.compare(
+            [result(memory=2000)], {'results': [result(memory=1000)]},
+            0.2, 1.0)), 1)
+
+    def test_stage_missing_from_baseline(self):
+        old = result()
+        del old['stages']['post_analysis']
+        self.assertEqual(benchmark.compare([result(post_analysis=5.0)],
+                                           {'results': [old]}, 0.2), [])
+
+    def test_memory_unmeasured(self):
+        baseline = {'results': [result(memory=None)]}
+        self.assertEqual(benchmark.compare([result(memory=10 ** 9)],
+                                           baseline, 0.2), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+"""Tests for the persistent analysis cache."""
+
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+from sh2dis import cache
+from sh2dis import pipeline
+
+from test_batch import tiny_rom
+
+
+def listing(model):
+    return '\n'.join(pipeline.render(model, pipeline.output_ranges(model,
+                                                                   True)))
+
+
+class CacheKeyTest(unittest.TestCase):
+
+    def test_stable(self):
+        rom = tiny_rom()
+        self.assertEqual(cache.cache_key(rom, mitsu=False),
+                         cache.cache_key(bytes(bytearray(rom)), mitsu=False))
+        self.assertEqual(cache.cache_key(rom, mitsu=True, other=1),
+                         cache.cache_key(rom, other=1, mitsu=True))
+
+    def test_sensitive(self):
+        rom = tiny_rom()
+        key = cache.cache_key(rom, mitsu=False)
+        self.assertNotEqual(key, cache.cache_key(rom, mitsu=True))
+        self.assertNotEqual(key, cache.cache_key(rom))
+        changed = tiny_rom(code=(0x0009, 0x000B, 0x0009))
+        self.assertNotEqual(key, cache.cache_key(changed, mitsu=False))
+
+    def test_unrecognized_rom(self):
+        self.assertRaises(pipeline.ROMError, cache.cache_key, b'\x00' * 16)
+
+
+class CachedModelTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.stderr = sys.stderr
+        sys.stderr = StringIO()
+        self.rom = tiny_rom()
+
+    def tearDown(self):
+        sys.stderr = self.stderr
+        shutil.rmtree(self.directory)
+
+    def entry(self):
+        key = cache.cache_key(self.rom, mitsu=False, dataflow=False)
+        return os.path.join(self.directory, key + '.cache')
+
+    def test_miss_then_hit(self):
+        model = cache.cached_model(self.rom, self.directory)
+        self.assertTrue(os.path.exists(self.entry()))
+        # Prove the second call reads the entry rather than re-analysing.
+        model.set_label(0x400, 'from_cache')
+        cache.save(model, self.entry())
+        again = cache.cached_model(self.rom, self.directory)
+        self.assertEqual(again.get_label(0x400), 'from_cache')
+        self.assertEqual(sys.stderr.getvalue(), '')
+
+    def test_options_use_their_own_entry(self):
+        cache.cached_model(self.rom, self.directory)
+        cache.cached_model(self.rom, self.directory, mitsu=True)
+        self.assertEqual(len(os.listdir(self.directory)), 2)
+
+    def test_jobs_share_an_entry(self):
+        calls = []
+        build_model = pipeline.build_model
+
+        def recording(*args, **kwargs):
+            calls.append(kwargs['jobs'])
+            return build_model(*args, **kwargs)
+
+        pipeline.build_model = recording
+        try:
+            cache.cached_model(self.rom, self.directory, jobs=2)
+            cache.cached_model(self.rom, self.directory)
+        finally:
+            pipeline.build_model = build_model
+        self.assertEqual(calls, [2])
+        self.assertEqual(os.listdir(self.directory),
+                         [os.path.basename(self.entry())])
+
+    def test_unreadable_entry(self):
+        with open(self.entry(), 'wb') as cachefile:
+            cachefile.write(b'not a pickle')
+        model = cache.cached_model(self.rom, self.directory)
+        self.assertEqual(model.get_label(0x400), 'power_on_pc')
+        self.assertIn('ignoring unreadable cache entry',
+                      sys.stderr.getvalue())
+        # The bad entry was replaced with a good one.
+        cache.load(self.entry(), self.rom)
+
+    def test_unwritable_directory(self):
+        blocker = os.path.join(self.directory, 'file')
+        with open(blocker, 'w'):
+            pass
+        model = cache.cached_model(self.rom, blocker)
+        self.assertEqual(model.get_label(0x400), 'power_on_pc')
+        self.assertIn('unable to write cache entry', sys.stderr.getvalue())
+
+    def test_rom_not_stored(self):
+        model = cache.cached_model(self.rom, self.directory)
+        self.assertLess(os.path.getsize(self.entry()), len(self.rom))
+        restored = cache.load(self.entry(), self.rom)
+        self.assertEqual(listing(restored), listing(model))
+
+    def test_no_temporary_files_left(self):
+        cache.cached_model(self.rom, self.directory)
+        self.assertEqual([name for name in os.listdir(self.directory)
+                          if name.endswith('.tmp')], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
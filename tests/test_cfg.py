@@ -0,0 +1,151 @@
+"""Tests for basic blocks and the control flow graph."""
+
+import struct
+import unittest
+
+from sh2dis import cfg
+from sh2dis import segment
+from sh2dis import sh2
+
+from test_sh2 import program_model
+
+
+def opcode(instruction):
+    return sh2.lookup_instruction(instruction)[0]
+
+
+def code(instruction, location=0x100):
+    """A free-standing CodeField for block_edges()."""
+    opcode, args = sh2.decode(instruction, location)
+    return sh2.CodeField(location=location, width=2, model=None,
+                         extra=sh2.CodeExtra(instruction, opcode, args))
+
+
+class EndsBlockTest(unittest.TestCase):
+
+    def test_kinds(self):
+        self.assertIsNone(cfg.ends_block(opcode(0x0009)))  # nop
+        self.assertIsNone(cfg.ends_block(opcode(0x6123)))  # mov
+        self.assertEqual(cfg.ends_block(opcode(0x8901)), 0)  # bt
+        self.assertEqual(cfg.ends_block(opcode(0x8D01)), 1)  # bt/s
+        self.assertEqual(cfg.ends_block(opcode(0xA004)), 1)  # bra
+        self.assertEqual(cfg.ends_block(opcode(0x400B)), 1)  # jsr
+        self.assertEqual(cfg.ends_block(opcode(0x000B)), 1)  # rts
+
+
+class BlockEdgesTest(unittest.TestCase):
+
+    def test_no_branch(self):
+        self.assertEqual(cfg.block_edges(None, 0x104, True),
+                         [(cfg.FALLTHROUGH, 0x104)])
+        self.assertEqual(cfg.block_edges(None, 0x104, False), [])
+
+    def test_conditional(self):
+        self.assertEqual(cfg.block_edges(code(0x8901), 0x102, True),
+                         [(cfg.CONDITIONAL, 0x106), (cfg.FALLTHROUGH, 0x102)])
+        self.assertEqual(cfg.block_edges(code(0x8D01), 0x104, False),
+                         [(cfg.CONDITIONAL, 0x106)])
+
+    def test_call(self):
+        self.assertEqual(cfg.block_edges(code(0xB00D), 0x104, True),
+                         [(cfg.CALL, 0x11E), (cfg.RETURN, 0x104)])
+        # A call at the end of code has nowhere to return to.
+        self.assertEqual(cfg.block_edges(code(0xB00D), 0x104, False),
+                         [(cfg.CALL, 0x11E)])
+
+    def test_unconditional(self):
+        self.assertEqual(cfg.block_edges(code(0xA004), 0x104, True),
+                         [(cfg.DELAYED, 0x10C)])
+        # Register branches with an unknown target have no edges at all.
+        self.assertEqual(cfg.block_edges(code(0x402B), 0x104, True), [])
+        self.assertEqual(cfg.block_edges(code(0x000B), 0x104, True), [])
+
+
+class GraphTest(unittest.TestCase):
+
+    def setUp(self):
+        self.model = program_model()
+        sh2.disassemble([(0, None)], self.model)
+        self.graph = cfg.build(self.model)
+
+    def test_blocks(self):
+        self.assertEqual(
+            [self.graph.block(i) for i in range(len(self.graph))],
+            [(0x00, 0x06), (0x06, 0x0A), (0x12, 0x14), (0x14, 0x1A),
+             (0x20, 0x22)])
+
+    def test_successors(self):
+        self.assertEqual(self.graph.successors(0),
+                         [(cfg.CALL, 0x20), (cfg.RETURN, 0x06)])
+        self.assertEqual(self.graph.successors(1), [(cfg.DELAYED, 0x12)])
+        self.assertEqual(self.graph.successors(2),
+                         [(cfg.CONDITIONAL, 0x18), (cfg.FALLTHROUGH, 0x14)])
+        # rts, with its branched-to delay slot, and the unresolved jmp.
+        for index in (3, 4):
+            self.assertEqual(self.graph.successors(index), [])
+
+    def test_predecessors(self):
+        self.assertEqual(self.graph.predecessors(0), [])
+        self.assertEqual(self.graph.predecessors(2), [(cfg.DELAYED, 1)])
+        self.assertEqual(self.graph.predecessors(3),
+                         [(cfg.CONDITIONAL, 2), (cfg.FALLTHROUGH, 2)])
+        self.assertEqual(self.graph.predecessors(4), [(cfg.CALL, 0)])
+        self.assertEqual(self.graph.predecessors(99), [])
+
+    def test_block_at(self):
+        self.assertEqual(self.graph.block_at(0x00), 0)
+        self.assertEqual(self.graph.block_at(0x05), 0)
+        self.assertEqual(self.graph.block_at(0x06), 1)
+        self.assertEqual(self.graph.block_at(0x19), 3)
+        for location in (0x0A, 0x10, 0x1A, 0x22, 0x1000):
+            self.assertIsNone(self.graph.block_at(location))
+
+    def test_instructions(self):
+        cmds = [meta.extra.opcode.cmd
+                for meta in self.graph.instructions(self.model, 0)]
+        self.assertEqual(cmds, ['mov.l', 'bsr', 'nop'])
+
+    def test_entered_slots(self):
+        # bt 18 lands on the rts's delay slot, which stays in its block.
+        self.assertEqual(list(self.graph.slots), [0x18])
+        self.assertTrue(self.graph.entered_slot(0x18))
+        self.assertFalse(self.graph.entered_slot(0x16))
+        self.assertFalse(self.graph.entered_slot(0x1000))
+        cmds = [meta.extra.opcode.cmd
+                for meta in self.graph.instructions(self.model, 3)]
+        self.assertEqual(cmds, ['mov.w', 'rts', 'nop'])
+
+    def test_empty(self):
+        model = segment.MemoryModel('sh7055', [('rom', 0, 0x10, None)])
+        graph = cfg.build(model)
+        self.assertEqual(len(graph), 0)
+        self.assertIsNone(graph.block_at(0))
+        self.assertEqual(graph.predecessors(0), [])
+        self.assertFalse(graph.entered_slot(0))
+
+
+class UnmappedTargetTest(unittest.TestCase):
+
+    def build(self, words, location=0):
+        phys = bytearray(b'\xFF' * 0x100)
+        struct.pack_into('>%dH' % len(words), phys, location, *words)
+        model = segment.MemoryModel('sh7055', [
+            ('ROM', 0, 0x100, bytes(phys))])
+        sh2.disassemble([(location, None)], model)
+        return cfg.build(model)
+
+    def test_branch_before_zero(self):
+        # bra -4 from the very start of the address space.
+        graph = self.build((0xAFFC, 0x0009))
+        self.assertEqual(len(graph), 1)
+        self.assertEqual(graph.block(0), (0, 4))
+        self.assertEqual(graph.successors(0), [])
+
+    def test_branch_past_the_end(self):
+        # bsr 0x204, beyond the only segment; the return edge stays.
+        graph = self.build((0xB0FE, 0x0009, 0x000B, 0x0009))
+        self.assertEqual(graph.successors(0), [(cfg.RETURN, 4)])
+
+
+if __name__ == '__main__':
+    unittest.main()
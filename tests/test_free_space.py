@@ -0,0 +1,112 @@
+"""Tests for finding and marking free space."""
+
+import unittest
+
+from sh2dis import passes
+from sh2dis import pipeline
+from sh2dis import segment
+from sh2dis import sh2
+
+
+def make_model(phys, start=0x100):
+    """A one-segment ROM holding phys, plus a RAM segment."""
+    return segment.MemoryModel('sh7055', [
+        ('rom', start, start + len(phys), phys),
+        ('ram', 0xFFFF0000, 0xFFFF1000, None),
+    ])
+
+
+def runs(model, min_length=8, fills=(0xFF,)):
+    """Sweep with the FreeSpace pass; return the runs it marked."""
+    passes.sweep(model, [passes.FreeSpace(min_length, fills)])
+    seg = model.get_segment(0x100)
+    return [(meta.location, meta.location + meta.width)
+            for meta in seg.iter_locations(seg.start, seg.end)
+            if isinstance(meta, sh2.NullField)]
+
+
+class FreeSpacePassTest(unittest.TestCase):
+
+    def test_threshold(self):
+        model = make_model(b'\x01' + b'\xff' * 7 + b'\x01' + b'\xff' * 8 +
+                           b'\x01')
+        self.assertEqual(runs(model), [(0x109, 0x111)])
+
+    def test_run_to_segment_end(self):
+        model = make_model(b'\x01\x02' + b'\xff' * 10)
+        self.assertEqual(runs(model), [(0x102, 0x10C)])
+        model = make_model(b'\xff' * 12)
+        self.assertEqual(runs(model), [(0x100, 0x10C)])
+
+    def test_defined_items_are_carved_out(self):
+        model = make_model(b'\xff' * 32)
+        model.set_location(sh2.LongField(location=0x10C, model=model))
+        model.set_location(sh2.WordField(location=0x104, model=model))
+        # Pieces left too short are dropped altogether.
+        self.assertEqual(runs(model), [(0x110, 0x120)])
+
+    def test_items_overlapping_the_ends(self):
+        model = make_model(b'\x00\x00' + b'\xff' * 20 + b'\x00\x00')
+        model.set_location(sh2.LongField(location=0x100, model=model))
+        model.set_location(sh2.LongField(location=0x114, model=model))
+        self.assertEqual(runs(model), [(0x104, 0x114)])
+
+    def test_fills(self):
+        model = make_model(b'\x00' * 8 + b'\x01' + b'\xff' * 8)
+        self.assertEqual(runs(make_model(b'\x00' * 8 + b'\x01' +
+                                         b'\xff' * 8), fills=(0xFF, 0x00)),
+                         [(0x100, 0x108), (0x109, 0x111)])
+        self.assertEqual(runs(model), [(0x109, 0x111)])
+
+    def test_no_runs(self):
+        self.assertEqual(runs(make_model(b'\x01\x02' * 16)), [])
+
+    def test_defined_during_sweep(self):
+        # Items another pass defines inside a run are carved out of it.
+        model = make_model(b'\x01\x00' + b'\xff' * 30)
+
+        class Define(passes.Pass):
+            kinds = (sh2.WordField, )
+
+            def visit(self, meta):
+                model.set_location(sh2.LongField(location=0x110,
+                                                 model=model))
+
+        model.set_location(sh2.WordField(location=0x100, model=model))
+        passes.sweep(model, [passes.FreeSpace(8), Define()])
+        self.assertEqual([(meta.location, meta.width) for meta in
+                          model.get_segment(0x100).iter_locations(0x100,
+                                                                  0x120)],
+                         [(0x100, 2), (0x102, 0xE), (0x110, 4),
+                          (0x114, 0xC)])
+
+
+class ScanFreeSpaceTest(unittest.TestCase):
+
+    def test_marks_null_fields(self):
+        model = make_model(b'\x01' * 4 + b'\xff' * 0x200 + b'\x01' +
+                           b'\xff' * 0x1FF)
+        pipeline.scan_free_space(model)
+        null = model.get_location(0x104)
+        self.assertIsInstance(null, sh2.NullField)
+        self.assertEqual((null.location, null.width), (0x104, 0x200))
+        # One byte short of the default threshold.
+        self.assertIsNone(model.get_location(0x305))
+
+    def test_rescan(self):
+        # Free space already marked is defined, so nothing more is found.
+        model = make_model(b'\xff' * 0x40)
+        pipeline.scan_free_space(model, min_length=0x10)
+        first = model.get_location(0x100)
+        pipeline.scan_free_space(model, min_length=0x10)
+        self.assertIs(model.get_location(0x100), first)
+        self.assertEqual(first.width, 0x40)
+
+    def test_ram_ignored(self):
+        model = make_model(b'\x01')
+        pipeline.scan_free_space(model, min_length=1)
+        self.assertIsNone(model.get_location(0xFFFF0000))
+
+
+if __name__ == '__main__':
+    unittest.main()
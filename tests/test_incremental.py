@@ -0,0 +1,149 @@
+"""Tests for incremental re-rendering sessions."""
+
+import unittest
+
+from sh2dis import incremental
+from sh2dis import pipeline
+from sh2dis import sh2
+
+from test_output import listing_model
+
+RANGES = [(0x1000, 0x1048)]
+
+
+class SessionTest(unittest.TestCase):
+
+    def setUp(self):
+        self.model = listing_model()
+        self.session = incremental.Session(self.model)
+
+    def tearDown(self):
+        if self.session._changed in self.model.observers:
+            self.session.close()
+
+    def render(self):
+        lines = list(self.session.render(RANGES))
+        self.assertEqual(lines, list(pipeline.render(self.model, RANGES)))
+        return lines
+
+    def rendered_after(self, edit):
+        """Re-render after an edit; return how many slots were formatted."""
+        self.render()
+        before = self.session.rendered
+        edit()
+        self.render()
+        return self.session.rendered - before
+
+    def test_unchanged(self):
+        self.assertEqual(self.rendered_after(lambda: None), 0)
+
+    def test_label(self):
+        # The target line and the bsr naming it, nothing else.
+        count = self.rendered_after(
+            lambda: self.session.set_label(0x1024, 'handler'))
+        self.assertEqual(count, 2)
+        self.assertIn('bsr handler', '\n'.join(self.render()))
+
+    def test_label_inside_item(self):
+        count = self.rendered_after(
+            lambda: self.session.set_label(0x1010, 'constant'))
+        self.assertEqual(count, 2)
+        self.assertIn('[constant] = 0x40', '\n'.join(self.render()))
+
+    def test_reference(self):
+        # The byte gains a label, which the next byte's label lookup sees.
+        count = self.rendered_after(
+            lambda: self.model.add_reference(0x102A, 0x1004))
+        self.assertEqual(count, 2)
+        count = self.rendered_after(
+            lambda: self.model.remove_reference(0x102A, 0x1004))
+        self.assertEqual(count, 2)
+
+    def test_unset_and_set(self):
+        count = self.rendered_after(
+            lambda: self.session.unset_location(0x1020))
+        # Its two bytes, the byte after and the mov.w quoting it.
+        self.assertEqual(count, 4)
+        count = self.rendered_after(lambda: self.session.set_location(
+            sh2.WordField(location=0x1020, model=self.model)))
+        self.assertEqual(count, 3)
+
+    def test_entry_point(self):
+        created = self.session.add_entry_point(0x1014, label='extra')
+        self.assertIn(0x1014, created)
+        self.assertEqual(self.session.items_from(0x1014)[0], 0x1014)
+        self.assertEqual(self.session.items_from(0x2000), [])
+        lines = '\n'.join(self.render())
+        self.assertIn('00001014 extra:', lines)
+
+    def test_entry_point_redefining(self):
+        def callback(code, registers, model):
+            # Lay out the word at 0x1020 again, and a word over two bytes
+            # defined a moment before.
+            if code.location != 0x1014:
+                return
+            model.set_location(sh2.WordField(location=0x1020, model=model))
+            model.set_location(sh2.ByteField(location=0x1028, model=model))
+            model.set_location(sh2.ByteField(location=0x1029, model=model))
+            model.set_location(sh2.WordField(location=0x1028, model=model))
+
+        self.session.callback = callback
+        created = self.session.add_entry_point(0x1014)
+        # The nop, then the known code it runs into up to the end of the
+        # block, and the data the callback laid out.
+        self.assertEqual(created, [0x1014, 0x1016, 0x1018, 0x101A, 0x101C,
+                                   0x1020, 0x1028])
+        self.assertEqual(self.session.items_from(0x1014), created)
+        # A later entry point doesn't take over what was already claimed.
+        self.session.callback = None
+        self.session.add_entry_point(0x1014)
+        self.assertEqual(self.session.items_from(0x1014), created)
+
+    def test_origin_forgotten_after_edit(self):
+        self.session.add_entry_point(0x1014)
+        self.session.unset_location(0x1014)
+        self.assertEqual(self.session.items_from(0x1014),
+                         [0x1016, 0x1018, 0x101A, 0x101C])
+        self.session.set_location(sh2.WordField(location=0x1018,
+                                                model=self.model))
+        self.assertEqual(self.session.items_from(0x1014),
+                         [0x1016, 0x101A, 0x101C])
+
+    def test_model_untouched(self):
+        # Reads are seen through the model's read hook, not by replacing
+        # its methods.
+        self.render()
+        self.assertEqual(self.model.readers, [])
+        for name in ('get_location', 'get_label', 'generate_comments'):
+            self.assertNotIn(name, vars(self.model))
+
+    def test_entry_point_outside_model(self):
+        self.assertEqual(self.session.add_entry_point(0x8000), [])
+
+    def test_close(self):
+        self.render()
+        self.session.close()
+        self.assertEqual(self.model.observers, [])
+        # Edits are no longer seen, so the stale line stays cached.
+        self.model.set_label(0x1024, 'handler')
+        self.assertNotIn('bsr handler',
+                         '\n'.join(self.session.render(RANGES)))
+
+    def test_final_output(self):
+        written = []
+        self.session.final_output(Writer(written), RANGES)
+        self.assertEqual(''.join(written),
+                         '\n'.join(pipeline.render(self.model, RANGES)) +
+                         '\n')
+
+
+class Writer(object):
+    """Appends whatever is written to a list."""
+
+    def __init__(self, written):
+        object.__init__(self)
+        self.write = written.append
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,174 @@
+"""Tests for rendering a model as a listing."""
+
+import io
+import struct
+import unittest
+
+from sh2dis import pipeline
+from sh2dis import segment
+from sh2dis import sh2
+
+from test_sh2 import PROGRAM
+
+SEPARATOR = pipeline.OUTPUT_SEPARATOR
+
+
+class Writer(object):
+    """Collects everything written, one entry per write call."""
+
+    def __init__(self):
+        object.__init__(self)
+        self.writes = []
+
+    def write(self, text):
+        self.writes.append(text)
+
+
+def listing_model():
+    """PROGRAM at 0x1004, then text bytes and a stretch of free space."""
+    phys = (b'\x00' * 4 + struct.pack('>%dH' % len(PROGRAM), *PROGRAM) +
+            b'Az-\x00' + b'\xff' * 0x1C)
+    model = segment.MemoryModel('sh7055', [
+        ('rom', 0x1000, 0x1000 + len(phys), phys),
+        ('ram', 0xFFFF0000, 0xFFFF0004, None),
+    ])
+    sh2.disassemble([(0x1004, None)], model)
+    model.set_location(sh2.NullField(location=0x102C, width=0x18,
+                                     model=model))
+    model.add_reference(0x1028, 0x1004)
+    return model
+
+
+class RenderTest(unittest.TestCase):
+
+    def setUp(self):
+        self.model = listing_model()
+        self.lines = list(pipeline.render(self.model, [(0x1000, 0x1048)]))
+
+    def line(self, location):
+        prefix = '%08X ' % location
+        for line in self.lines:
+            if line.startswith(prefix):
+                return line
+        return None
+
+    def test_code_blocks(self):
+        # Separators open a block, close it when data follows, and split
+        # blocks after an rts and its delay slot.
+        first = self.lines.index(self.line(0x1004))
+        self.assertEqual(self.lines[first - 1], SEPARATOR)
+        after_bra = self.lines.index(self.line(0x100C)) + 1
+        self.assertEqual(self.lines[after_bra], SEPARATOR)
+        self.assertTrue(self.lines[after_bra + 1].startswith('0000100E'))
+        self.assertEqual(self.lines.count(SEPARATOR), 8)
+
+    def test_items(self):
+        self.assertIn('long_1010:', self.line(0x1010))
+        self.assertIn('.long 0x00000040', self.line(0x1010))
+        self.assertIsNone(self.line(0x1012))
+        self.assertIn('bsr sub_1024', self.line(0x1006))
+
+    def test_undefined_bytes(self):
+        self.assertEqual(self.line(0x1000), '00001000                  '
+                         '.byte 0x00')
+        self.assertEqual(self.line(0x1028).split('\n'), [
+            "00001028 unk_1028:        .byte 0x41            ! 'A'",
+            '%47s ! XREF: 0x1004' % ''])
+        self.assertNotIn('!', self.line(0x102A))
+
+    def test_free_space(self):
+        null = self.lines.index(self.line(0x102C))
+        self.assertEqual(self.lines[null - 1], SEPARATOR)
+        self.assertEqual(self.lines[null + 1], SEPARATOR)
+        self.assertIn('.org 0x1044', self.lines[null])
+        self.assertIn('24 bytes of free space', self.lines[null])
+        self.assertTrue(self.lines[null + 2].startswith('00001044'))
+
+    def test_no_phys(self):
+        lines = list(pipeline.render(self.model, [(0xFFFF0000, 0xFFFF0004)]))
+        self.assertEqual(len(lines), 4)
+        self.assertTrue(lines[0].endswith('.byte 0x00'))
+
+    def test_empty(self):
+        self.assertEqual(list(pipeline.render(self.model, [])), [])
+        self.assertEqual(list(pipeline.render(self.model, [(0x1000, 0x1000)])),
+                         [])
+
+
+class FinalOutputTest(unittest.TestCase):
+
+    def setUp(self):
+        self.model = listing_model()
+        self.ranges = [(0x1000, 0x1048), (0xFFFF0000, 0xFFFF0004)]
+        self.lines = list(pipeline.render(self.model, self.ranges))
+        self.text = '\n'.join(self.lines) + '\n'
+
+    def test_buffering(self):
+        count = len(self.lines)
+        for buffer_lines in (1, 7, count, 8192):
+            outfile = Writer()
+            pipeline.final_output(self.model, outfile, self.ranges, buffer_lines)
+            self.assertEqual(''.join(outfile.writes), self.text)
+            self.assertEqual(len(outfile.writes),
+                             -(-count // buffer_lines))
+
+    def test_file(self):
+        outfile = io.StringIO() if str is not bytes else io.BytesIO()
+        pipeline.final_output(self.model, outfile, self.ranges)
+        self.assertEqual(outfile.getvalue(), self.text)
+
+    def test_nothing_to_write(self):
+        outfile = Writer()
+        pipeline.final_output(self.model, outfile, [])
+        self.assertEqual(outfile.writes, [])
+
+
+class FormatTest(unittest.TestCase):
+
+    def test_plain(self):
+        self.assertEqual(segment.format_line(0x10, None, 'nop', []),
+                         '00000010                  nop')
+        self.assertEqual(segment.format_line(0x10, 'start', 'nop', []),
+                         '00000010 start:           nop')
+
+    def test_offset_labels_hidden(self):
+        self.assertEqual(segment.format_line(0x11, 'start+1', 'nop', []),
+                         segment.format_line(0x11, None, 'nop', []))
+
+    def test_comments(self):
+        comments = ['one', 'two']
+        text = segment.format_line(0x10, None, 'nop', comments)
+        self.assertEqual(text.split('\n'), [
+            '00000010                  nop                   ! one',
+            '%47s ! two' % ''])
+
+    def test_long_instruction(self):
+        # Too wide to share a line, so every comment goes underneath.
+        instruction = 'mov.l @(0x8,pc), r10000'
+        text = segment.format_line(0x10, None, instruction, ['one'])
+        self.assertEqual(text.split('\n'), [
+            '00000010                  ' + instruction,
+            '%47s ! one' % ''])
+
+
+class SlotTest(unittest.TestCase):
+
+    def test_iter_locations(self):
+        model = listing_model()
+        seg = model.get_segment(0x1000)
+        items = [meta.location for meta in seg.iter_locations(0x1010, 0x1020)]
+        self.assertEqual(items, [0x1010, 0x1016, 0x1018, 0x101A, 0x101C])
+        self.assertEqual(list(seg.iter_locations(0x1000, 0x1004)), [])
+
+    def test_iter_slots(self):
+        model = listing_model()
+        seg = model.get_segment(0x1000)
+        slots = [(location, meta is not None) for location, meta
+                 in pipeline.iter_slots(seg, 0x100E, 0x1016)]
+        self.assertEqual(slots, [(0x100E, False), (0x100F, False),
+                                 (0x1010, True), (0x1014, False),
+                                 (0x1015, False)])
+
+
+if __name__ == '__main__':
+    unittest.main()
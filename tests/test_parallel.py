@@ -0,0 +1,171 @@
+"""Tests for sharing disassembly roots between worker processes."""
+
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+import struct
+import sys
+import unittest
+
+from sh2dis import mitsubishi
+from sh2dis import parallel
+from sh2dis import segment
+from sh2dis import sh2
+from sh2dis import sh7055
+
+from test_sh2 import listing
+
+
+def routines_model(words):
+    """A 4 KB ROM model for the SH7055 with the given words filled in."""
+    phys = bytearray(b'\xff' * 0x1000)
+    for location, value in words.items():
+        struct.pack_into('>H', phys, location, value)
+    return segment.MemoryModel(sh7055, [('rom', 0, len(phys), bytes(phys))])
+
+
+# Two handlers sharing a subroutine at 0x300.
+HANDLERS = {
+    0x100: 0xB0FE,  # bsr 300
+    0x102: 0x0009,  # nop
+    0x104: 0x000B,  # rts
+    0x106: 0x0009,  # nop
+    0x200: 0xB07E,  # bsr 300
+    0x202: 0x0009,  # nop
+    0x204: 0x000B,  # rts
+    0x206: 0x0009,  # nop
+    0x300: 0x000B,  # rts
+    0x302: 0x0009,  # nop
+}
+
+
+def record(location, width=2, kind=3, extra=0x0009):
+    """An item record as walk_roots reports it."""
+    return (kind, location, width, extra, None, None, 'sub', None)
+
+
+class PartitionTest(unittest.TestCase):
+
+    def test_round_robin(self):
+        roots = [(0x10, 0), (0x20, 4), (0x30, 8), (0x40, 12), (0x50, 16)]
+        self.assertEqual(parallel.partition(roots, 2), [
+            [(0x10, 0), (0x30, 8), (0x50, 16)], [(0x20, 4), (0x40, 12)]])
+
+    def test_same_location_kept_together(self):
+        roots = [(0x10, 0), (0x20, 4), (0x10, 8), (0x30, 12), (0x10, 16)]
+        shares = parallel.partition(roots, 2)
+        self.assertEqual(shares[0], [(0x10, 0), (0x10, 8), (0x30, 12),
+                                     (0x10, 16)])
+        self.assertEqual(shares[1], [(0x20, 4)])
+
+    def test_more_jobs_than_roots(self):
+        self.assertEqual(parallel.partition([(0x10, 0), (0x10, 4)], 8),
+                         [[(0x10, 0), (0x10, 4)]])
+        self.assertEqual(parallel.partition([], 4), [])
+
+
+class CheckResultsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.model = routines_model({})
+
+    def check(self, *results):
+        return parallel.check_results(self.model, list(results))
+
+    def test_mergeable(self):
+        self.assertIsNone(self.check(
+            ([record(0x100)], [(0x100, [0])], ''),
+            ([record(0x100), record(0x200)], [], 'warning\n')))
+        self.assertIsNone(self.check())
+
+    def test_worker_failed(self):
+        self.assertEqual(self.check(([], [], ''), 'KeyError: 4'),
+                         'KeyError: 4')
+
+    def test_disagreement(self):
+        self.assertEqual(self.check(([record(0x100)], [], ''),
+                                    ([record(0x100, extra=0x000B)], [], '')),
+                         'workers disagree about 0x100')
+
+    def test_overlap(self):
+        self.assertEqual(self.check(
+            ([record(0x100, width=4, kind=2, extra=0)], [], ''),
+            ([record(0x102)], [], '')),
+                         'items overlap at 0x102')
+
+    def test_overlaps_model(self):
+        self.model.set_location(sh2.WordField(location=0x102,
+                                              model=self.model))
+        self.assertEqual(self.check(
+            ([record(0x100, width=4, kind=2, extra=0)], [], '')),
+                         'an item at 0x100 overlaps the model')
+
+
+class DisassembleTest(unittest.TestCase):
+
+    def setUp(self):
+        self.stderr = sys.stderr
+        sys.stderr = StringIO()
+
+    def tearDown(self):
+        sys.stderr = self.stderr
+
+    def run_both(self, words, roots, **kwargs):
+        serial = routines_model(words)
+        sh2.disassemble(roots, serial)
+        model = routines_model(words)
+        merged = parallel.disassemble(roots, model, 2, **kwargs)
+        self.assertEqual(listing(model), listing(serial))
+        for location in (0x100, 0x200, 0x300):
+            self.assertEqual(model.get_references(location),
+                             serial.get_references(location))
+        return merged
+
+    def test_merged(self):
+        self.assertTrue(self.run_both(HANDLERS, [(0x100, 0), (0x200, 4)]))
+        self.assertEqual(sys.stderr.getvalue(), '')
+
+    def test_one_share(self):
+        self.assertFalse(self.run_both(HANDLERS, [(0x100, 0), (0x100, 4)]))
+        self.assertIn('nothing to share', sys.stderr.getvalue())
+
+    def test_state_between_roots(self):
+        # Decided before any worker starts, so the pool is never built.
+        pool = parallel.multiprocessing.Pool
+        parallel.multiprocessing.Pool = None
+        try:
+            self.assertFalse(self.run_both(HANDLERS, [(0x100, 0), (0x200, 4)],
+                                           callback=mitsubishi.callback))
+            self.assertIn('the callback may share state',
+                          sys.stderr.getvalue())
+            self.assertFalse(self.run_both(HANDLERS, [(0x100, 0), (0x200, 4)],
+                                           dataflow=True))
+            self.assertIn('dataflow carries registers',
+                          sys.stderr.getvalue())
+        finally:
+            parallel.multiprocessing.Pool = pool
+
+    def test_warnings_printed(self):
+        # Both handlers run off the end of their code; the warnings are
+        # printed after merging, as a single traversal would print them.
+        words = dict(HANDLERS)
+        del words[0x104], words[0x106], words[0x204], words[0x206]
+        roots = [(0x100, 0), (0x200, 4)]
+        stdout = sys.stdout
+        try:
+            sys.stdout = serial = StringIO()
+            sh2.disassemble(roots, routines_model(words))
+            sys.stdout = merged = StringIO()
+            self.assertTrue(parallel.disassemble(
+                roots, routines_model(words), 2))
+        finally:
+            sys.stdout = stdout
+        self.assertEqual(merged.getvalue(), serial.getvalue())
+        self.assertEqual(merged.getvalue().count('giving up'), 2)
+        self.assertEqual(sys.stderr.getvalue(), '')
+
+
+if __name__ == '__main__':
+    unittest.main()
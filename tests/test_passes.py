@@ -0,0 +1,144 @@
+"""Tests for the post-analysis sweep."""
+
+import unittest
+
+from sh2dis import mitsubishi
+from sh2dis import passes
+from sh2dis import pipeline
+from sh2dis import segment
+from sh2dis import sh2
+from sh2dis import synthetic
+
+from test_sh2 import PROGRAM
+
+
+class Recorder(passes.Pass):
+    """Notes everything the sweep hands it."""
+
+    kinds = (sh2.LongField, )
+    opcodes = ('rts', )
+    gaps = True
+
+    def __init__(self, seen, name='recorder'):
+        object.__init__(self)
+        self.seen = seen
+        self.name = name
+
+    def begin(self, model, seg, start, end):
+        self.seen.append((self.name, 'begin', start, end))
+
+    def visit(self, meta):
+        self.seen.append((self.name, 'item', meta.location))
+
+    def gap(self, seg, start, end):
+        self.seen.append((self.name, 'gap', start, end))
+
+    def finish(self, model):
+        self.seen.append((self.name, 'finish'))
+
+
+def program_model():
+    """PROGRAM disassembled at 0x100, after 0x100 undefined bytes."""
+    phys = b'\x00' * 0x100 + bytes(bytearray(
+        byte for word in PROGRAM for byte in (word >> 8, word & 0xFF)))
+    model = segment.MemoryModel('sh7055', [
+        ('rom', 0, len(phys), phys),
+        ('ram', 0xFFFF0000, 0xFFFF1000, None),
+    ])
+    sh2.disassemble([(0x100, None)], model)
+    return model
+
+
+class SweepTest(unittest.TestCase):
+
+    def test_dispatch(self):
+        model = program_model()
+        seen = []
+        passes.sweep(model, [Recorder(seen)])
+        self.assertEqual(seen, [
+            ('recorder', 'begin', 0, 0x124),
+            ('recorder', 'gap', 0, 0x100),
+            ('recorder', 'gap', 0x10A, 0x10C),
+            ('recorder', 'item', 0x10C),
+            ('recorder', 'gap', 0x110, 0x112),
+            ('recorder', 'item', 0x116),
+            ('recorder', 'gap', 0x11A, 0x11C),
+            ('recorder', 'gap', 0x11E, 0x120),
+            ('recorder', 'gap', 0x122, 0x124),
+            ('recorder', 'finish'),
+        ])
+
+    def test_order_of_passes(self):
+        model = program_model()
+        seen = []
+        passes.sweep(model, [Recorder(seen, 'a'), Recorder(seen, 'b')],
+                     ranges=[(0x10C, 0x118)])
+        self.assertEqual(seen, [
+            ('a', 'begin', 0x10C, 0x118), ('b', 'begin', 0x10C, 0x118),
+            ('a', 'item', 0x10C), ('b', 'item', 0x10C),
+            ('a', 'gap', 0x110, 0x112), ('b', 'gap', 0x110, 0x112),
+            ('a', 'item', 0x116), ('b', 'item', 0x116),
+            ('a', 'finish'), ('b', 'finish'),
+        ])
+
+    def test_not_interested(self):
+        model = program_model()
+        seen = []
+
+        class Nothing(Recorder):
+            kinds = ()
+            opcodes = ()
+            gaps = False
+
+        passes.sweep(model, [Nothing(seen)])
+        self.assertEqual(seen, [('recorder', 'begin', 0, 0x124),
+                                ('recorder', 'finish')])
+
+    def test_empty(self):
+        model = segment.MemoryModel('sh7055', [
+            ('rom', 0, 0x10, b'\x00' * 0x10)])
+        seen = []
+        passes.sweep(model, [Recorder(seen)])
+        self.assertEqual(seen, [('recorder', 'begin', 0, 0x10),
+                                ('recorder', 'gap', 0, 0x10),
+                                ('recorder', 'finish')])
+        passes.sweep(model, [], ranges=[])
+
+    def test_items_defined_ahead(self):
+        model = program_model()
+        seen = []
+
+        class Ahead(Recorder):
+            def visit(self, meta):
+                Recorder.visit(self, meta)
+                if meta.location == 0x10C:
+                    model.set_location(sh2.LongField(location=0x11C,
+                                                     model=model))
+
+        passes.sweep(model, [Ahead(seen)], ranges=[(0x10C, 0x124)])
+        self.assertEqual([entry for entry in seen if entry[1] == 'item'],
+                         [('recorder', 'item', 0x10C),
+                          ('recorder', 'item', 0x116),
+                          ('recorder', 'item', 0x11C)])
+
+
+class BuildModelTest(unittest.TestCase):
+
+    def test_same_listing_as_separate_scans(self):
+        phys = synthetic.build_rom(0x40000, 2)
+        processor, segments = pipeline.get_segments(phys)
+        separate = segment.MemoryModel(processor, segments)
+        pipeline.setup_vectors(separate)
+        pipeline.disassemble_vectors(separate, mitsubishi.callback)
+        mitsubishi.fixups(separate)
+        pipeline.scan_free_space(separate)
+        separate.compact_references()
+        combined = pipeline.build_model(phys, mitsu=True)
+        self.assertEqual(
+            list(pipeline.render(combined, pipeline.output_ranges(combined))),
+            list(pipeline.render(separate,
+                                 pipeline.output_ranges(separate))))
+
+
+if __name__ == '__main__':
+    unittest.main()
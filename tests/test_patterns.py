@@ -0,0 +1,163 @@
+"""Tests for the opcode index and instruction pattern search."""
+
+import gc
+import os
+import shutil
+import tempfile
+import unittest
+import weakref
+
+import sh2dis
+from sh2dis import patterns
+from sh2dis import pipeline
+from sh2dis import project
+from sh2dis import sh2
+
+from test_batch import tiny_rom
+from test_sh2 import program_model
+
+
+def disassembled():
+    """PROGRAM at zero, disassembled from its first instruction."""
+    model = program_model()
+    sh2.disassemble([(0, None)], model)
+    return model
+
+
+class OpcodeIndexTest(unittest.TestCase):
+
+    def test_locations(self):
+        index = sh2.opcode_index(disassembled())
+        self.assertEqual(index.commands(), [
+            'bra', 'bsr', 'bt', 'jmp', 'mov.l', 'mov.w', 'nop', 'rts'])
+        self.assertEqual(list(index.locations('nop')), [4, 8, 0x18])
+        self.assertEqual(list(index.locations('jmp')), [0x20])
+        self.assertEqual(list(index.locations('mova')), [])
+
+    def test_later_disassembly(self):
+        model = disassembled()
+        index = sh2.opcode_index(model)
+        self.assertEqual(list(index.locations('nop')), [4, 8, 0x18])
+        # Walking known code again doesn't index it twice.
+        sh2.disassemble([(0x10, None), (0, None)], model)
+        self.assertIs(sh2.opcode_index(model), index)
+        self.assertEqual(list(index.locations('nop')), [4, 8, 0x10, 0x18])
+        self.assertEqual(list(index.locations('bt')), [0x12])
+
+    def test_model_edits(self):
+        model = disassembled()
+        index = sh2.opcode_index(model)
+        self.assertEqual(list(index.locations('bra')), [6])
+        # A long over the bra and its slot, the jmp undefined, and code
+        # laid out by hand.
+        model.set_location(sh2.LongField(location=6, model=model))
+        model.unset_location(0x20)
+        opcode, args = sh2.decode(0x0009, 0x1E)
+        model.set_location(sh2.CodeField(
+            location=0x1E, width=2, model=model,
+            extra=sh2.CodeExtra(0x0009, opcode, args)))
+        self.assertEqual(list(index.locations('bra')), [])
+        self.assertEqual(list(index.locations('nop')), [4, 0x18, 0x1E])
+        self.assertEqual(index.commands(), [
+            'bsr', 'bt', 'mov.l', 'mov.w', 'nop', 'rts'])
+        self.assertEqual(index.changes, [])
+
+    def test_model_freed(self):
+        # The index must not keep its model alive, queried or not.
+        for query in (False, True):
+            model = disassembled()
+            if query:
+                sh2.opcode_index(model).commands()
+            ref = weakref.ref(model)
+            del model
+            gc.collect()
+            self.assertIsNone(ref())
+        # An index outliving its model just stops changing.
+        model = disassembled()
+        index = sh2.opcode_index(model)
+        model.unset_location(0x20)
+        del model
+        gc.collect()
+        self.assertEqual(list(index.locations('jmp')), [0x20])
+
+    def test_empty_model(self):
+        index = sh2.opcode_index(program_model())
+        self.assertEqual(index.commands(), [])
+        self.assertEqual(list(index.locations('nop')), [])
+
+    def test_loaded_model(self):
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, 'rom.sh2p')
+            model = pipeline.build_model(tiny_rom())
+            project.save(model, path)
+            loaded = project.load(path)
+        finally:
+            shutil.rmtree(directory)
+        self.assertEqual(list(sh2.opcode_index(loaded).locations('rts')),
+                         [0x400])
+        self.assertEqual(list(sh2.opcode_index(loaded).locations('rte')),
+                         [0x410])
+
+
+class PatternTest(unittest.TestCase):
+
+    def setUp(self):
+        self.model = disassembled()
+
+    def search(self, text, start=None, end=None):
+        return patterns.search(self.model, text, start, end)
+
+    def test_mnemonics(self):
+        self.assertEqual(self.search('nop'), [4, 8, 0x18])
+        self.assertEqual(self.search('bra ; nop'), [6])
+        self.assertEqual(self.search('mov.w ; rts ; nop'), [0x14])
+        self.assertEqual(self.search('* ; nop'), [2, 6, 0x16])
+
+    def test_operands(self):
+        self.assertEqual(self.search('mov.l @(*,pc), r1'), [0])
+        self.assertEqual(self.search('mov.l @(*,pc), r2'), [])
+        self.assertEqual(self.search('bsr sub_20 ; *'), [2])
+
+    def test_values(self):
+        self.assertEqual(self.search('mov.l = 0x40'), [0])
+        self.assertEqual(self.search('mov.w = 0x1234 ; rts'), [0x14])
+        self.assertEqual(self.search('mov.l = 0x41'), [])
+        # Branches have targets, but no value is loaded from them.
+        self.assertEqual(self.search('bra = 0x8901'), [])
+
+    def test_not_code(self):
+        # 0x1E is never reached and 0x22 isn't an instruction.
+        self.assertEqual(self.search('* ; jmp'), [])
+        self.assertEqual(self.search('jmp ; *'), [])
+        self.assertEqual(self.search('rts ; nop ; nop'), [])
+
+    def test_range(self):
+        self.assertEqual(self.search('nop', 5, 0x18), [8])
+        self.assertEqual(self.search('nop', 0x19), [])
+        self.assertEqual(self.search('* ; nop', 6, 0x16), [6])
+        self.assertEqual(self.search('* ; nop', end=6), [2])
+
+    def test_compiled(self):
+        pattern = patterns.Pattern('rts ; *')
+        self.assertEqual(patterns.search(self.model, pattern), [0x16])
+        self.assertTrue(pattern.match_at(self.model, 0x16))
+        self.assertFalse(pattern.match_at(self.model, 0x18))
+        self.assertFalse(pattern.match_at(self.model, 0x1000))
+
+    def test_invalid(self):
+        for text in ('* ; *', 'mov.w = x', 'nop ; ; rts', ''):
+            self.assertRaises(patterns.PatternError, patterns.Pattern,
+                              text)
+
+
+class FindTest(unittest.TestCase):
+
+    def test_find(self):
+        result = sh2dis.analyze(tiny_rom())
+        self.assertEqual(result.find('rte ; nop'), [0x410])
+        self.assertEqual(result.find('rts', 0x401), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
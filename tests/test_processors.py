@@ -0,0 +1,86 @@
+"""Tests for the processor tables and how they are loaded."""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from sh2dis import pipeline
+from sh2dis import processors
+from sh2dis import project
+
+from test_batch import tiny_rom
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class ProcessorTest(unittest.TestCase):
+
+    def test_tables(self):
+        for name in processors.PROCESSORS:
+            processor = processors.load(name)
+            for table in (processor.VECTORS, processor.REGISTERS):
+                self.assertTrue(isinstance(table, tuple))
+                addresses = [entry[0] for entry in table]
+                self.assertEqual(addresses, sorted(set(addresses)))
+                for _, size, label, comment in table:
+                    self.assertTrue(size in (1, 2, 4))
+                    self.assertTrue(label)
+                    self.assertTrue(comment is None or comment)
+            self.assertEqual(processor.VECTORS[0],
+                             (0, 4, 'v_power_on_pc', 'Power-on reset (PC)'))
+
+    def test_load(self):
+        self.assertIs(processors.load('sh7055'),
+                      processors.load('sh2dis.sh7055'))
+        self.assertIsNot(processors.load('sh7052'),
+                         processors.load('sh7055'))
+        for name in ('sh7058', 'sh2dis.sh2', '', 'os'):
+            self.assertRaises(ValueError, processors.load, name)
+
+    def test_get_segments(self):
+        processor, _ = pipeline.get_segments(b'\xff' * 0x40000)
+        self.assertEqual(processor.__name__, 'sh2dis.sh7052')
+        processor, _ = pipeline.get_segments(b'\xff' * 0x80000)
+        self.assertEqual(processor.__name__, 'sh2dis.sh7055')
+        self.assertRaises(pipeline.ROMError, pipeline.get_segments, b'')
+
+    def test_lazy_import(self):
+        # Neither processor table nor numpy is imported up front.
+        script = ('import sys, sh2dis.__main__; print(" ".join(name for name '
+                  'in ("sh2dis.sh7052", "sh2dis.sh7055", "numpy") '
+                  'if name in sys.modules))')
+        output = subprocess.check_output([sys.executable, '-c', script],
+                                         cwd=ROOT)
+        self.assertEqual(output.strip(), b'')
+
+
+class ProjectProcessorTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'rom.sh2p')
+        project.save(pipeline.build_model(tiny_rom()), self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_loaded_by_name(self):
+        loaded = project.load(self.path)
+        self.assertIs(loaded.processor, processors.load('sh7052'))
+
+    def test_unknown_processor(self):
+        with open(self.path, 'rb') as projfile:
+            data = projfile.read()
+        self.assertTrue(b'"sh2dis.sh7052"' in data)
+        with open(self.path, 'wb') as projfile:
+            projfile.write(data.replace(b'"sh2dis.sh7052"',
+                                        b'"sh2dis.sh7099"'))
+        self.assertRaises(project.ProjectError, project.load, self.path)
+
+
+if __name__ == '__main__':
+    unittest.main()
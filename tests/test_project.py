@@ -0,0 +1,250 @@
+"""Tests for saving and loading project files."""
+
+import gc
+import json
+import os
+import shutil
+import struct
+import tempfile
+import unittest
+
+from sh2dis import cache
+from sh2dis import mitsubishi
+from sh2dis import pipeline
+from sh2dis import project
+from sh2dis import segment
+from sh2dis import sh2
+from sh2dis import synthetic
+
+from test_batch import tiny_rom
+
+
+def listing(model):
+    return '\n'.join(pipeline.render(model, pipeline.output_ranges(model,
+                                                                   True)))
+
+
+class ProjectTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'rom.sh2p')
+        self.rom = tiny_rom()
+        self.model = pipeline.build_model(self.rom)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+
+class RoundTripTest(ProjectTestCase):
+
+    def test_embedded_rom(self):
+        project.save(self.model, self.path)
+        loaded = project.load(self.path)
+        self.assertEqual(listing(loaded), listing(self.model))
+        self.assertIs(loaded.processor, self.model.processor)
+        self.assertEqual(loaded.get_phys(0x400, 4), self.rom[0x400:0x404])
+
+    def test_separate_rom(self):
+        project.save(self.model, self.path, include_phys=False)
+        self.assertRaises(project.ProjectError, project.load, self.path)
+        loaded = project.load(self.path, self.rom)
+        self.assertEqual(listing(loaded), listing(self.model))
+
+    def test_items(self):
+        self.model.get_location(0x400).comment = 'entry\npoint'
+        project.save(self.model, self.path)
+        loaded = project.load(self.path)
+        code = loaded.get_location(0x400)
+        self.assertIsInstance(code, sh2.CodeField)
+        self.assertEqual(code.comment, 'entry\npoint')
+        self.assertEqual((code.extra.instruction, code.extra.text),
+                         (0x000B, 'rts'))
+        self.assertIs(code.model, loaded)
+        # Registers have no backing data; None survives the trip.
+        reg = self.model.get_segment(0xFFFFE400)
+        for meta in reg.iter_locations(reg.start, reg.end):
+            self.assertIsNone(meta.extra)
+            self.assertIsNone(loaded.get_location(meta.location).extra)
+        null = loaded.get_location(0x500)
+        self.assertIsInstance(null, sh2.NullField)
+        self.assertEqual(null.location, 0x414)
+
+    def test_labels_and_references(self):
+        self.model.set_label(0x402, u'slot_\u00b5')
+        project.save(self.model, self.path)
+        loaded = project.load(self.path)
+        self.assertEqual(loaded.get_label(0x402), self.model.get_label(0x402))
+        self.assertEqual(loaded.get_references(0x410),
+                         self.model.get_references(0x410))
+        self.assertEqual(loaded.get_references(0x400), [0])
+        self.assertEqual(loaded.get_references(0x404), [])
+
+    def test_composites(self):
+        self.model.unset_location(0x414)
+        table = segment.CompositeData(items_per_line=2, model=self.model,
+                                      comment='table', extra=7)
+        for location in (0x414, 0x418):
+            meta = sh2.LongField(location=location, model=self.model,
+                                 member_of=table)
+            self.model.set_location(meta)
+            table.members.append(meta)
+        project.save(self.model, self.path)
+        loaded = project.load(self.path)
+        group = loaded.get_location(0x414).member_of
+        self.assertEqual([meta.location for meta in group.members],
+                         [0x414, 0x418])
+        self.assertIs(loaded.get_location(0x418).member_of, group)
+        self.assertEqual((group.comment, group.extra, group.items_per_line),
+                         ('table', 7, 2))
+        self.assertEqual(listing(loaded), listing(self.model))
+
+    def test_empty_model(self):
+        model = segment.MemoryModel(self.model.processor, [
+            ('ROM', 0, 0x10, b'\x00' * 0x10)])
+        project.save(model, self.path)
+        loaded = project.load(self.path)
+        self.assertEqual(listing(loaded), listing(model))
+
+
+class ProjectFileTest(ProjectTestCase):
+
+    def test_columns(self):
+        project.save(self.model, self.path)
+        with project.ProjectFile(self.path) as projfile:
+            starts = list(projfile.columns['item_start'])
+            self.assertEqual(starts[:2], [0, 4])
+            self.assertEqual(len(projfile.columns['xref_offset']),
+                             len(projfile.columns['xref_location']) + 1)
+            strings = projfile.strings()
+            self.assertEqual(len(strings), len(set(strings)))
+            self.assertIn('power_on_pc', strings)
+            self.assertEqual([bytes(image) for image in projfile.phys()],
+                             [self.rom])
+        self.assertEqual(projfile.columns, {})
+
+    def test_not_a_project(self):
+        with open(self.path, 'wb') as projfile:
+            projfile.write(b'PK\x03\x04' + b'\x00' * 60)
+        self.assertRaises(project.ProjectError, project.ProjectFile,
+                          self.path)
+
+    def test_other_version(self):
+        project.save(self.model, self.path)
+        with open(self.path, 'r+b') as projfile:
+            projfile.seek(len(project.MAGIC))
+            projfile.write(struct.pack('<I', project.VERSION + 1))
+        self.assertRaises(project.ProjectError, project.load, self.path)
+
+    def test_missing_file(self):
+        self.assertRaises(EnvironmentError, project.load, self.path)
+
+
+@unittest.skipUnless(os.path.exists('/proc/self/maps'),
+                     'needs /proc/self/maps to see mappings')
+class MappingTest(ProjectTestCase):
+
+    def mapped(self):
+        gc.collect()
+        with open('/proc/self/maps') as maps:
+            return self.path in maps.read()
+
+    def test_closed_after_load(self):
+        project.save(self.model, self.path, include_phys=False)
+        project.load(self.path, self.rom)
+        self.assertFalse(self.mapped())
+
+    def test_embedded_rom_is_a_view(self):
+        project.save(self.model, self.path)
+        loaded = project.load(self.path)
+        phys = loaded.get_segment(0).phys
+        self.assertTrue(isinstance(phys, memoryview))
+        self.assertEqual(bytes(phys), self.rom)
+        self.assertTrue(self.mapped())
+        self.assertEqual(listing(loaded), listing(self.model))
+        del loaded, phys
+        self.assertFalse(self.mapped())
+
+    def test_closed_on_bad_header(self):
+        project.save(self.model, self.path)
+        with open(self.path, 'r+b') as projfile:
+            projfile.seek(len(project.MAGIC))
+            projfile.write(struct.pack('<I', 0))
+        self.assertRaises(project.ProjectError, project.ProjectFile,
+                          self.path)
+        self.assertFalse(self.mapped())
+
+    def test_closed_on_restore_error(self):
+        project.save(self.model, self.path, include_phys=False)
+        self.assertRaises(project.ProjectError, project.load, self.path)
+        self.assertFalse(self.mapped())
+        # An item of a kind that doesn't exist.
+        with project.ProjectFile(self.path) as projfile:
+            offset = projfile.base + projfile.header['columns'][
+                'item_kind'][0]
+        with open(self.path, 'r+b') as projfile:
+            projfile.seek(offset)
+            projfile.write(b'\xff')
+        self.assertRaises(IndexError, project.load, self.path, self.rom)
+        self.assertFalse(self.mapped())
+
+
+class MitsubishiTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.rom = synthetic.build_rom(0x40000, 11)
+        cls.model = pipeline.build_model(cls.rom, mitsu=True)
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'rom.sh2p')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def assertSameFindings(self, loaded):
+        tables = mitsubishi.get_tables(self.model)
+        self.assertTrue(tables)
+        self.assertTrue(any(table.xaxis is None for table in tables.values()))
+        self.assertEqual(mitsubishi.get_tables(loaded), tables)
+        self.assertEqual(mitsubishi.get_axes(loaded),
+                         mitsubishi.get_axes(self.model))
+
+    def test_round_trip(self):
+        project.save(self.model, self.path)
+        self.assertSameFindings(project.load(self.path))
+
+    def test_without_phys(self):
+        project.save(self.model, self.path, include_phys=False)
+        self.assertSameFindings(project.load(self.path, self.rom))
+
+    def test_cache(self):
+        cache.cached_model(self.rom, self.directory, mitsu=True)
+        self.assertSameFindings(cache.cached_model(self.rom, self.directory,
+                                                   mitsu=True))
+
+    def test_version_1(self):
+        # Version 1 files have no table or axis columns; they still open.
+        project.save(self.model, self.path)
+        with open(self.path, 'rb') as projfile:
+            data = bytearray(projfile.read())
+        _, _, header_len = struct.unpack_from('<8sII', data, 0)
+        start = len(project.MAGIC) + 8
+        header = json.loads(data[start:start + header_len].decode('utf-8'))
+        for name in list(header['columns']):
+            if name.startswith(('axis_', 'table_')):
+                del header['columns'][name]
+        text = json.dumps(header).encode('utf-8')
+        data[start:start + header_len] = text.ljust(header_len)
+        struct.pack_into('<I', data, len(project.MAGIC), 1)
+        with open(self.path, 'wb') as projfile:
+            projfile.write(data)
+        loaded = project.load(self.path)
+        self.assertEqual(mitsubishi.get_tables(loaded), {})
+        self.assertEqual(mitsubishi.get_axes(loaded), {})
+        self.assertEqual(listing(loaded), listing(self.model))
+
+
+if __name__ == '__main__':
+    unittest.main()
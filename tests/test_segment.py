@@ -0,0 +1,438 @@
+"""Tests for segment storage and the memory model."""
+
+import mmap
+import random
+import struct
+import tempfile
+import unittest
+
+from sh2dis import segment
+
+
+class Item(segment.SegmentData):
+    """A bare data item of any width."""
+
+    def get_instruction(self, no_cmd=False):
+        return '.item %d' % self.width
+
+
+class SegmentTest(unittest.TestCase):
+
+    def setUp(self):
+        self.model = segment.MemoryModel('sh7055', [
+            ('rom', 0x1000, 0x1100, b'\x00' * 0x100),
+            ('ram', 0xFFFF0000, 0xFFFF0010, None),
+        ])
+
+    def item(self, location, width, comment=None):
+        meta = Item(location=location, width=width, model=self.model,
+                    comment=comment)
+        self.model.set_location(meta)
+        return meta
+
+    def test_every_byte_finds_its_item(self):
+        meta = self.item(0x1010, 4)
+        for location in range(0x1010, 0x1014):
+            self.assertIs(self.model.get_location(location), meta)
+        self.assertIsNone(self.model.get_location(0x100F))
+        self.assertIsNone(self.model.get_location(0x1014))
+        self.assertTrue(self.model.location_isset(0x1013))
+        self.assertFalse(self.model.location_isset(0x1014))
+
+    def test_unset_from_inside(self):
+        self.item(0x1010, 4)
+        self.model.unset_location(0x1012)
+        for location in range(0x1010, 0x1014):
+            self.assertIsNone(self.model.get_location(location))
+        # Unsetting nothing is harmless.
+        self.model.unset_location(0x1012)
+
+    def test_absorb_smaller_items(self):
+        self.item(0x1020, 2, comment='first')
+        self.item(0x1022, 2, comment='second')
+        self.model.add_reference(0x1022, 0x1080)
+        wide = self.item(0x1020, 4, comment='wide')
+        self.assertIs(self.model.get_location(0x1022), wide)
+        self.assertEqual(wide.comment, 'wide\nfirst\nsecond')
+        self.assertEqual(self.model.get_references(0x1020), [0x1080])
+
+    def test_label_just_past_an_item(self):
+        # A reference to the byte after an item is labelled from the item.
+        self.item(0x1010, 4)
+        self.model.set_label(0x1010, 'table')
+        self.model.add_reference(0x1014, 0x1000)
+        self.assertEqual(self.model.get_label(0x1014), 'table+4')
+        self.assertEqual(self.model.get_label(0x1013), 'table+3')
+        self.assertIsNone(self.model.get_label(0x1015))
+        # A gap of one byte is too far.
+        self.item(0x1020, 2)
+        self.model.add_reference(0x1023, 0x1000)
+        self.assertEqual(self.model.get_label(0x1023), 'unk_1023')
+
+    def test_conflicting_writes(self):
+        self.item(0x1030, 4)
+        # Starting inside an item, or running into the middle of one.
+        self.assertRaises(segment.SegmentError, self.item, 0x1032, 2)
+        self.assertRaises(segment.SegmentError, self.item, 0x102E, 4)
+        self.assertRaises(segment.SegmentError, self.item, 0x1031, 1)
+        # The original item is untouched.
+        self.assertEqual(self.model.get_location(0x1033).location, 0x1030)
+
+    def test_outside_any_segment(self):
+        self.assertRaises(segment.SegmentError, self.model.get_location,
+                          0x2000)
+        self.assertRaises(segment.SegmentError, self.item, 0x0FFF, 1)
+        self.assertFalse(self.model.location_isset(0x2000))
+        self.assertRaises(segment.SegmentError, self.model.get_phys,
+                          0xFFFF0000)
+
+    def test_labels(self):
+        meta = self.item(0x1040, 2)
+        self.assertIsNone(self.model.get_label(0x1040))
+        self.model.add_reference(0x1040, 0x1000)
+        self.assertEqual(self.model.get_label(0x1040), 'unk_1040')
+        self.assertEqual(self.model.get_label(0x1041), 'unk_1040+1')
+        meta.unknown_prefix = 'word'
+        self.assertEqual(self.model.get_label(0x1040), 'word_1040')
+        self.model.set_label(0x1040, 'table')
+        self.assertEqual(self.model.get_label(0x1041), 'table+1')
+        self.model.set_label(0x1040, None)
+        self.assertEqual(self.model.get_label(0x1040), 'word_1040')
+
+    def test_references(self):
+        for reference in (0x1050, 0x1010, 0x1030, 0x1010):
+            self.model.add_reference(0x1060, reference)
+        # Sorted, without duplicates or self-references.
+        self.model.add_reference(0x1060, 0x1060)
+        self.assertEqual(self.model.get_references(0x1060),
+                         [0x1010, 0x1030, 0x1050])
+        self.model.remove_reference(0x1060, 0x1030)
+        self.model.remove_reference(0x1060, 0x1034)
+        self.model.remove_reference(0x1064, 0x1030)
+        self.assertEqual(self.model.get_references(0x1060),
+                         [0x1010, 0x1050])
+        self.assertEqual(self.model.get_references(0x1064), [])
+
+    def test_comments(self):
+        self.assertEqual(self.model.generate_comments(0x1070), [])
+        for reference in range(0x1000, 0x1010, 2):
+            self.model.add_reference(0x1070, reference)
+        text = ' '.join(self.model.generate_comments(0x1070))
+        self.assertTrue(text.startswith('XREF:'))
+        self.assertTrue(text.endswith('...'))
+        self.assertNotIn('0x100C', text)
+
+    def test_ram_items(self):
+        meta = self.item(0xFFFF0004, 4)
+        self.assertIs(self.model.get_location(0xFFFF0007), meta)
+        self.assertEqual(self.model.get_segment_name(0xFFFF0004), 'ram')
+        self.assertEqual(self.model.get_phys_ranges(), [(0x1000, 0x1100)])
+
+
+class IntervalTest(unittest.TestCase):
+
+    def setUp(self):
+        self.model = segment.MemoryModel('sh7055', [
+            ('rom', 0x1000, 0x2000, b'\x00' * 0x1000)])
+        self.seg = self.model.get_segment(0x1000)
+
+    def item(self, location, width):
+        meta = Item(location=location, width=width, model=self.model)
+        self.model.set_location(meta)
+        return meta
+
+    def test_wide_values(self):
+        wide = self.item(0x1100, 0x100)
+        small = self.item(0x1200, 2)
+        self.assertIsNone(self.model.get_location(0x10FF))
+        for location in (0x1100, 0x1104, 0x1180, 0x11FF):
+            self.assertIs(self.model.get_location(location), wide)
+        self.assertIs(self.model.get_location(0x1201), small)
+        self.assertIsNone(self.model.get_location(0x1202))
+
+    def test_narrow_after_wide(self):
+        # A narrow value inside the probe distance of a wide one's end.
+        self.item(0x1100, 0x10)
+        narrow = self.item(0x1112, 1)
+        self.assertIsNone(self.model.get_location(0x1110))
+        self.assertIsNone(self.model.get_location(0x1111))
+        self.assertIs(self.model.get_location(0x1112), narrow)
+        self.assertIsNone(self.model.get_location(0x1113))
+
+    def test_conflicts(self):
+        self.item(0x1100, 0x100)
+        # Inside, across the end, and across the start of the wide value.
+        for location, width in ((0x1180, 2), (0x11FE, 4), (0x10FE, 4)):
+            self.assertRaises(segment.SegmentError, self.item, location,
+                              width)
+        self.assertEqual(list(self.seg.iter_locations(0x1000, 0x2000)),
+                         [self.model.get_location(0x1100)])
+
+    def test_absorbs_many(self):
+        for location in range(0x1100, 0x1200, 4):
+            self.item(location, 4)
+        wide = self.item(0x1100, 0x100)
+        self.assertEqual(list(self.seg.iter_locations(0x1000, 0x2000)),
+                         [wide])
+        self.model.unset_location(0x1150)
+        self.assertIsNone(self.model.get_location(0x1100))
+        self.assertEqual(self.seg.wide, [])
+
+    def test_next_location(self):
+        first = self.item(0x1100, 2)
+        second = self.item(0x1108, 0x20)
+        self.assertIs(self.seg.next_location(0x1000), first)
+        self.assertIs(self.seg.next_location(0x1100), first)
+        self.assertIs(self.seg.next_location(0x1101), second)
+        self.assertIsNone(self.seg.next_location(0x1109))
+        self.model.unset_location(0x1108)
+        self.assertIsNone(self.seg.next_location(0x1101))
+        # Values added after an ordered query are still found.
+        third = self.item(0x1104, 1)
+        self.assertIs(self.seg.next_location(0x1101), third)
+
+    def test_iter_locations_bounds(self):
+        self.item(0x1100, 0x10)
+        self.item(0x1110, 2)
+        self.assertEqual(
+            [meta.location for meta in self.seg.iter_locations(0x1101,
+                                                               0x1112)],
+            [0x1110])
+        self.assertEqual(list(self.seg.iter_locations(0x1000, 0x1100)), [])
+
+    def test_random_edits(self):
+        # Lookups agree with a per-byte map of the stored values.
+        rng = random.Random(17)
+        for _ in range(400):
+            location = rng.randrange(0x1000, 0x1F00)
+            if rng.random() < 0.3:
+                self.model.unset_location(location)
+                continue
+            try:
+                self.item(location, rng.choice((1, 2, 4, 8, 0x40)))
+            except segment.SegmentError:
+                pass
+        values = sorted(self.seg.values.values(),
+                        key=lambda meta: meta.location)
+        self.assertEqual(list(self.seg.iter_locations(0x1000, 0x2000)),
+                         values)
+        covering = {}
+        for meta in values:
+            for i in range(meta.location, meta.location + meta.width):
+                self.assertNotIn(i, covering)
+                covering[i] = meta
+        for location in range(0x1000, 0x2000):
+            self.assertIs(self.model.get_location(location),
+                          covering.get(location), '%#x' % location)
+
+
+class XrefTest(unittest.TestCase):
+
+    def setUp(self):
+        self.model = segment.MemoryModel('sh7055', [
+            ('rom', 0x1000, 0x1100, b'\x00' * 0x100)])
+        self.seg = self.model.get_segment(0x1000)
+
+    def test_random_with_compaction(self):
+        rng = random.Random(19)
+        expected = {}
+        for step in range(2000):
+            location = rng.randrange(0x1000, 0x1100)
+            reference = rng.randrange(0x1000, 0x1100)
+            self.model.add_reference(location, reference)
+            if reference != location:
+                expected.setdefault(location, set()).add(reference)
+            if step % 397 == 0:
+                self.model.compact_references()
+            if step % 101 == 0:
+                self.assertEqual(self.model.get_references(location),
+                                 sorted(expected[location]))
+        for location in range(0x1000, 0x1100):
+            self.assertEqual(self.model.get_references(location),
+                             sorted(expected.get(location, ())))
+        self.assertEqual(list(self.seg.iter_references()),
+                         [(location, sorted(expected[location]))
+                          for location in sorted(expected)])
+        self.assertEqual(self.seg.added_references, {})
+
+    def test_ignored(self):
+        self.model.add_reference(0x1010, None)
+        self.model.add_reference(0x1010, 0x1010)
+        self.assertEqual(self.model.get_references(0x1010), [])
+        self.assertIsNone(self.model.get_label(0x1010))
+        self.assertEqual(list(self.seg.iter_references()), [])
+
+    def test_remove(self):
+        for reference in (0x1030, 0x1020, 0x1030):
+            self.model.add_reference(0x1010, reference)
+        self.model.add_reference(0x1014, 0x1020)
+        # Removing something absent leaves everything alone.
+        self.model.remove_reference(0x1010, 0x1040)
+        self.model.remove_reference(0x1018, 0x1040)
+        self.model.remove_reference(0x1010, 0x1030)
+        self.assertEqual(self.model.get_references(0x1010), [0x1020])
+        self.assertEqual(self.model.get_label(0x1010), 'unk_1010')
+        self.model.remove_reference(0x1010, 0x1020)
+        self.assertEqual(self.model.get_references(0x1010), [])
+        self.assertIsNone(self.model.get_label(0x1010))
+        self.assertEqual(list(self.seg.iter_references()),
+                         [(0x1014, [0x1020])])
+
+    def test_added_after_compaction(self):
+        self.model.add_reference(0x1010, 0x1030)
+        self.model.compact_references()
+        self.model.add_reference(0x1010, 0x1020)
+        self.model.add_reference(0x1010, 0x1030)
+        self.assertEqual(self.model.get_references(0x1010),
+                         [0x1020, 0x1030])
+        self.model.compact_references()
+        self.assertEqual(list(self.seg.xref_sources), [0x1020, 0x1030])
+
+    def test_absorbed_references_move(self):
+        model = self.model
+        model.set_location(Item(location=0x1012, width=2, model=model))
+        model.add_reference(0x1012, 0x1040)
+        model.compact_references()
+        model.add_reference(0x1012, 0x1044)
+        model.set_location(Item(location=0x1010, width=4, model=model))
+        self.assertEqual(model.get_references(0x1010), [0x1040, 0x1044])
+
+
+class ReadTest(unittest.TestCase):
+
+    DATA = bytes(bytearray(range(0x80, 0x100)) + bytearray(range(0x80)))
+
+    def model(self, phys):
+        return segment.MemoryModel('sh7055', [
+            ('rom', 0x1000, 0x1000 + len(self.DATA), phys),
+            ('ram', 0xFFFF0000, 0xFFFF0100, None),
+        ])
+
+    def check(self, phys):
+        model = self.model(phys)
+        seg = model.get_segment(0x1000)
+        for offset in (0, 1, 0x7E, 0x7F, 0xFC):
+            location = 0x1000 + offset
+            word = struct.unpack('>H', self.DATA[offset:offset + 2])[0]
+            long_ = struct.unpack('>L', self.DATA[offset:offset + 4])[0]
+            self.assertEqual(model.read_u8(location),
+                             bytearray(self.DATA)[offset])
+            self.assertEqual(model.read_u16be(location), word)
+            self.assertEqual(model.read_u32be(location), long_)
+            self.assertEqual(seg.read_u32be(location), long_)
+
+    def test_buffers(self):
+        self.check(self.DATA)
+        self.check(bytearray(self.DATA))
+        self.check(memoryview(self.DATA))
+        with tempfile.TemporaryFile() as romfile:
+            romfile.write(self.DATA)
+            romfile.flush()
+            phys = mmap.mmap(romfile.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                self.check(phys)
+            finally:
+                phys.close()
+
+    def test_no_phys(self):
+        model = self.model(self.DATA)
+        for read in (model.read_u8, model.read_u16be, model.read_u32be):
+            self.assertRaises(segment.SegmentError, read, 0xFFFF0010)
+            self.assertRaises(segment.SegmentError, read, 0x2000)
+        # Segments themselves read unbacked memory as zero.
+        ram = model.get_segment(0xFFFF0000)
+        self.assertEqual(ram.read_u32be(0xFFFF0010), 0)
+
+    def test_past_the_end(self):
+        model = self.model(self.DATA)
+        self.assertEqual(model.read_u16be(0x10FE), 0x7E7F)
+        self.assertRaises(struct.error, model.read_u32be, 0x10FE)
+
+
+class ObserverTest(unittest.TestCase):
+
+    def setUp(self):
+        self.model = segment.MemoryModel('sh7055', [
+            ('rom', 0x1000, 0x1100, b'\x00' * 0x100)])
+        self.changes = []
+        self.model.observers.append(
+            lambda *change: self.changes.append(change))
+
+    def test_changes(self):
+        model = self.model
+        model.set_location(Item(location=0x1010, width=4, model=model))
+        model.set_label(0x1010, 'table')
+        model.add_reference(0x1010, 0x1000)
+        model.remove_reference(0x1010, 0x1000)
+        model.unset_location(0x1012)
+        self.assertEqual(self.changes, [
+            ('item', 0x1010, 4), ('label', 0x1010, 1), ('xref', 0x1010, 1),
+            ('xref', 0x1010, 1), ('item', 0x1010, 4)])
+
+    def test_nothing_to_unset(self):
+        self.model.unset_location(0x1020)
+        self.assertEqual(self.changes, [])
+
+    def test_failed_change(self):
+        self.assertRaises(segment.SegmentError, self.model.set_label,
+                          0x2000, 'outside')
+        self.assertEqual(self.changes, [])
+
+    def test_reads(self):
+        model = self.model
+        reads = []
+        model.readers.append(lambda *read: reads.append(read))
+        model.set_location(Item(location=0x1010, width=4, model=model))
+        model.get_location(0x1012)
+        model.get_label(0x1010)
+        model.generate_comments(0x1010)
+        self.assertRaises(segment.SegmentError, model.get_location, 0x2000)
+        self.assertEqual(reads, [('item', 0x1012), ('label', 0x1010),
+                                 ('comments', 0x1010), ('item', 0x2000)])
+        self.assertEqual(self.changes, [('item', 0x1010, 4)])
+
+
+class LookupTest(unittest.TestCase):
+
+    def setUp(self):
+        # Deliberately out of order, with gaps between segments.
+        self.model = segment.MemoryModel('sh7055', [
+            ('ram', 0xFFFF8000, 0xFFFFF000, None),
+            ('rom', 0, 0x100, b'\xff' * 0x100),
+            ('io', 0xFFFFF000, 0x100000000, None),
+            ('ext', 0x200, 0x300, None),
+        ])
+
+    def test_boundaries(self):
+        expected = [(0, 'rom'), (0xFF, 'rom'), (0x200, 'ext'),
+                    (0x2FF, 'ext'), (0xFFFF8000, 'ram'),
+                    (0xFFFFEFFF, 'ram'), (0xFFFFF000, 'io'),
+                    (0xFFFFFFFF, 'io')]
+        # Both in order and jumping around, so the last-hit cache is
+        # exercised from every direction.
+        for pairs in (expected, expected[::-1], expected[::3]):
+            for location, name in pairs:
+                self.assertEqual(self.model.get_segment(location).name, name)
+                self.assertEqual(self.model.get_segment_name(location), name)
+
+    def test_gaps(self):
+        for location in (-1, 0x100, 0x1FF, 0x300, 0xFFFF7FFF, 0x100000000):
+            # Prime the cache with a neighbour first.
+            self.model.get_segment(0xFF)
+            self.assertRaises(segment.SegmentError, self.model.get_segment,
+                              location)
+            self.assertFalse(self.model.location_isset(location))
+
+    def test_segment_identity(self):
+        seg = self.model.get_segment(0x250)
+        self.assertIs(seg, self.model.get_segment(0x200))
+        self.assertIn(seg, self.model.segments)
+
+    def test_empty_model(self):
+        model = segment.MemoryModel('sh7055', [])
+        self.assertRaises(segment.SegmentError, model.get_segment, 0)
+        self.assertEqual(model.get_phys_ranges(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,503 @@
+"""Tests for SH2 instruction decoding."""
+
+import random
+import struct
+import unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from sh2dis import segment
+from sh2dis import sh2
+from sh2dis import sh2opcodes
+
+
+def first_match(instruction):
+    """Find an instruction's registry index the slow way, first match wins."""
+    for index, entry in enumerate(sh2opcodes.OPCODES):
+        instbits, instmask = entry['opmask']
+        if instruction & instmask == instbits:
+            return index
+    return None
+
+
+def decode_target(instruction, progc):
+    """Decode a word at progc and return its opcode and args."""
+    opcode, args = sh2.lookup_instruction(instruction)
+    sh2.calculate_disp_target(opcode, args, progc)
+    return opcode, args
+
+
+class DecodeTableTest(unittest.TestCase):
+
+    def test_every_word(self):
+        table = sh2.decode_table()
+        self.assertEqual(len(table), 0x10000)
+        for instruction in range(0x10000):
+            opcode = table[instruction]
+            index = first_match(instruction)
+            if index is None:
+                self.assertIsNone(opcode, '%#06x' % instruction)
+            else:
+                self.assertEqual(opcode.index, index, '%#06x' % instruction)
+
+    def test_built_once(self):
+        self.assertIs(sh2.decode_table(), sh2.decode_table())
+
+    def test_lookup(self):
+        opcode, args = sh2.lookup_instruction(0x7105)
+        self.assertEqual(opcode.cmd, 'add')
+        self.assertEqual(args, {'m': None, 'n': 1, 'imm': 5, 'disp': None})
+        opcode, args = sh2.lookup_instruction(0x6123)
+        self.assertEqual(opcode.cmd, 'mov')
+        self.assertEqual((args['m'], args['n']), (2, 1))
+
+    def test_unknown_words(self):
+        unknown = [instruction for instruction in range(0x10000)
+                   if first_match(instruction) is None]
+        self.assertTrue(unknown)
+        for instruction in unknown[::97]:
+            self.assertRaises(sh2.AssemblyError, sh2.lookup_instruction,
+                              instruction)
+
+
+class OpcodeTest(unittest.TestCase):
+
+    def test_compiled_from_registry(self):
+        self.assertEqual(len(sh2.OPCODES), len(sh2opcodes.OPCODES))
+        for index, (opcode, entry) in enumerate(
+                zip(sh2.OPCODES, sh2opcodes.OPCODES)):
+            self.assertEqual(opcode.index, index)
+            for name in ('opmask', 'm', 'n', 'imm', 'disp', 'cmd', 'args'):
+                self.assertEqual(getattr(opcode, name), entry[name])
+            self.assertEqual(opcode.is_delayed,
+                             entry['cmd'] in sh2.DELAYED_BRANCHERS)
+            self.assertEqual(opcode.is_mov, entry['cmd'].startswith('mov'))
+
+    def test_read_only(self):
+        opcode = sh2.OPCODES[0]
+        self.assertRaises(AttributeError, setattr, opcode, 'cmd', 'nop')
+
+    def test_format(self):
+        opcode, _ = sh2.lookup_instruction(0x0009)
+        self.assertEqual((opcode.cmd, opcode.fmt), ('nop', ''))
+        opcode, _ = sh2.lookup_instruction(0x402B)
+        self.assertEqual((opcode.cmd, opcode.fmt), ('jmp', '@r%(m)d'))
+        self.assertTrue(opcode.is_delayed and opcode.is_register_branch)
+
+    def test_branch_targets(self):
+        # bra with a negative 12-bit displacement.
+        opcode, args = decode_target(0xAFFE, 0x1000)
+        self.assertTrue(opcode.is_label_branch)
+        self.assertEqual(args['target'], 0x1000)
+        # bt forward by 8-bit displacement.
+        _, args = decode_target(0x8902, 0x1000)
+        self.assertEqual(args['target'], 0x1008)
+
+    def test_load_targets(self):
+        # mov.l @(disp,pc) aligns the PC down, mov.w does not.
+        opcode, args = decode_target(0xD101, 0x1002)
+        self.assertEqual((opcode.load_width, args['target']), (4, 0x1008))
+        opcode, args = decode_target(0x9101, 0x1002)
+        self.assertEqual((opcode.load_width, args['target']), (2, 0x1008))
+        # Plain moves carry no target at all.
+        _, args = decode_target(0x6123, 0x1000)
+        self.assertIsNone(args['target'])
+
+
+def random_model(seed, size=0x2000):
+    """A model holding random words, a short odd-sized tail and no-phys RAM."""
+    rng = random.Random(seed)
+    words = [rng.randrange(0x10000) for _ in range(size // 2)]
+    phys = struct.pack('>%dH' % len(words), *words)
+    return segment.MemoryModel('sh7055', [
+        ('rom', 0, size, phys),
+        ('tail', size, size + 5, b'\x00\x09\x00\x0b\xff'),
+        ('ram', 0xFFFF0000, 0xFFFF0100, None),
+    ])
+
+
+# A hand-assembled routine: loads, a call, branches and a bad delay slot.
+PROGRAM = (
+    0xD102,  # 00: mov.l @(0x8,pc),r1 -> 0c
+    0xB00D,  # 02: bsr 20
+    0x0009,  # 04: nop
+    0xA004,  # 06: bra 12
+    0x0009,  # 08: nop
+    0x0009,  # 0a: (never reached)
+    0x0000, 0x0040,  # 0c: .long 0x40
+    0x0009,  # 10: nop
+    0x8901,  # 12: bt 18
+    0x9102,  # 14: mov.w @(0x4,pc),r1 -> 1c
+    0x000B,  # 16: rts
+    0x0009,  # 18: nop
+    0xFFFF,  # 1a: (never reached)
+    0x1234,  # 1c: .word 0x1234
+    0x0009,  # 1e: nop
+    0x402B,  # 20: jmp @r0
+    0xFFFF,  # 22: not an instruction
+)
+
+
+def program_model():
+    """A model holding PROGRAM at location zero."""
+    phys = struct.pack('>%dH' % len(PROGRAM), *PROGRAM)
+    return segment.MemoryModel('sh7055', [('rom', 0, len(phys), phys)])
+
+
+def listing(model):
+    """Every defined item of a model as (location, width, text)."""
+    items = []
+    for seg in model.segments:
+        for location in range(seg.start, seg.end):
+            meta = seg.get_location(location)
+            if meta is not None and meta.location == location:
+                items.append((location, meta.width, meta.get_instruction()))
+    return items
+
+
+@unittest.skipIf(numpy is None, 'numpy is not installed')
+class PredecodeTest(unittest.TestCase):
+
+    def test_columns_match_decode(self):
+        model = random_model(1)
+        self.assertTrue(sh2.predecode(model))
+        columns = sh2._PREDECODED[model]
+        self.assertEqual([(c.start, c.end) for c in columns],
+                         [(0, 0x2000), (0x2000, 0x2004)])
+        for column in columns:
+            for location in range(column.start, column.end, 2):
+                word = struct.unpack('>H', model.get_phys(location, 2))[0]
+                try:
+                    expected = sh2.decode(word, location)
+                except sh2.AssemblyError:
+                    self.assertRaises(sh2.AssemblyError, column.lookup,
+                                      location)
+                    continue
+                instruction, opcode, args = column.lookup(location)
+                self.assertEqual(instruction, word)
+                self.assertIs(opcode, expected[0])
+                self.assertEqual(args, expected[1], '%#x' % location)
+
+    def test_covers(self):
+        model = random_model(2)
+        sh2.predecode(model)
+        rom, tail = sh2._PREDECODED[model]
+        self.assertTrue(rom.covers(0))
+        self.assertTrue(rom.covers(0x1FFE))
+        self.assertFalse(rom.covers(0x1FFF))
+        self.assertFalse(rom.covers(0x2000))
+        self.assertFalse(rom.covers(-2))
+        # The odd trailing byte is left to the lazy decoder.
+        self.assertTrue(tail.covers(0x2002))
+        self.assertFalse(tail.covers(0x2004))
+
+    def test_no_phys(self):
+        model = segment.MemoryModel('sh7055', [('ram', 0, 0x100, None)])
+        self.assertTrue(sh2.predecode(model))
+        self.assertEqual(sh2._PREDECODED[model], [])
+
+    def test_same_disassembly(self):
+        plain = program_model()
+        sh2.disassemble([(0, None)], plain)
+        fast = program_model()
+        sh2.predecode(fast)
+        sh2.disassemble([(0, None)], fast)
+        self.assertEqual(listing(plain), listing(fast))
+        widths = dict((location, width)
+                      for location, width, _ in listing(fast))
+        self.assertEqual(widths[0x0C], 4)
+        self.assertEqual(widths[0x1C], 2)
+        self.assertNotIn(0x0A, widths)
+        self.assertNotIn(0x22, widths)
+
+
+class WorkListTest(unittest.TestCase):
+
+    def test_first_scheduled_first(self):
+        work = sh2.WorkList()
+        for location in (0x30, 0x10, 0x20):
+            work.push(location, None)
+        self.assertEqual([work.pop()[0] for _ in range(3)],
+                         [0x30, 0x10, 0x20])
+        self.assertFalse(work)
+
+    def test_ordered(self):
+        work = sh2.WorkList(ordered=True)
+        for location in (0x30, 0x10, 0x20):
+            work.push(location, None)
+        self.assertEqual(work.pop(), (0x10, [None]))
+        work.push(0x08, 0x30)
+        self.assertEqual([work.pop()[0] for _ in range(3)],
+                         [0x08, 0x20, 0x30])
+
+    def test_duplicates_merge(self):
+        work = sh2.WorkList()
+        work.push(0x10, 0x100)
+        work.push(0x20, 0x104)
+        work.push(0x10, 0x108)
+        work.push(0x10, 0x100)
+        self.assertEqual(len(work), 2)
+        self.assertEqual((work.pushes, work.merged), (4, 2))
+        self.assertEqual(work.pop(), (0x10, [0x100, 0x108, 0x100]))
+
+    def test_push_after_pop(self):
+        # Once popped, a location is no longer pending and queues afresh.
+        work = sh2.WorkList()
+        work.push(0x10, None)
+        work.pop()
+        work.push(0x10, 0x40)
+        self.assertEqual(work.pop(), (0x10, [0x40]))
+        self.assertEqual(work.merged, 0)
+
+    def test_empty(self):
+        for ordered in (False, True):
+            work = sh2.WorkList(ordered)
+            self.assertEqual(len(work), 0)
+            self.assertRaises(IndexError, work.pop)
+
+
+class CodeExtraTest(unittest.TestCase):
+
+    def extra(self, instruction, progc=0x1000):
+        opcode, args = sh2.decode(instruction, progc)
+        return sh2.CodeExtra(instruction, opcode, args)
+
+    def test_text_is_lazy(self):
+        extra = self.extra(0x7105)
+        self.assertIsNone(extra._text)
+        self.assertEqual(extra.text, 'add #0x5, r1')
+        self.assertIs(extra.text, extra._text)
+
+    def test_text(self):
+        self.assertEqual(self.extra(0x0009).text, 'nop')
+        self.assertEqual(self.extra(0x6123).text, 'mov r2, r1')
+        self.assertEqual(self.extra(0x402B).text, 'jmp @r0')
+        self.assertIn('label', self.extra(0xA004).text)
+
+    def test_no_dict(self):
+        extra = self.extra(0x0009)
+        self.assertRaises(AttributeError, setattr, extra, 'comment', '')
+
+    def test_labels_in_listing(self):
+        model = program_model()
+        sh2.disassemble([(0, None)], model)
+        text = dict((location, text) for location, _, text in listing(model))
+        self.assertEqual(text[0x02], 'bsr sub_20')
+        self.assertEqual(text[0x06], 'bra sub_12')
+        self.assertEqual(text[0x0C], '.long 0x00000040')
+        self.assertEqual(text[0x1C], '.word 0x1234')
+
+
+def words_model(words, longs=None):
+    """A 4 KB ROM of 0xFF with the given words and longs filled in."""
+    phys = bytearray(b'\xff' * 0x1000)
+    for location, value in words.items():
+        struct.pack_into('>H', phys, location, value)
+    for location, value in (longs or {}).items():
+        struct.pack_into('>L', phys, location, value)
+    return segment.MemoryModel('sh7055', [('rom', 0, len(phys),
+                                           bytes(phys))])
+
+
+# r1 is loaded, then only used after a bt: jsr @r1 needs dataflow.
+LOAD_THEN_BRANCH = {
+    0x100: 0xD11F,  # mov.l @(0x7C,pc), r1 -> 180
+    0x102: 0x8901,  # bt 108
+    0x104: 0x000B,  # rts
+    0x106: 0x0009,  # nop
+    0x108: 0x410B,  # jsr @r1
+    0x10A: 0x0009,  # nop
+    0x10C: 0x000B,  # rts
+    0x10E: 0x0009,  # nop
+    0x400: 0x000B,  # rts
+    0x402: 0x0009,  # nop
+}
+
+
+class MeetTest(unittest.TestCase):
+
+    def test_meet(self):
+        left = (1, 2, None, 4)
+        self.assertEqual(sh2.meet(left, left), left)
+        self.assertEqual(sh2.meet(left, (1, 3, 3, 4)), (1, None, None, 4))
+        self.assertEqual(sh2.meet(left, (None, ) * 4), (None, ) * 4)
+
+    def test_work_list_states(self):
+        work = sh2.WorkList()
+        work.push(0x10, None, (1, 2) + (None, ) * 14)
+        work.push(0x10, 0x20, (1, 5) + (None, ) * 14)
+        work.push(0x10, 0x24)
+        self.assertEqual(work.states[0x10], (1, ) + (None, ) * 15)
+        # A push without a state leaves other locations stateless.
+        work.push(0x30, None)
+        self.assertNotIn(0x30, work.states)
+
+
+class DataflowTest(unittest.TestCase):
+
+    def test_resolves_across_branch(self):
+        model = words_model(LOAD_THEN_BRANCH, {0x180: 0x400})
+        sh2.disassemble([(0x100, None)], model)
+        self.assertIsNone(model.get_location(0x108).extra.args['target'])
+        self.assertIsNone(model.get_location(0x400))
+
+        model = words_model(LOAD_THEN_BRANCH, {0x180: 0x400})
+        sh2.disassemble([(0x100, None)], model, dataflow=True)
+        self.assertEqual(model.get_location(0x108).extra.args['target'],
+                         0x400)
+        self.assertIsInstance(model.get_location(0x400), sh2.CodeField)
+        self.assertEqual(model.get_references(0x400), [0x108, 0x180])
+
+    def test_walks_known_code_again(self):
+        # 0x120 is walked with r1 known, then reached again once the
+        # longer path from 0x200 gets there with a different r1.
+        model = words_model({
+            0x100: 0xD11F,  # mov.l @(0x7C,pc), r1 -> 180
+            0x102: 0xA00D,  # bra 120
+            0x104: 0x0009,  # nop
+            0x120: 0x410B,  # jsr @r1
+            0x122: 0x0009,  # nop
+            0x124: 0x000B,  # rts
+            0x126: 0x0009,  # nop
+            0x200: 0xA006,  # bra 210
+            0x202: 0x0009,  # nop
+            0x210: 0xD11C,  # mov.l @(0x70,pc), r1 -> 284
+            0x212: 0xAF85,  # bra 120
+            0x214: 0x0009,  # nop
+            0x400: 0x000B,  # rts
+            0x402: 0x0009,  # nop
+        }, {0x180: 0x400, 0x284: 0x300})
+        seen = []
+        sh2.disassemble([(0x100, None), (0x200, None)], model,
+                        lambda code, registers, model: seen.append(code),
+                        dataflow=True)
+        jsr = model.get_location(0x120)
+        # Not redefined, and the callback only saw it the first time.
+        self.assertEqual([code for code in seen if code.location == 0x120],
+                         [jsr])
+        self.assertEqual(jsr.extra.args['target'], 0x400)
+        self.assertEqual(model.get_references(0x120), [0x102, 0x212])
+        self.assertIsInstance(model.get_location(0x400), sh2.CodeField)
+        self.assertIsNone(model.get_location(0x300))
+
+    def test_covered_delay_slot(self):
+        # The slot of the bra at 0x102 is walked from 0x104 first; the
+        # branch target must still see r1 as the slot loads it.
+        model = words_model({
+            0x100: 0xD11F,  # mov.l @(0x7C,pc), r1 -> 180
+            0x102: 0xA00D,  # bra 120
+            0x104: 0xD11F,  # mov.l @(0x7C,pc), r1 -> 184
+            0x106: 0x000B,  # rts
+            0x108: 0x0009,  # nop
+            0x120: 0x412B,  # jmp @r1
+            0x122: 0x0009,  # nop
+            0x300: 0x000B,  # rts
+            0x302: 0x0009,  # nop
+            0x400: 0x000B,  # rts
+            0x402: 0x0009,  # nop
+        }, {0x180: 0x400, 0x184: 0x300})
+        sh2.disassemble([(0x104, None), (0x100, None)], model,
+                        dataflow=True)
+        self.assertEqual(model.get_location(0x120).extra.args['target'],
+                         0x300)
+        self.assertIsInstance(model.get_location(0x300), sh2.CodeField)
+        self.assertIsNone(model.get_location(0x400))
+
+    def test_bad_delay_slot(self):
+        # A branch whose slot doesn't decode is never taken, whether the
+        # slot fails now or was already tried from another path.
+        for entries in ([(0x100, None)], [(0x102, None), (0x100, None)]):
+            model = words_model({
+                0x100: 0xA00E,  # bra 120
+                0x120: 0x000B,  # rts
+                0x122: 0x0009,  # nop
+            })
+            sh2.disassemble(entries, model, dataflow=True)
+            self.assertIsInstance(model.get_location(0x100), sh2.CodeField)
+            self.assertIsNone(model.get_location(0x102))
+            self.assertIsNone(model.get_location(0x120))
+
+    def test_delay_slot_outside_model(self):
+        model = words_model({
+            0xF00: 0x000B,  # rts
+            0xF02: 0x0009,  # nop
+            0xFFE: 0xAF7F,  # bra f00, with its slot past the end
+        })
+        sh2.disassemble([(0xFFE, None)], model, dataflow=True)
+        self.assertIsInstance(model.get_location(0xFFE), sh2.CodeField)
+        self.assertIsNone(model.get_location(0xF00))
+
+    def test_disagreeing_paths(self):
+        # Two paths reach the jsr with different r1; neither is trusted.
+        model = words_model({
+            0x100: 0xD11F,  # mov.l @(0x7C,pc), r1 -> 180
+            0x102: 0xA00D,  # bra 120
+            0x104: 0x0009,  # nop
+            0x110: 0xD11C,  # mov.l @(0x70,pc), r1 -> 184
+            0x112: 0xA005,  # bra 120
+            0x114: 0x0009,  # nop
+            0x120: 0x410B,  # jsr @r1
+            0x122: 0x0009,  # nop
+            0x124: 0x000B,  # rts
+            0x126: 0x0009,  # nop
+        }, {0x180: 0x400, 0x184: 0x300})
+        sh2.disassemble([(0x100, None), (0x110, None)], model,
+                        dataflow=True)
+        self.assertIsNone(model.get_location(0x120).extra.args['target'])
+        self.assertIsNone(model.get_location(0x300))
+        self.assertIsNone(model.get_location(0x400))
+        self.assertEqual(model.get_references(0x120), [0x102, 0x112])
+
+    def test_delay_slot_state(self):
+        # The slot reloads r1 before bra is taken.
+        model = words_model({
+            0x100: 0xD11F,  # mov.l @(0x7C,pc), r1 -> 180
+            0x102: 0xA00D,  # bra 120
+            0x104: 0xD11F,  # mov.l @(0x7C,pc), r1 -> 184
+            0x120: 0x412B,  # jmp @r1
+            0x122: 0x0009,  # nop
+            0x300: 0x000B,  # rts
+            0x302: 0x0009,  # nop
+        }, {0x180: 0x400, 0x184: 0x300})
+        sh2.disassemble([(0x100, None)], model, dataflow=True)
+        self.assertEqual(model.get_location(0x120).extra.args['target'],
+                         0x300)
+        self.assertIsNone(model.get_location(0x400))
+
+    def test_same_code_as_plain(self):
+        plain = program_model()
+        sh2.disassemble([(0, None)], plain)
+        dataflow = program_model()
+        sh2.disassemble([(0, None)], dataflow, dataflow=True)
+        self.assertEqual(listing(plain), listing(dataflow))
+
+
+class DisassembleTest(unittest.TestCase):
+
+    def test_visiting_order(self):
+        fifo = program_model()
+        sh2.disassemble([(0x20, None), (0, None)], fifo)
+        ordered = program_model()
+        sh2.disassemble([(0x20, None), (0, None)], ordered, ordered=True)
+        self.assertEqual(listing(fifo), listing(ordered))
+
+    def test_references(self):
+        model = program_model()
+        sh2.disassemble([(0, None), (0x12, 0x100), (0x12, 0x104)], model)
+        self.assertEqual(model.get_references(0x20), [0x02])
+        self.assertEqual(model.get_references(0x12), [0x06, 0x100, 0x104])
+        self.assertEqual(model.get_references(0x18), [0x12])
+        self.assertEqual(model.get_references(0x0C), [0x00])
+        self.assertEqual(model.get_references(0x00), [])
+
+    def test_outside_model(self):
+        model = program_model()
+        sh2.disassemble([(0x1000, None)], model)
+        self.assertEqual(listing(model), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,217 @@
+"""Tests for stage timings and analysis counters."""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from sh2dis import mitsubishi
+from sh2dis import pipeline
+from sh2dis import segment
+from sh2dis import sh2
+from sh2dis import stats
+from sh2dis import synthetic
+
+from test_batch import tiny_rom
+from test_segment import Item
+
+
+class CollectTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.phys = synthetic.build_rom(0x40000, 10)
+
+    def test_stages_and_counters(self):
+        with stats.collect(profile=True) as run:
+            model = pipeline.build_model(self.phys, mitsu=True)
+        report = run.report()
+        self.assertEqual(sorted(report['stages']), [
+            'compact_references', 'disassemble_vectors', 'fixups',
+            'post_analysis', 'setup_vectors'])
+        counters = report['counters']
+        code = sum(1 for seg in model.segments
+                   for meta in seg.iter_locations(seg.start, seg.end)
+                   if isinstance(meta, sh2.CodeField))
+        self.assertEqual(counters['instructions'], code)
+        self.assertTrue(counters['instructions_decoded'] >= code)
+        self.assertTrue(counters['worklist_pushes'] > 0)
+        self.assertTrue(counters['items_set'] > code)
+        self.assertTrue(counters['mitsubishi_axes'] > 0)
+        self.assertEqual(report['functions']['decode']['calls'],
+                         counters['instructions_decoded'])
+
+    @unittest.skipIf(numpy is None, 'predecoding requires numpy')
+    def test_predecoded_count(self):
+        counts = []
+        for predecode in (False, True):
+            with stats.collect(profile=True) as run:
+                pipeline.build_model(self.phys, predecode=predecode)
+            counts.append(run.report()['counters']['instructions_decoded'])
+        self.assertEqual(counts[0], counts[1])
+
+    def test_without_profile(self):
+        with stats.collect() as run:
+            pipeline.build_model(self.phys)
+        report = run.report()
+        self.assertNotIn('functions', report)
+        self.assertNotIn('instructions_decoded', report['counters'])
+        self.assertNotIn('fixups', report['stages'])
+
+    def test_restored(self):
+        def current():
+            return (sh2.decode, sh2.track_registers, sh2.WorkList,
+                    sh2.Predecoded.lookup, segment.Segment.set_location,
+                    mitsubishi.callback)
+
+        originals = current()
+        with stats.collect(profile=True):
+            model = pipeline.build_model(self.phys, mitsu=True)
+            self.assertIsNot(sh2.decode, originals[0])
+        self.assertEqual(current(), originals)
+        self.assertEqual(model.observers, [])
+        self.assertIsNone(stats.ACTIVE)
+
+    def test_restored_after_error(self):
+        decode = sh2.decode
+        with self.assertRaises(ValueError):
+            with stats.collect(profile=True):
+                raise ValueError('analysis failed')
+        self.assertIs(sh2.decode, decode)
+        self.assertIsNone(stats.ACTIVE)
+
+    def test_nested(self):
+        with stats.collect():
+            with self.assertRaises(RuntimeError):
+                with stats.collect():
+                    pass
+
+    def test_inactive(self):
+        self.assertIs(stats.stage('anything'), stats.stage('else'))
+        with stats.stage('anything'):
+            pass
+        model = segment.MemoryModel('sh7055', [
+            ('rom', 0x1000, 0x1100, b'\x00' * 0x100)])
+        stats.watch(model)
+        self.assertEqual(model.observers, [])
+
+
+class CounterTest(unittest.TestCase):
+
+    def setUp(self):
+        self.model = segment.MemoryModel('sh7055', [
+            ('rom', 0x1000, 0x1100, b'\x00' * 0x100)])
+
+    def item(self, location, width):
+        self.model.set_location(Item(location=location, width=width,
+                                     model=self.model))
+
+    def test_empty_model(self):
+        with stats.collect() as run:
+            stats.watch(self.model)
+        counters = run.report()['counters']
+        self.assertEqual(set(counters.values()), set([0]))
+
+    def test_replaced_and_conflicts(self):
+        with stats.collect() as run:
+            stats.watch(self.model)
+            stats.watch(self.model)
+            self.item(0x1010, 2)
+            self.item(0x1012, 2)
+            self.item(0x1010, 4)
+            self.assertRaises(segment.SegmentError, self.item, 0x1012, 4)
+            self.assertRaises(segment.SegmentError, self.item, 0x100E, 4)
+        counters = run.report()['counters']
+        self.assertEqual(counters['items_replaced'], 2)
+        self.assertEqual(counters['set_location_conflicts'], 2)
+        self.assertEqual(counters['items_set'], 3)
+
+    def test_references(self):
+        with stats.collect() as run:
+            stats.watch(self.model)
+            self.model.set_label(0x1020, 'named')
+            self.model.add_reference(0x1020, 0x1000)
+            self.model.add_reference(0x1030, 0x1000)
+            self.model.add_reference(0x1030, 0x1002)
+        counters = run.report()['counters']
+        self.assertEqual(counters['xrefs_added'], 3)
+        self.assertEqual(counters['xref_targets'], 2)
+        self.assertEqual(counters['labels'], 1)
+        # Nothing has been rendered, so no label was made up yet.
+        self.assertEqual(counters['labels_synthesized'], 0)
+
+    def test_labels_synthesized(self):
+        self.item(0x1030, 4)
+        self.model.set_label(0x1020, 'named')
+        for location in (0x1020, 0x1030, 0x1040):
+            self.model.add_reference(location, 0x1000)
+        with stats.collect() as run:
+            stats.watch(self.model)
+            for location in (0x1020, 0x1030, 0x1032, 0x1030, 0x1050):
+                self.model.get_label(location)
+        # unk_1030 made up three times; named and 0x1050 need nothing.
+        self.assertEqual(run.report()['counters']['labels_synthesized'], 1)
+        self.model.get_label(0x1040)
+        self.assertEqual(run.report()['counters']['labels_synthesized'], 2)
+
+    def test_stage_accumulates(self):
+        with stats.collect() as run:
+            with stats.stage('work'):
+                pass
+            first = run.stages['work']
+            with stats.stage('work'):
+                pass
+        self.assertTrue(run.stages['work'] >= first)
+        self.assertEqual(list(run.report()['stages']), ['work'])
+
+
+class MainTest(unittest.TestCase):
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    def run_main(self, *args):
+        process = subprocess.Popen(
+            [sys.executable, '-m', 'sh2dis'] + list(args), cwd=self.root,
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        _, err = process.communicate()
+        return process.returncode, err
+
+    def test_batch_rejected(self):
+        for flag in ('--stats', '--profile'):
+            returncode, err = self.run_main(flag, '--batch', self.root)
+            self.assertEqual(returncode, 2)
+            self.assertIn(b'--stats and --profile report on a single ROM',
+                          err)
+
+    def test_profile(self):
+        directory = tempfile.mkdtemp()
+        try:
+            rom = os.path.join(directory, 'rom.bin')
+            with open(rom, 'wb') as romfile:
+                romfile.write(tiny_rom())
+            reports = []
+            for flag in ('--stats', '--profile'):
+                returncode, err = self.run_main(
+                    flag, '-o', os.path.join(directory, 'out.txt'), rom)
+                self.assertEqual(returncode, 0)
+                reports.append(json.loads(err.decode('utf-8')))
+        finally:
+            shutil.rmtree(directory)
+        self.assertNotIn('functions', reports[0])
+        self.assertIn('decode', reports[1]['functions'])
+        for report in reports:
+            self.assertIn('final_output', report['stages'])
+            # The rte every other vector points at has no name of its own.
+            self.assertTrue(report['counters']['labels_synthesized'] > 0)
+
+
+if __name__ == '__main__':
+    unittest.main()